@@ -0,0 +1,64 @@
+import json
+
+import pandas as pd
+import streamlit as st
+import instrumentation
+from shared_store import get_store
+
+# ----------------------------------------------------------------------------
+# Data Processing Code
+# ----------------------------------------------------------------------------
+
+# Halaman ini hanya ada di navigasi saat INSTRUMENTATION aktif (lihat sentimen_cagub_app.py).
+# Statistik dikumpulkan per proses, dari seluruh sesi; store diambil lebih dulu agar
+# cache-nya sudah terdaftar.
+get_store()
+snap = instrumentation.snapshot()
+
+df_stages = pd.DataFrame(snap['stages'], columns=['stage', 'calls', 'total_ms', 'mean_ms', 'max_ms', 'peak_kb'])
+df_caches = pd.DataFrame(snap['caches'], columns=['cache', 'hits', 'misses', 'hit_ratio', 'size'])
+
+# ----------------------------------------------------------------------------
+# Streamlit UI Code
+# ----------------------------------------------------------------------------
+
+st.markdown("<h1 style='text-align:center;'>Instrumentasi</h1>", unsafe_allow_html=True)
+st.caption(f"Mode `INSTRUMENTATION={snap['mode']}` · statistik {snap['uptime_seconds'] / 60:,.1f} menit terakhir "
+           "(sejak proses dimulai atau direset)")
+
+# --- Waktu per tahap ---
+st.subheader("⏱️ Tahap")
+if not instrumentation.TRACE_MEMORY:
+    df_stages = df_stages.drop(columns='peak_kb')
+    st.caption("Puncak alokasi per tahap tersedia dengan `INSTRUMENTATION=memory`.")
+st.dataframe(df_stages, hide_index=True, use_container_width=True, column_config={
+    'stage': "Tahap",
+    'calls': st.column_config.NumberColumn("Panggilan", format="%d"),
+    'total_ms': st.column_config.NumberColumn("Total (ms)", format="%.1f"),
+    'mean_ms': st.column_config.NumberColumn("Rata-rata (ms)", format="%.3f"),
+    'max_ms': st.column_config.NumberColumn("Maks (ms)", format="%.1f"),
+    'peak_kb': st.column_config.NumberColumn("Puncak Alokasi (KB)", format="%.1f"),
+})
+
+# --- Cache ---
+st.subheader("🗄️ Cache")
+st.dataframe(df_caches, hide_index=True, use_container_width=True, column_config={
+    'cache': "Cache",
+    'hits': st.column_config.NumberColumn("Hit", format="%d"),
+    'misses': st.column_config.NumberColumn("Miss", format="%d"),
+    'hit_ratio': st.column_config.ProgressColumn("Hit Ratio", format="%.2f", min_value=0.0, max_value=1.0),
+    'size': st.column_config.NumberColumn("Entri", format="%d"),
+})
+
+# --- Ekspor & reset ---
+col_a, col_b, col_c = st.columns(3)
+col_a.download_button("Unduh JSON", json.dumps(snap, indent=2), file_name="metrics.json", mime="application/json")
+col_b.download_button("Unduh Prometheus", instrumentation.to_prometheus(snap), file_name="metrics.prom",
+                      mime="text/plain")
+if col_c.button("Reset statistik tahap"):
+    instrumentation.reset()
+    st.rerun()
+
+if instrumentation.METRICS_DIR:
+    st.caption(f"Snapshot juga ditulis setiap {instrumentation.DUMP_SECONDS:g} detik ke "
+               f"`{instrumentation.METRICS_DIR}/metrics.json` dan `metrics.prom`.")
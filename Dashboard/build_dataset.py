@@ -0,0 +1,157 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+
+import pandas as pd
+
+from loaders import DATA_PATH, LABEL_MAPPING, columnar_path, read_kamus, write_columnar
+from preprocess_pool import PreprocessPool, preprocess_stages_batch
+from stem_cache import STEM_CACHE_PATH
+from text_preprocessing import MORE_STOP_WORDS
+
+# ----------------------------------------------------------------------------
+# Pipeline ReLabeling -> data_cagub_analisis.csv
+# ----------------------------------------------------------------------------
+
+RELABELING_PATHS = ['Data/ReLabeling - Gabungan.csv']
+PREPROCESS_CACHE_PATH = 'Data/.cache/preprocess_cache.jsonl'
+
+OUTPUT_COLUMNS = ['full_text', 'username', 'tokoh', 'Label', 'Sentimen',
+                  'clean_text', 'joined_swremove', 'hashtag', 'content_hash']
+
+
+def content_hash(text):
+    """Hash isi tweet; baris dengan hash yang sudah diproses tidak diproses ulang."""
+    return hashlib.sha1(str(text).encode('utf-8')).hexdigest()[:16]
+
+
+def pipeline_version():
+    """
+    Hash konfigurasi preprocessing (kamus dan stopword tambahan). Jika berubah,
+    seluruh cache preprocessing dianggap usang.
+    """
+    config = repr((list(read_kamus().items()), MORE_STOP_WORDS))
+    return hashlib.sha1(config.encode('utf-8')).hexdigest()[:16]
+
+
+class PreprocessCache:
+    """
+    Cache hasil preprocessing per hash konten dalam file JSONL append-only,
+    sehingga menambah tweet baru hanya memproses baris yang baru.
+    """
+
+    def __init__(self, path=PREPROCESS_CACHE_PATH, version=None):
+        self.path = path
+        self.version = version
+        self.entries = {}
+
+        if path and os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                header = json.loads(f.readline() or '{}')
+                if header.get('version') == version:
+                    for line in f:
+                        entry = json.loads(line)
+                        self.entries[entry['hash']] = (entry['clean_text'], entry['joined_swremove'])
+
+        if path and not self.entries:
+            # Versi berbeda atau file belum ada: mulai dari file baru
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({'version': version}) + '\n')
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def add(self, items):
+        """Menambahkan hasil baru (list of (hash, clean_text, joined_swremove))."""
+        if self.path:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                for key, clean, joined in items:
+                    f.write(json.dumps({'hash': key, 'clean_text': clean, 'joined_swremove': joined},
+                                       ensure_ascii=False) + '\n')
+        for key, clean, joined in items:
+            self.entries[key] = (clean, joined)
+
+
+def read_relabeling(paths=RELABELING_PATHS):
+    """Membaca dan menggabungkan file ``ReLabeling - *.csv``."""
+    return pd.concat([pd.read_csv(path) for path in paths], ignore_index=True)
+
+
+def build_dataset(df, cache, workers=None, stem_cache_path=STEM_CACHE_PATH, chunksize=2000, log=sys.stderr):
+    """
+    Mengubah data ReLabeling menjadi dataset analisis.
+
+    Args:
+        df (pd.DataFrame): Kolom 'full_text', 'username', 'Label', 'tokoh'.
+        cache (PreprocessCache): Cache hasil preprocessing.
+        workers (int | None): Jumlah worker process (default seluruh core).
+        chunksize (int): Jumlah tweet baru per potongan sebelum disimpan ke cache.
+
+    Returns:
+        tuple: (DataFrame hasil dengan ``OUTPUT_COLUMNS``, jumlah tweet yang baru diproses).
+        Baris yang kosong setelah preprocessing dibuang.
+    """
+    df = df.copy()
+    df['content_hash'] = df['full_text'].map(content_hash)
+
+    # Hanya tweet unik yang belum pernah diproses
+    new_rows = df.drop_duplicates('content_hash')
+    new_rows = new_rows[~new_rows['content_hash'].isin(cache.entries.keys())]
+
+    if len(new_rows):
+        with PreprocessPool(workers=workers, stem_cache_path=stem_cache_path) as pool:
+            for start in range(0, len(new_rows), chunksize):
+                chunk = new_rows.iloc[start:start + chunksize]
+                results = pool.map_batches(preprocess_stages_batch, chunk['full_text'])
+                cache.add([(key, clean, joined or '')
+                           for key, (clean, joined) in zip(chunk['content_hash'], results)])
+                print(f"  {min(start + chunksize, len(new_rows)):,}/{len(new_rows):,} tweet baru diproses", file=log)
+
+    processed = df['content_hash'].map(cache.entries)
+    df['clean_text'] = processed.str[0]
+    df['joined_swremove'] = processed.str[1]
+    hashtags = df['full_text'].astype(str).str.findall(r'#(\w+)').str.join(' ')
+    # Tanpa hashtag = NaN, sama seperti hasil membaca ulang CSV
+    df['hashtag'] = hashtags.where(hashtags != '')
+    df['Sentimen'] = df['Label'].map(LABEL_MAPPING)
+
+    # Tweet yang kosong setelah preprocessing (langkah 9 preprocess_tweet) tidak dianalisis
+    df = df[df['joined_swremove'] != '']
+
+    return df[OUTPUT_COLUMNS].reset_index(drop=True), len(new_rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Membangun Data/data_cagub_analisis.csv dari file ReLabeling.")
+    parser.add_argument('inputs', nargs='*', default=RELABELING_PATHS)
+    parser.add_argument('--output', default=DATA_PATH)
+    parser.add_argument('--cache', default=PREPROCESS_CACHE_PATH)
+    parser.add_argument('--workers', type=int, default=None, help="Default: jumlah core CPU")
+    parser.add_argument('--stem-cache', default=STEM_CACHE_PATH)
+    parser.add_argument('--no-columnar', action='store_true',
+                        help="Jangan tulis salinan Arrow (.arrow) di samping CSV")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    df = read_relabeling(args.inputs)
+    cache = PreprocessCache(args.cache or None, version=pipeline_version())
+    dataset, n_new = build_dataset(df, cache, workers=args.workers, stem_cache_path=args.stem_cache)
+
+    tmp_path = f"{args.output}.{os.getpid()}.tmp"
+    dataset.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, args.output)
+
+    # Salinan kolumnar ditulis setelah CSV agar tidak pernah lebih tua darinya
+    if not args.no_columnar:
+        write_columnar(dataset, columnar_path(args.output))
+
+    print(f"Selesai dalam {time.perf_counter() - start:.1f} detik: {len(dataset):,} baris "
+          f"({n_new:,} tweet unik baru diproses, sisanya dari cache) -> {args.output}")
+
+
+if __name__ == '__main__':
+    main()
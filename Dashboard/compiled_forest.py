@@ -0,0 +1,193 @@
+import os
+
+import numpy as np
+
+# ----------------------------------------------------------------------------
+# Evaluator RandomForest Berbasis Array NumPy
+# ----------------------------------------------------------------------------
+
+# Batas ukuran batch yang dievaluasi evaluator array. Hasil bench_compiled_forest.py (100 pohon,
+# 1 CPU): compiled vs scikit-learn 1,2 vs 7,0 ms (1 baris), 5,3 vs 13,1 ms (16), 8,8 vs 14,2 ms (32),
+# seimbang di 64 baris, dan 4-5x lebih lambat di 10.000 baris. predict_proba scikit-learn
+# paralel per pohon (n_jobs=-1), sehingga di mesin multi-core titik impasnya lebih kecil
+# (sudah lebih lambat di 64 baris); 16 memberi margin aman.
+BATCH_THRESHOLD = int(os.environ.get("COMPILED_FOREST_BATCH_THRESHOLD", 16))
+
+
+def _float32_floor(threshold):
+    # Float32 terbesar yang <= threshold. Untuk x float32 berlaku
+    # x <= threshold  <=>  x <= _float32_floor(threshold), jadi perbandingan bisa
+    # sepenuhnya float32 tanpa mengubah cabang yang dipilih.
+    rounded = threshold.astype(np.float32)
+    too_big = rounded.astype(np.float64) > threshold
+    rounded[too_big] = np.nextafter(rounded[too_big], np.float32(-np.inf))
+    return rounded
+
+
+class CompiledForest:
+    """
+    RandomForestClassifier yang seluruh pohonnya diratakan menjadi array node
+    NumPy bersebelahan dan dievaluasi secara vektor untuk semua pasangan
+    (baris, pohon) sekaligus, tanpa validasi input dan dispatch per pohon
+    milik scikit-learn.
+
+    Node disusun ulang per pohon (BFS) sehingga anak kanan selalu tepat
+    setelah anak kiri; satu langkah traversal cukup ``left + (x > threshold)``.
+    Daun menunjuk dirinya sendiri dengan threshold +inf, jadi pasangan yang
+    sudah sampai di daun aman ikut dievaluasi sampai dikeluarkan.
+
+    Daun yang dicapai sama persis dengan scikit-learn (lihat
+    ``_float32_floor``); probabilitas hanya dapat berbeda pada level
+    pembulatan penjumlahan.
+
+    Untuk batch lebih besar dari ``batch_threshold`` baris, perhitungan
+    diserahkan ke ``predict_proba`` model asal yang lebih efisien di sana
+    (``batch_threshold=0`` menonaktifkan penyerahan ini).
+
+    Args:
+        feature (np.ndarray): Fitur split per node (int64; daun bernilai 0).
+        threshold (np.ndarray): Threshold split per node (float32; daun +inf).
+        left (np.ndarray): Indeks global anak kiri (anak kanan = left + 1; daun menunjuk dirinya).
+        is_leaf (np.ndarray): Penanda daun (bool).
+        leaf_proba (np.ndarray): Probabilitas kelas per node (n_node, n_kelas).
+        roots (np.ndarray): Indeks node akar setiap pohon.
+        classes (np.ndarray): ``classes_`` model asal.
+        n_features (int): Jumlah fitur input.
+        fallback (object | None): Model asal untuk batch besar.
+        batch_threshold (int): Batas ukuran batch yang dievaluasi sendiri (0 = tanpa batas).
+    """
+
+    def __init__(self, feature, threshold, left, is_leaf, leaf_proba, roots, classes, n_features,
+                 fallback=None, batch_threshold=BATCH_THRESHOLD):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.is_leaf = is_leaf
+        self.leaf_proba = leaf_proba
+        self.roots = roots
+        self.classes_ = classes
+        self.n_features_in_ = n_features
+        self.fallback = fallback
+        self.batch_threshold = batch_threshold
+
+    @classmethod
+    def from_sklearn(cls, model, batch_threshold=BATCH_THRESHOLD):
+        """
+        Meratakan ``RandomForestClassifier`` (satu output) yang sudah di-fit.
+
+        Args:
+            model (RandomForestClassifier): Model asal (tetap dipakai untuk batch besar).
+            batch_threshold (int): Batch > nilai ini diserahkan ke model asal (0 = selalu sendiri).
+
+        Raises:
+            ValueError: Jika model multi-output.
+        """
+        if getattr(model, 'n_outputs_', 1) != 1:
+            raise ValueError("CompiledForest hanya mendukung model satu output")
+
+        features, thresholds, lefts, leaves, probas, roots = [], [], [], [], [], []
+        offset = 0
+        for estimator in model.estimators_:
+            tree = estimator.tree_
+            children_left, children_right = tree.children_left, tree.children_right
+
+            # 1. Penomoran ulang BFS per level: kedua anak sebuah node mendapat nomor berurutan
+            levels, frontier = [], np.array([0])
+            while frontier.size:
+                levels.append(frontier)
+                internal = frontier[children_left[frontier] >= 0]
+                frontier = np.column_stack((children_left[internal], children_right[internal])).ravel()
+            old = np.concatenate(levels)  # old[id_baru] = id_lama
+            new_id = np.empty(tree.node_count, dtype=np.int64)
+            new_id[old] = np.arange(tree.node_count)
+            is_leaf = children_left[old] < 0
+
+            # 2. Array node dalam urutan baru; daun menunjuk dirinya sendiri
+            features.append(np.where(is_leaf, 0, tree.feature[old]))
+            thresholds.append(np.where(is_leaf, np.float32(np.inf), _float32_floor(tree.threshold[old])))
+            lefts.append(np.where(is_leaf, np.arange(len(old)), new_id[np.maximum(children_left[old], 0)]) + offset)
+            leaves.append(is_leaf)
+
+            # 3. Sama dengan DecisionTreeClassifier.predict_proba: value dinormalisasi per node
+            value = tree.value[old, 0, :].astype(np.float64)
+            normalizer = value.sum(axis=1, keepdims=True)
+            normalizer[normalizer == 0.0] = 1.0
+            probas.append(value / normalizer)
+
+            roots.append(offset)
+            offset += tree.node_count
+
+        return cls(np.concatenate(features).astype(np.int64), np.concatenate(thresholds).astype(np.float32),
+                   np.concatenate(lefts).astype(np.int64), np.concatenate(leaves), np.concatenate(probas),
+                   np.asarray(roots, dtype=np.int64), np.asarray(model.classes_), model.n_features_in_,
+                   fallback=model, batch_threshold=batch_threshold)
+
+    @property
+    def n_estimators(self):
+        return len(self.roots)
+
+    def apply(self, X, chunk_rows=256):
+        """
+        Indeks daun (global) yang dicapai setiap baris di setiap pohon.
+
+        Args:
+            X (scipy.sparse matrix | np.ndarray): Fitur (n_baris, n_fitur).
+            chunk_rows (int): Jumlah baris yang didensifikasi sekaligus.
+
+        Returns:
+            np.ndarray: Matriks (n_baris, n_pohon) berisi indeks node daun.
+        """
+        n_rows = X.shape[0]
+        leaves = np.empty((n_rows, self.n_estimators), dtype=np.int64)
+        for start in range(0, n_rows, chunk_rows):
+            chunk = X[start:start + chunk_rows]
+            dense = chunk.toarray() if hasattr(chunk, 'toarray') else np.asarray(chunk)
+            leaves[start:start + chunk_rows] = self._apply_dense(
+                np.ascontiguousarray(dense, dtype=np.float32))
+        return leaves
+
+    def _apply_dense(self, dense, check_every=4):
+        n_rows, n_features = dense.shape
+        n_pairs = n_rows * self.n_estimators
+        flat = dense.ravel()
+
+        # Satu elemen per pasangan (baris, pohon): node saat ini, posisi keluaran, offset baris
+        leaves = np.tile(self.roots, n_rows)
+        node = leaves.copy()
+        position = np.arange(n_pairs)
+        row_offset = np.repeat(np.arange(n_rows, dtype=np.int64) * n_features, self.n_estimators)
+
+        # Traversal level demi level. Pasangan yang sudah di daun tetap diam di daun,
+        # jadi pengecekan (dan pemadatan array) cukup dilakukan sesekali
+        step = 0
+        while node.size:
+            node = self.left[node] + (flat[row_offset + self.feature[node]] > self.threshold[node])
+            step += 1
+            if step % check_every == 0:
+                done = self.is_leaf[node]
+                if done.any():
+                    leaves[position[done]] = node[done]
+                    keep = ~done
+                    node, position, row_offset = node[keep], position[keep], row_offset[keep]
+        return leaves.reshape(n_rows, self.n_estimators)
+
+    def predict_proba(self, X):
+        """
+        Probabilitas kelas, setara ``RandomForestClassifier.predict_proba``.
+
+        Returns:
+            np.ndarray: Matriks (n_baris, n_kelas) sesuai urutan ``classes_``.
+        """
+        if self.fallback is not None and 0 < self.batch_threshold < X.shape[0]:
+            return self.fallback.predict_proba(X)
+
+        leaves = self.apply(X)
+        proba = np.zeros((leaves.shape[0], self.leaf_proba.shape[1]))
+        # Dijumlahkan per pohon berurutan, seperti akumulasi di scikit-learn
+        for tree in range(self.n_estimators):
+            proba += self.leaf_proba[leaves[:, tree]]
+        return proba / self.n_estimators
+
+    def predict(self, X):
+        """Kelas dengan probabilitas tertinggi untuk setiap baris."""
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]
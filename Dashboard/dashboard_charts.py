@@ -0,0 +1,304 @@
+import re
+from collections import Counter
+
+import pandas as pd
+import plotly.express as px
+
+from instrumentation import instrumented
+from ngram_index import count_ngrams
+from wordcloud_cache import render_wordcloud_png
+
+# ----------------------------------------------------------------------------
+# Fungsi Visualisasi Dashboard (tanpa Streamlit; dipakai page_dashboard.py dan benchmark)
+# ----------------------------------------------------------------------------
+
+# Warna untuk masing-masing kelas sentimen
+custom_colors = {'Negatif': '#EB5353', 'Netral': '#F5971D', 'Positif': '#36AE7C'}
+
+def hitung_jumlah(df, sentimen_counts=None):
+    """
+    Menghitung total data dan jumlah masing-masing kategori sentimen dari DataFrame.
+
+    Args:
+        df (pd.DataFrame): DataFrame yang mengandung kolom 'Sentimen'.
+        sentimen_counts (pd.Series | None): Hasil ``value_counts`` yang sudah dihitung
+            (mis. ``LiveAggregates.sentimen_counts()``).
+
+    Returns:
+        tuple: Berisi total data, jumlah sentimen positif, netral, dan negatif
+        Format: (total, positif_count, netral_count, negatif_count)
+    """
+    
+    # Menghitung total jumlah data/baris dalam DataFrame
+    total = df.shape[0]
+    
+    # Menghitung frekuensi masing-masing nilai sentimen
+    if sentimen_counts is None:
+        sentimen_counts = df['Sentimen'].value_counts()
+    
+    # Mengambil jumlah sentimen positif, default 0 jika tidak ada
+    positif_count = sentimen_counts.get('Positif', 0)
+    
+    # Mengambil jumlah sentimen netral, default 0 jika tidak ada
+    netral_count = sentimen_counts.get('Netral', 0)
+    
+    # Mengambil jumlah sentimen negatif, default 0 jika tidak ada
+    negatif_count = sentimen_counts.get('Negatif', 0)
+
+    # Mengembalikan hasil perhitungan dalam bentuk tuple
+    return total, positif_count, netral_count, negatif_count
+
+
+@instrumented('chart.visualize_sentiment_distribution_by_tokoh')
+def visualize_sentiment_distribution_by_tokoh(df, count_df=None):
+    """
+    Membuat visualisasi distribusi sentimen per tokoh dalam bentuk vertical stacked bar chart,
+    diurutkan dari jumlah total sentimen terbanyak ke paling sedikit.
+
+    Args:
+        df (pd.DataFrame): DataFrame yang mengandung kolom 'tokoh' dan 'Sentimen'.
+        count_df (pd.DataFrame | None): Jumlah per (tokoh, Sentimen) yang sudah dihitung
+            (mis. ``LiveAggregates.distribution()``).
+
+    Returns:
+        count_df (pd.DataFrame): Tabel jumlah masing-masing sentimen per tokoh.
+        fig (plotly.graph_objects.Figure): Objek visualisasi plotly.
+    """
+    # Warna kustom untuk masing-masing sentimen
+    custom_colors = {'Negatif': '#EB5353', 'Netral': '#F5971D', 'Positif': '#36AE7C'}
+
+    # Hitung jumlah sentimen per tokoh
+    if count_df is None:
+        count_df = df.groupby(['tokoh', 'Sentimen']).size().reset_index(name='count')
+
+    # Pivot data agar bisa divisualisasikan dalam bentuk stacked bar
+    pivot_df = count_df.pivot(index='tokoh', columns='Sentimen', values='count').fillna(0).astype(int)
+
+    # Tambahkan kolom total untuk pengurutan
+    pivot_df['total'] = pivot_df.sum(axis=1)
+
+    # Urutkan berdasarkan total
+    pivot_df = pivot_df.sort_values(by='total', ascending=False).drop(columns='total')
+
+    # Reset index setelah sort
+    pivot_df = pivot_df.reset_index()
+
+    # Ubah ke long format untuk visualisasi
+    long_df = pivot_df.melt(id_vars='tokoh', var_name='Sentimen', value_name='count')
+
+    # Visualisasi dengan plotly express (vertikal bar chart)
+    fig = px.bar(
+        long_df,
+        x='tokoh',
+        y='count',
+        color='Sentimen',
+        color_discrete_map=custom_colors,
+        labels={'count': 'Jumlah', 'tokoh': 'Tokoh'}
+    )
+
+    # Update layout: hide legend, axis labels, tick labels kecuali xtick tokoh
+    fig.update_layout(
+        barmode='stack',
+        showlegend=False,
+        xaxis=dict(
+            showticklabels=True,
+            title='',
+            tickfont=dict(size=16)
+        ),
+        yaxis=dict(
+            visible=False,
+            showticklabels=False
+        ),
+        margin=dict(l=0, r=0, t=0, b=0),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+
+    return count_df, fig
+
+@instrumented('chart.visualize_wordcloud_by_sentiment_and_tokoh')
+def visualize_wordcloud_by_sentiment_and_tokoh(df, tokoh, sentimen, width=800, height=400,
+                                               ngram_index=None, wordcloud_cache=None, fingerprint=None):
+    """
+    Membuat visualisasi WordCloud berdasarkan tokoh dan sentimen tertentu,
+    dengan warna sesuai palet kustom untuk tiap kelas sentimen.
+
+    Frekuensi kata diambil dari tabel unigram ``ngram_index`` jika tersedia,
+    dan gambar PNG disimpan di ``wordcloud_cache`` per (tokoh, sentimen, ukuran, fingerprint).
+
+    Args:
+        df (pd.DataFrame): DataFrame yang mengandung kolom 'tokoh', 'Sentimen', dan 'joined_swremove'.
+        tokoh (str): Nama tokoh yang ingin divisualisasikan.
+        sentimen (str): Kelas sentimen ('Positif', 'Negatif', atau 'Netral').
+        width (int): Lebar gambar (piksel).
+        height (int): Tinggi gambar (piksel).
+        ngram_index (NgramIndex | None): Indeks frekuensi n-gram.
+        wordcloud_cache (WordCloudCache | None): Cache gambar.
+        fingerprint (str | None): Sidik jari data untuk kunci cache.
+
+    Returns:
+        bytes: Gambar WordCloud dalam format PNG.
+    """
+    # Palet warna khusus
+    custom_colors = {'Negatif': '#EB5353', 'Netral': '#F5971D', 'Positif': '#36AE7C'}
+    color = custom_colors.get(sentimen, '#000000')  # fallback hitam jika tak ditemukan
+
+    # Fungsi pewarna tunggal
+    def single_color_func(*args, **kwargs):
+        return color
+
+    def render():
+        # Frekuensi kata (WordCloud hanya memakai 200 kata teratas)
+        if ngram_index is not None:
+            frequencies = ngram_index.table(tokoh, sentimen, 1).head(200).to_dict()
+        else:
+            filtered_df = df[(df['tokoh'] == tokoh) & (df['Sentimen'] == sentimen)]
+            frequencies = dict(count_ngrams(filtered_df['joined_swremove'], 1).most_common(200))
+
+        return render_wordcloud_png(frequencies, width=width, height=height, color_func=single_color_func)
+
+    if wordcloud_cache is None:
+        return render()
+    return wordcloud_cache.get_or_render(('sentimen', tokoh, sentimen, width, height), render, fingerprint)
+
+def _count_ngram_frequency(df, tokoh, sentimen, ngram):
+    n = {'unigram': 1, 'bigram': 2, 'trigram': 3}[ngram]
+
+    filtered_df = df[df['tokoh'] == tokoh]
+    sentimen_list = ['Positif', 'Netral', 'Negatif'] if sentimen == 'All' else [sentimen]
+    filtered_df = filtered_df[filtered_df['Sentimen'].isin(sentimen_list)]
+
+    all_data = []
+    for label in sentimen_list:
+        sub_df = filtered_df[filtered_df['Sentimen'] == label]['joined_swremove']
+        cleaned = sub_df.apply(lambda x: re.sub(r"[\[\]',]", '', x) if isinstance(x, str) else x)
+        text = ' '.join(cleaned.astype(str))
+        tokens = text.split()
+        ngrams = zip(*[tokens[i:] for i in range(n)])
+        ngram_list = [' '.join(ng) for ng in ngrams]
+        counts = Counter(ngram_list)
+        for ngram_text, freq in counts.items():
+            all_data.append({'n-gram': ngram_text, 'Frekuensi': freq, 'Sentimen': label})
+
+    return pd.DataFrame(all_data)
+
+@instrumented('chart.visualize_ngram_frequency')
+def visualize_ngram_frequency(df, tokoh, sentimen='All', ngram='unigram', top_n=10, ngram_index=None):
+
+    custom_colors = {
+        'Negatif': '#EB5353',
+        'Netral': '#F5971D',
+        'Positif': '#36AE7C'
+    }
+
+    if ngram not in ['unigram', 'bigram', 'trigram']:
+        raise ValueError("ngram harus salah satu dari: 'unigram', 'bigram', atau 'trigram'")
+
+    # Gunakan tabel frekuensi yang sudah dibangun jika tersedia (tanpa tokenisasi ulang)
+    if ngram_index is not None:
+        ngram_df = ngram_index.top_ngrams(tokoh, sentimen=sentimen, ngram=ngram, top_n=top_n)
+    else:
+        ngram_df = _count_ngram_frequency(df, tokoh, sentimen, ngram)
+
+    if ngram_df.empty:
+        raise ValueError("Tidak ada data yang cocok untuk tokoh dan sentimen yang dipilih.")
+
+    top_ngrams = ngram_df.groupby('n-gram')['Frekuensi'].sum().nlargest(top_n).index
+    ngram_df = ngram_df[ngram_df['n-gram'].isin(top_ngrams)]
+
+    x_order = ngram_df.groupby('n-gram')['Frekuensi'].sum().sort_values(ascending=False).index.tolist()
+
+    fig = px.bar(
+        ngram_df,
+        x='n-gram',
+        y='Frekuensi',
+        color='Sentimen',
+        labels={'Frekuensi': '', 'n-gram': ''},
+        color_discrete_map=custom_colors,
+        category_orders={'n-gram': x_order}
+    )
+
+    fig.update_layout(
+        barmode='stack' if sentimen == 'All' else 'relative',
+        showlegend=False,
+        xaxis=dict(
+            title='',
+            showticklabels=True,
+            tickangle=45,  # rotasi label jika panjang
+            tickfont=dict(size=14)
+        ),
+        yaxis=dict(
+            visible=False,
+            showticklabels=False,
+            title=''
+        ),
+        margin=dict(l=0, r=0, t=0, b=40),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+
+    return ngram_df, fig
+
+@instrumented('chart.plot_hashtag_wordcloud_by_sentiment')
+def plot_hashtag_wordcloud_by_sentiment(
+    df, sentiment_filter='All', tokoh_filter=None,
+    column='hashtag', width=800, height=400,
+    wordcloud_cache=None, fingerprint=None, hashtag_counts=None
+):
+    """
+    Menampilkan wordcloud hashtag berdasarkan kolom hashtag (string) dan filter sentimen serta tokoh.
+
+    ``hashtag_counts`` (Counter) dapat diisi frekuensi yang sudah dihitung untuk filter
+    yang sama (mis. ``LiveAggregates.hashtag_counts()``, jumlah kolom matriks
+    dokumen x hashtag) agar DataFrame tidak dipindai. Tanpa itu, frekuensi
+    dihitung sekali jalan dari baris terfilter (lebih murah daripada membangun
+    matriks untuk satu query).
+    
+    Returns:
+    - df_freq: DataFrame frekuensi hashtag
+    - image: Gambar WordCloud dalam format PNG (bytes)
+    atau None jika tidak ada hashtag untuk filter ini.
+    """
+    color = custom_colors.get(sentiment_filter) if sentiment_filter != 'All' else None
+
+    if hashtag_counts is None:
+        filtered_df = df
+
+        # Filter berdasarkan sentimen
+        if sentiment_filter != 'All':
+            filtered_df = filtered_df[filtered_df['Sentimen'] == sentiment_filter]
+
+        # Filter berdasarkan tokoh (opsional)
+        if tokoh_filter is not None:
+            filtered_df = filtered_df[filtered_df['tokoh'] == tokoh_filter]
+
+        # Gabungkan semua hashtag
+        all_hashtags = []
+        for tags in filtered_df[column]:
+            if isinstance(tags, str):
+                all_hashtags.extend(tags.split())
+
+        # Hitung frekuensi
+        hashtag_counts = Counter(all_hashtags)
+    if not hashtag_counts:
+        return None
+
+    # Fungsi warna dinamis (random_state dari WordCloud ber-seed tetap, hasil selalu sama)
+    def color_func(word, random_state=None, **kwargs):
+        return color if color else random_state.choice(list(custom_colors.values()))
+
+    def render():
+        return render_wordcloud_png(hashtag_counts, width=width, height=height,
+                                    color_func=color_func, collocations=False)
+
+    if wordcloud_cache is None:
+        image = render()
+    else:
+        image = wordcloud_cache.get_or_render(('hashtag', sentiment_filter, tokoh_filter, width, height),
+                                              render, fingerprint)
+
+    # Dataframe frekuensi hashtag
+    df_freq = pd.DataFrame(hashtag_counts.items(), columns=['Hashtag', 'Frekuensi']) \
+                .sort_values(by='Frekuensi', ascending=False)
+
+    return df_freq, image
@@ -0,0 +1,89 @@
+from instrumentation import stage
+from loaders import NAME_MAPPING
+
+# ----------------------------------------------------------------------------
+# Panel Dashboard (kunci -> isi panel)
+# ----------------------------------------------------------------------------
+
+# Ruang filter dashboard: calon gubernur (list_cagub di sidebar) dan jumlah data teratas
+CAGUB_LIST = list(NAME_MAPPING.values())
+TOP_NUMBER_MIN, TOP_NUMBER_MAX = 5, 50
+
+NGRAMS = ['unigram', 'bigram', 'trigram']
+WORDCLOUD_SENTIMEN = ['Positif', 'Netral', 'Negatif']
+
+
+def compute_panel(view, key):
+    """
+    Menghitung isi satu panel ``page_dashboard.py`` dari kuncinya.
+
+    Kunci memuat nama panel beserta seluruh inputnya:
+    ``('distribusi',)``, ``('wordcloud', tokoh, sentimen)``,
+    ``('ngram', tokoh, sentimen, ngram, top_n)``, ``('hashtag', tokoh, sentimen)``,
+    dan ``('hashtag_pairs', tokoh, sentimen, top_n)``.
+
+    Args:
+        view (SharedStore | DataView): Sumber data (dataset, agregat, indeks n-gram, cache gambar).
+        key (tuple): Kunci panel.
+
+    Returns:
+        Isi panel: tuple (DataFrame, figure) untuk grafik, PNG untuk word cloud,
+        tuple (DataFrame, PNG) untuk hashtag (None jika tidak ada hashtag), dan DataFrame
+        untuk pasangan hashtag.
+    """
+    # Diimport saat panel pertama dihitung (plotly & wordcloud tidak dibutuhkan halaman prediksi)
+    from dashboard_charts import (plot_hashtag_wordcloud_by_sentiment, visualize_ngram_frequency,
+                                  visualize_sentiment_distribution_by_tokoh, visualize_wordcloud_by_sentiment_and_tokoh)
+
+    name, *args = key
+    with stage(f"panel.{name}"):
+        df = view.df_sentimen
+        if name == 'distribusi':
+            return visualize_sentiment_distribution_by_tokoh(df, count_df=view.aggregates.distribution())
+        if name == 'wordcloud':
+            tokoh, sentimen = args
+            return visualize_wordcloud_by_sentiment_and_tokoh(df, tokoh=tokoh, sentimen=sentimen,
+                                                              ngram_index=view.ngram_index, wordcloud_cache=view.wordcloud_cache,
+                                                              fingerprint=view.data_fingerprint)
+        if name == 'ngram':
+            tokoh, sentimen, ngram, top_n = args
+            return visualize_ngram_frequency(df, tokoh=tokoh, sentimen=sentimen, ngram=ngram, top_n=top_n,
+                                             ngram_index=view.ngram_index)
+        if name == 'hashtag':
+            tokoh, sentimen = args
+            return plot_hashtag_wordcloud_by_sentiment(df, sentiment_filter=sentimen, tokoh_filter=tokoh,
+                                                       wordcloud_cache=view.wordcloud_cache, fingerprint=view.data_fingerprint,
+                                                       hashtag_counts=view.aggregates.hashtag_counts(sentimen, tokoh))
+        if name == 'hashtag_pairs':
+            tokoh, sentimen, top_n = args
+            return view.aggregates.hashtag_pairs(sentimen, tokoh, top_n=top_n)
+        raise KeyError(f"Panel tidak dikenal: {name}")
+
+
+def get_panel(view, key):
+    """Isi panel dari cache panel ``view`` (memori, lalu artefak prerender), atau dihitung langsung."""
+    return view.panel(key, lambda: compute_panel(view, key))
+
+
+def panel_keys(sentimen_options, cagub_list=CAGUB_LIST, top_numbers=range(TOP_NUMBER_MIN, TOP_NUMBER_MAX + 1)):
+    """
+    Seluruh kunci panel untuk setiap kombinasi filter dashboard.
+
+    Args:
+        sentimen_options (list[str]): Pilihan filter sentimen ('All' + kelas sentimen).
+        cagub_list (list[str]): Pilihan calon gubernur.
+        top_numbers (Iterable[int]): Pilihan jumlah data teratas.
+
+    Yields:
+        tuple: Kunci panel (lihat ``compute_panel``).
+    """
+    yield ('distribusi',)
+    for tokoh in cagub_list:
+        for sentimen in WORDCLOUD_SENTIMEN:
+            yield ('wordcloud', tokoh, sentimen)
+        for sentimen in sentimen_options:
+            yield ('hashtag', tokoh, sentimen)
+            for top_n in top_numbers:
+                for ngram in NGRAMS:
+                    yield ('ngram', tokoh, sentimen, ngram, top_n)
+                yield ('hashtag_pairs', tokoh, sentimen, top_n)
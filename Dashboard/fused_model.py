@@ -0,0 +1,241 @@
+import argparse
+import math
+import os
+import pickle
+import re
+import time
+from itertools import chain, repeat
+
+import numpy as np
+
+from loaders import FUSED_MODEL_PATH, MODEL_PATH, SELECTOR_PATH, VECTORIZER_PATH
+
+# ----------------------------------------------------------------------------
+# Artefak Inference Gabungan (TF-IDF terpangkas + selektor + model)
+# ----------------------------------------------------------------------------
+
+class PrunedTfidfVectorizer:
+    """
+    Pengganti ``TfidfVectorizer.transform`` + ``SelectPercentile.transform``
+    yang langsung menghasilkan kolom fitur terpilih.
+
+    Kosakata dan bobot idf hanya disimpan untuk fitur terpilih. Kata yang
+    tidak terpilih tetap ikut dalam norma L2 baris, sehingga disimpan ringkas:
+    satu string kata terurut dan kode ke daftar nilai idf unik (kata dengan
+    df sama memiliki idf sama). Hasilnya identik bit demi bit dengan rantai
+    aslinya (urutan penjumlahan mengikuti urutan kolom vectorizer, yaitu
+    urutan alfabetis kata).
+
+    Args:
+        vocabulary (dict): Kata terpilih -> indeks kolom keluaran.
+        idf (np.ndarray): Bobot idf fitur terpilih (urut indeks kolom).
+        norm_terms (str): Kata tidak terpilih, terurut dan dipisah ``'\\n'`` (hanya untuk norma).
+        norm_idf (np.ndarray): Nilai idf unik kata tidak terpilih.
+        norm_idf_codes (np.ndarray): Indeks ke ``norm_idf`` untuk tiap kata di ``norm_terms``.
+        token_pattern (str): Pola token vectorizer asal.
+        lowercase (bool): Sama dengan parameter vectorizer asal.
+        ngram_range (tuple): Sama dengan parameter vectorizer asal.
+        binary, sublinear_tf (bool): Sama dengan parameter vectorizer asal.
+        norm (str | None): 'l2' atau None.
+    """
+
+    def __init__(self, vocabulary, idf, norm_terms, norm_idf, norm_idf_codes, token_pattern, lowercase=True,
+                 ngram_range=(1, 1), binary=False, sublinear_tf=False, norm='l2'):
+        self.vocabulary_ = vocabulary
+        self.idf_ = idf
+        self.norm_terms_ = norm_terms
+        self.norm_idf_ = norm_idf
+        self.norm_idf_codes_ = norm_idf_codes
+        self.token_pattern = token_pattern
+        self.lowercase = lowercase
+        self.ngram_range = tuple(ngram_range)
+        self.binary = binary
+        self.sublinear_tf = sublinear_tf
+        self.norm = norm
+        self._prepare()
+
+    def _prepare(self):
+        # Struktur bantu saat runtime (tidak ikut disimpan). Setiap kata dikenal diberi
+        # peringkat alfabetis = indeks kolomnya di vectorizer asal.
+        self._token_re = re.compile(self.token_pattern)
+        norm_terms = self.norm_terms_.split('\n') if self.norm_terms_ else []
+        terms = list(self.vocabulary_) + norm_terms
+        term_idf = np.concatenate([self.idf_[list(self.vocabulary_.values())],
+                                   self.norm_idf_[self.norm_idf_codes_]]).astype(np.float64)
+        term_col = np.concatenate([np.fromiter(self.vocabulary_.values(), dtype=np.int64, count=len(self.vocabulary_)),
+                                   np.full(len(norm_terms), -1, dtype=np.int64)])
+        order = sorted(range(len(terms)), key=terms.__getitem__)
+        self._rank = {terms[i]: rank for rank, i in enumerate(order)}
+        self._rank_idf = term_idf[order]
+        self._rank_col = term_col[order]
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for key in ('_token_re', '_rank', '_rank_idf', '_rank_col'):
+            del state[key]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._prepare()
+
+    @classmethod
+    def from_pipeline(cls, vectorizer, fselector):
+        """
+        Membangun vectorizer terpangkas dari ``TfidfVectorizer`` dan selektor fitur yang sudah di-fit.
+
+        Raises:
+            ValueError: Jika konfigurasi vectorizer tidak didukung.
+        """
+        params = vectorizer.get_params()
+        unsupported = {key: params[key] for key in ('analyzer', 'tokenizer', 'preprocessor', 'strip_accents',
+                                                      'stop_words', 'input')
+                       if params[key] not in (None, 'word', 'content')}
+        if unsupported or params['norm'] not in ('l2', None) or not params['use_idf']:
+            raise ValueError(f"Konfigurasi vectorizer tidak didukung: {unsupported or params}")
+
+        support = np.flatnonzero(fselector.get_support())
+        feature_names = vectorizer.get_feature_names_out()
+        selected = set(support.tolist())
+
+        vocabulary = {str(feature_names[col]): new_col for new_col, col in enumerate(support)}
+        norm_cols = np.array([col for col in range(len(feature_names)) if col not in selected], dtype=np.int64)
+        norm_terms = [str(term) for term in feature_names[norm_cols]]
+        if any('\n' in term for term in norm_terms):
+            raise ValueError("Kosakata vectorizer memuat kata dengan karakter baris baru")
+        norm_idf, norm_idf_codes = np.unique(vectorizer.idf_[norm_cols], return_inverse=True)
+        return cls(vocabulary, vectorizer.idf_[support].copy(), '\n'.join(norm_terms), norm_idf,
+                   norm_idf_codes.astype(np.min_scalar_type(max(len(norm_idf) - 1, 0))),
+                   token_pattern=params['token_pattern'], lowercase=params['lowercase'],
+                   ngram_range=params['ngram_range'], binary=params['binary'],
+                   sublinear_tf=params['sublinear_tf'], norm=params['norm'])
+
+    def _analyze(self, doc):
+        if self.lowercase:
+            doc = doc.lower()
+        tokens = self._token_re.findall(doc)
+        min_n, max_n = self.ngram_range
+        if max_n == 1:
+            return tokens
+        ngrams = tokens if min_n == 1 else []
+        for n in range(max(min_n, 2), max_n + 1):
+            ngrams += [' '.join(tokens[i:i + n]) for i in range(len(tokens) - n + 1)]
+        return ngrams
+
+    def transform(self, raw_documents):
+        """
+        Mengubah teks menjadi matriks TF-IDF berisi fitur terpilih saja.
+
+        Returns:
+            scipy.sparse.csr_matrix: Matriks (n_teks, n_fitur_terpilih).
+        """
+        import scipy.sparse as sp
+
+        # 1. Petakan seluruh token sekaligus ke peringkat kata (-1: di luar kosakata)
+        rank = self._rank
+        n_terms = len(rank)
+        tokens = [self._analyze(doc) for doc in raw_documents]
+        n_docs = len(tokens)
+        token_counts = np.fromiter(map(len, tokens), dtype=np.int64, count=n_docs)
+        token_ranks = np.fromiter(map(rank.get, chain.from_iterable(tokens), repeat(-1)),
+                                  dtype=np.int64, count=int(token_counts.sum()))
+        token_rows = np.repeat(np.arange(n_docs), token_counts)
+        known = token_ranks >= 0
+
+        # 2. Hitung kata per dokumen; np.unique sekaligus mengurutkan per baris menurut
+        #    kolom vectorizer asal. Lalu hitung bobot tf-idf
+        keys, counts = np.unique(token_rows[known] * n_terms + token_ranks[known], return_counts=True)
+        rows, ranks = np.divmod(keys, n_terms)
+        lengths = np.bincount(rows, minlength=n_docs)
+        tf = counts.astype(np.float64)
+        if self.binary:
+            tf[:] = 1.0
+        if self.sublinear_tf:
+            tf = np.log(tf) + 1.0
+        weights = tf * self._rank_idf[ranks]
+
+        # 3. Norma L2 dijumlahkan berurutan per baris (urutan sama dengan scikit-learn,
+        #    sehingga hasilnya identik bit demi bit); padding 0.0 tidak mengubah jumlah
+        if self.norm == 'l2' and len(weights):
+            starts = np.cumsum(lengths) - lengths
+            squares = np.zeros((n_docs, int(lengths.max())))
+            squares[rows, np.arange(len(weights)) - starts[rows]] = weights * weights
+            sum_sq = np.zeros(n_docs)
+            for column in squares.T:
+                sum_sq += column
+            scale = np.sqrt(sum_sq)
+            scale[sum_sq == 0.0] = 1.0
+            weights = weights / scale[rows]
+
+        # 4. Ambil kolom terpilih saja
+        cols = self._rank_col[ranks]
+        selected = cols >= 0
+        indptr = np.concatenate([[0], np.cumsum(np.bincount(rows[selected], minlength=n_docs))])
+        return sp.csr_matrix(
+            (weights[selected], cols[selected].astype(np.int32), indptr.astype(np.int32)),
+            shape=(n_docs, len(self.idf_))
+        )
+
+
+class PassthroughSelector:
+    """Selektor pengganti: seleksi fitur sudah dilakukan oleh ``PrunedTfidfVectorizer``."""
+
+    def transform(self, X):
+        return X
+
+
+class FusedModel:
+    """
+    Satu artefak berisi vectorizer terpangkas, selektor passthrough, dan model.
+    ``read_model()`` mengembalikan ketiganya sebagai pengganti tiga pickle terpisah.
+    """
+
+    def __init__(self, vectorizer, model):
+        self.vectorizer = vectorizer
+        self.fselector = PassthroughSelector()
+        self.model = model
+
+    def components(self):
+        """Tuple (vectorizer, fselector, model) seperti keluaran ``read_model()``."""
+        return self.vectorizer, self.fselector, self.model
+
+
+def compile_fused_model(vectorizer, fselector, model):
+    """Menggabungkan keluaran ``read_model()`` menjadi ``FusedModel``."""
+    return FusedModel(PrunedTfidfVectorizer.from_pipeline(vectorizer, fselector), model)
+
+
+# ----------------------------------------------------------------------------
+# CLI: kompilasi artefak
+# ----------------------------------------------------------------------------
+
+def main():
+    from loaders import read_model
+
+    # Kelas diambil dari modul ``fused_model`` (bukan ``__main__``) agar pickle bisa dimuat di mana saja
+    from fused_model import compile_fused_model
+
+    parser = argparse.ArgumentParser(description="Mengompilasi vectorizer, selektor, dan model menjadi satu artefak.")
+    parser.add_argument('--vectorizer', default=VECTORIZER_PATH)
+    parser.add_argument('--selector', default=SELECTOR_PATH)
+    parser.add_argument('--model', default=MODEL_PATH)
+    parser.add_argument('--output', default=FUSED_MODEL_PATH)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    vectorizer, fselector, model = read_model(args.vectorizer, args.selector, args.model, fused_path=None)
+    fused = compile_fused_model(vectorizer, fselector, model)
+
+    tmp_path = f"{args.output}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(fused, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, args.output)
+
+    source_size = sum(os.path.getsize(path) for path in (args.vectorizer, args.selector, args.model))
+    print(f"{len(fused.vectorizer.vocabulary_):,} dari {len(vectorizer.vocabulary_):,} fitur dipertahankan; "
+          f"{source_size / 1e6:.2f} MB -> {os.path.getsize(args.output) / 1e6:.2f} MB "
+          f"({time.perf_counter() - start:.1f} detik) -> {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+import threading
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# ----------------------------------------------------------------------------
+# Matriks Dokumen x Hashtag (sparse, dikodekan integer)
+# ----------------------------------------------------------------------------
+
+PAIR_COLUMNS = ['Hashtag 1', 'Hashtag 2', 'Frekuensi']
+
+
+def _codes(values, mapping):
+    # Nilai -> kode integer (mapping diperluas untuk nilai baru); NaN/None = -1
+    codes, uniques = pd.factorize(values)
+    for value in uniques:
+        mapping.setdefault(value, len(mapping))
+    remap = np.fromiter((mapping[value] for value in uniques), dtype=np.int32, count=len(uniques))
+    return np.where(codes >= 0, remap[codes], -1).astype(np.int32)
+
+
+class HashtagMatrix:
+    """
+    Hashtag setiap tweet yang ditokenisasi sekali menjadi matriks CSR
+    dokumen x hashtag (nilai = jumlah kemunculan hashtag di tweet tersebut).
+
+    Frekuensi untuk kombinasi filter tokoh/sentimen apa pun adalah jumlah
+    kolom pada baris yang lolos mask, tanpa menyalin atau memindai DataFrame.
+    Hasilnya identik dengan ``Counter`` atas hashtag baris terfilter,
+    termasuk urutan hashtag berfrekuensi sama (urutan kemunculan pertama):
+    kolom di setiap baris disimpan sesuai urutan kemunculan di tweet.
+
+    Baris baru ditambahkan lewat ``update`` (hashtag baru mendapat kolom baru).
+
+    Args:
+        df (pd.DataFrame | None): Dataset dengan kolom 'tokoh', 'Sentimen', dan ``column``.
+        column (str): Kolom hashtag (dipisahkan spasi).
+    """
+
+    def __init__(self, df=None, column='hashtag'):
+        self.column = column
+        self.vocabulary = {}
+        self.hashtags = []
+        self._tokoh_codes = {}
+        self._sentimen_codes = {}
+        # (tokoh, sentimen, indptr, indices, data) diganti sekaligus agar pembaca selalu konsisten
+        self._arrays = (np.empty(0, np.int32), np.empty(0, np.int32), np.zeros(1, np.int64),
+                        np.empty(0, np.int32), np.empty(0, np.int32))
+        self._lock = threading.Lock()
+        if df is not None:
+            self.update(df)
+
+    @property
+    def n_rows(self):
+        return len(self._arrays[0])
+
+    @property
+    def matrix(self):
+        """Matriks ``scipy.sparse.csr_matrix`` berukuran (jumlah baris, jumlah hashtag)."""
+        _, _, indptr, indices, data = self._arrays
+        return sparse.csr_matrix((data, indices, indptr), shape=(len(indptr) - 1, len(self.hashtags)))
+
+    def update(self, df):
+        """Menambahkan baris ``df`` (urutan sama dengan di dataset) ke matriks."""
+        with self._lock:
+            tokoh, sentimen, indptr, indices, data = self._arrays
+            n_new = len(df)
+
+            # 1. Tokenisasi: satu entri per (baris, hashtag) sesuai urutan kemunculan pertama
+            tags = pd.Series(np.asarray(df[self.column], dtype=object)).str.split().explode().dropna()
+            pairs = pd.DataFrame({'row': tags.index.to_numpy(np.int64), 'tag': tags.to_numpy(dtype=object)})
+            entries = pairs.groupby(['row', 'tag'], sort=False).size()
+            rows = entries.index.get_level_values('row').to_numpy(np.int64)
+
+            # 2. Kode kolom (hashtag baru ditambahkan ke akhir kosakata)
+            new_codes = _codes(entries.index.get_level_values('tag').to_numpy(dtype=object), self.vocabulary)
+            self.hashtags.extend(list(self.vocabulary)[len(self.hashtags):])
+
+            # 3. Sambung ke array CSR yang sudah ada
+            row_lengths = np.bincount(rows, minlength=n_new)
+            new_indptr = indptr[-1] + np.cumsum(row_lengths, dtype=np.int64)
+            self._arrays = (
+                np.concatenate([tokoh, _codes(np.asarray(df['tokoh'], dtype=object), self._tokoh_codes)]),
+                np.concatenate([sentimen, _codes(np.asarray(df['Sentimen'], dtype=object), self._sentimen_codes)]),
+                np.concatenate([indptr, new_indptr]),
+                np.concatenate([indices, new_codes]),
+                np.concatenate([data, entries.to_numpy(np.int32)]),
+            )
+
+    def row_mask(self, sentiment_filter='All', tokoh_filter=None):
+        """Mask baris untuk filter yang sama dengan ``plot_hashtag_wordcloud_by_sentiment``."""
+        tokoh, sentimen = self._arrays[:2]
+        mask = np.ones(len(tokoh), dtype=bool)
+        if sentiment_filter != 'All':
+            mask &= sentimen == self._sentimen_codes.get(sentiment_filter, -2)
+        if tokoh_filter is not None:
+            mask &= tokoh == self._tokoh_codes.get(tokoh_filter, -2)
+        return mask
+
+    def counts(self, sentiment_filter='All', tokoh_filter=None):
+        """
+        Frekuensi hashtag pada baris yang lolos filter.
+
+        Returns:
+            Counter: Hashtag -> frekuensi, berurutan sesuai kemunculan pertama.
+        """
+        _, _, indptr, indices, data = self._arrays
+        mask = self.row_mask(sentiment_filter, tokoh_filter)
+        matrix = sparse.csr_matrix((data, indices, indptr), shape=(len(mask), len(self.hashtags)))
+
+        # Jumlah kolom terhadap mask (mask^T . X)
+        totals = matrix.T @ mask.astype(np.int32)
+
+        # Urutan kemunculan pertama: posisi entri pertama tiap kolom di antara baris terfilter
+        selected = indices[np.repeat(mask, np.diff(indptr))]
+        columns, first = np.unique(selected, return_index=True)
+        columns = columns[np.argsort(first, kind='stable')]
+        return Counter({self.hashtags[column]: int(totals[column]) for column in columns})
+
+    def cooccurring_pairs(self, sentiment_filter='All', tokoh_filter=None, top_n=10):
+        """
+        Pasangan hashtag yang paling sering muncul bersama dalam satu tweet.
+
+        Args:
+            sentiment_filter (str): Sentimen atau 'All'.
+            tokoh_filter (str | None): Tokoh atau None untuk semua tokoh.
+            top_n (int): Jumlah pasangan teratas.
+
+        Returns:
+            pd.DataFrame: Kolom 'Hashtag 1', 'Hashtag 2', 'Frekuensi' (jumlah tweet),
+            urut frekuensi menurun lalu nama hashtag.
+        """
+        _, _, indptr, indices, _ = self._arrays
+        mask = self.row_mask(sentiment_filter, tokoh_filter)
+        n_tags = len(self.hashtags)
+
+        # 1. Matriks biner baris terfilter, lalu X^T X = jumlah tweet per pasangan hashtag
+        lengths = np.diff(indptr)[mask]
+        selected = indices[np.repeat(mask, np.diff(indptr))]
+        binary = sparse.csr_matrix((np.ones(len(selected), dtype=np.int32), selected,
+                                    np.concatenate([[0], np.cumsum(lengths)])), shape=(len(lengths), n_tags))
+        cooccurrence = sparse.triu(binary.T @ binary, k=1).tocoo()
+        if not cooccurrence.nnz:
+            return pd.DataFrame(columns=PAIR_COLUMNS)
+
+        # 2. Pasangan diurutkan alfabetis di dalam baris, lalu frekuensi menurun dan nama
+        names = np.asarray(self.hashtags, dtype=object)
+        first, second = names[cooccurrence.row], names[cooccurrence.col]
+        swap = first > second
+        first[swap], second[swap] = second[swap], first[swap]
+        pairs = pd.DataFrame({'Hashtag 1': first, 'Hashtag 2': second, 'Frekuensi': cooccurrence.data.astype(np.int64)})
+        pairs = pairs.sort_values(['Frekuensi', 'Hashtag 1', 'Hashtag 2'], ascending=[False, True, True], kind='stable')
+        return pairs.head(top_n).reset_index(drop=True)
@@ -0,0 +1,223 @@
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+import urllib.request
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from loaders import read_kamus, read_model
+from predictor import SentimentPredictor
+from stem_cache import STEM_CACHE_PATH, create_stem_cache
+from text_preprocessing import KamusNormalizer, build_stop_words_remover
+
+# ----------------------------------------------------------------------------
+# Micro-batching
+# ----------------------------------------------------------------------------
+
+class MicroBatcher:
+    """
+    Mengumpulkan permintaan yang datang bersamaan menjadi satu batch sebelum
+    diteruskan ke ``predict_fn``.
+
+    Batch dikirim ketika berisi ``max_batch_size`` item atau ketika item
+    pertama sudah menunggu ``max_wait_ms`` milidetik.
+
+    Args:
+        predict_fn (Callable[[list], list]): Fungsi batch, satu hasil per item.
+        max_batch_size (int): Ukuran batch maksimum.
+        max_wait_ms (float): Waktu tunggu maksimum untuk mengisi batch.
+    """
+
+    def __init__(self, predict_fn, max_batch_size=32, max_wait_ms=10):
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.batches = 0
+        self.items = 0
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, item):
+        """Mengantrikan satu item dan mengembalikan Future untuk hasilnya."""
+        future = Future()
+        self._queue.put((item, future))
+        return future
+
+    def stats(self):
+        return {
+            'batches': self.batches,
+            'items': self.items,
+            'avg_batch_size': self.items / self.batches if self.batches else 0.0,
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait * 1000,
+        }
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            items = [item for item, _ in batch]
+            try:
+                results = self.predict_fn(items)
+            except Exception as exc:
+                for _, future in batch:
+                    future.set_exception(exc)
+                continue
+
+            self.batches += 1
+            self.items += len(batch)
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+
+
+# ----------------------------------------------------------------------------
+# Inference Service
+# ----------------------------------------------------------------------------
+
+class InferenceService:
+    """
+    Memuat kamus, stemmer, dan tiga pickle di ``Model/`` sekali, lalu melayani
+    prediksi melalui MicroBatcher.
+    """
+
+    def __init__(self, max_batch_size=32, max_wait_ms=10, stem_cache_path=STEM_CACHE_PATH):
+        vectorizer, fselector, model = read_model()
+        self.predictor = SentimentPredictor(vectorizer, fselector, model,
+                                            normalizer=KamusNormalizer(read_kamus()),
+                                            stop_words_remover=build_stop_words_remover(),
+                                            stemmer=create_stem_cache(path=stem_cache_path))
+        self.batcher = MicroBatcher(self.predictor.predict_clean, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+
+    def predict(self, texts, timeout=30):
+        """
+        Memprediksi sentimen sejumlah teks mentah.
+
+        Returns:
+            list[dict]: Format sama dengan ``SentimentPredictor.predict``.
+        """
+        clean_texts = [self.predictor.preprocess(text) for text in texts]
+        futures = [self.batcher.submit(text) if text is not None else None for text in clean_texts]
+        return [future.result(timeout) if future is not None else SentimentPredictor._empty_result()
+                for future in futures]
+
+
+class InferenceHTTPServer(ThreadingHTTPServer):
+    # Antrian listen bawaan (5) terlalu kecil untuk banyak klien bersamaan
+    request_queue_size = 128
+    daemon_threads = True
+
+
+def make_handler(service):
+    class InferenceHandler(BaseHTTPRequestHandler):
+        def _send_json(self, status, payload):
+            body = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == '/health':
+                self._send_json(200, {'status': 'ok', 'batcher': service.batcher.stats()})
+            else:
+                self._send_json(404, {'error': 'not found'})
+
+        def do_POST(self):
+            if self.path != '/predict':
+                self._send_json(404, {'error': 'not found'})
+                return
+            try:
+                length = int(self.headers.get('Content-Length', 0))
+                payload = json.loads(self.rfile.read(length) or b'{}')
+            except ValueError:
+                self._send_json(400, {'error': 'body harus berupa JSON'})
+                return
+
+            # Terima {"text": "..."} atau {"texts": ["...", ...]}
+            if not isinstance(payload, dict):
+                payload = {}
+            if isinstance(payload.get('text'), str):
+                texts, single = [payload['text']], True
+            elif isinstance(payload.get('texts'), list) and all(isinstance(t, str) for t in payload['texts']):
+                texts, single = payload['texts'], False
+            else:
+                self._send_json(400, {'error': "field 'text' (str) atau 'texts' (list[str]) wajib diisi"})
+                return
+
+            # Kegagalan model/preprocessing (atau batch yang melewati timeout) tetap dijawab,
+            # bukan memutus koneksi tanpa respons
+            try:
+                results = service.predict(texts)
+            except Exception as exc:
+                self._send_json(500, {'error': f"prediksi gagal: {type(exc).__name__}: {exc}"})
+                return
+            self._send_json(200, results[0] if single else {'results': results})
+
+        def log_message(self, format, *args):
+            pass
+
+    return InferenceHandler
+
+
+# ----------------------------------------------------------------------------
+# Client (dipakai halaman prediksi sebagai backend opsional)
+# ----------------------------------------------------------------------------
+
+INFERENCE_SERVER_URL = os.environ.get('INFERENCE_SERVER_URL', '')
+
+
+def request_prediction(text, url=None, timeout=10):
+    """
+    Mengirim satu teks ke inference server.
+
+    Returns:
+        dict: ``{'label': ..., 'confidence': {...}}`` seperti halaman prediksi.
+    """
+    url = (url or INFERENCE_SERVER_URL).rstrip('/')
+    request = urllib.request.Request(
+        f"{url}/predict",
+        data=json.dumps({'text': text}).encode('utf-8'),
+        headers={'Content-Type': 'application/json'},
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inference server sentimen lokal dengan micro-batching.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8600)
+    parser.add_argument('--max-batch-size', type=int, default=32)
+    parser.add_argument('--max-wait-ms', type=float, default=10)
+    parser.add_argument('--stem-cache', default=STEM_CACHE_PATH)
+    args = parser.parse_args()
+
+    service = InferenceService(max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms,
+                               stem_cache_path=args.stem_cache or None)
+    server = InferenceHTTPServer((args.host, args.port), make_handler(service))
+    print(f"Inference server berjalan di http://{args.host}:{args.port} "
+          f"(batch maks {args.max_batch_size}, tunggu maks {args.max_wait_ms} ms)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+import pandas as pd
+
+from build_dataset import OUTPUT_COLUMNS, PREPROCESS_CACHE_PATH, PreprocessCache, build_dataset, pipeline_version
+from loaders import (DATA_PATH, LABEL_MAPPING, NAME_MAPPING, append_log_path, columnar_path, file_fingerprint,
+                     write_columnar)
+from stem_cache import STEM_CACHE_PATH
+
+# ----------------------------------------------------------------------------
+# Ingest Inkremental: tweet baru -> log tambahan dataset analisis
+# ----------------------------------------------------------------------------
+
+# Nama lengkap / sentimen -> nilai yang disimpan di dataset
+SHORT_NAMES = {full: short for short, full in NAME_MAPPING.items()}
+SENTIMEN_TO_LABEL = {sentimen: label for label, sentimen in LABEL_MAPPING.items()}
+
+
+def read_input(path):
+    """Membaca tweet baru dari JSONL (atau CSV) dengan kolom 'full_text', 'username', 'tokoh', opsional 'Label'/'Sentimen'."""
+    df = pd.read_csv(path) if path.endswith('.csv') else pd.read_json(path, lines=True)
+    if 'full_text' not in df.columns or 'tokoh' not in df.columns:
+        raise ValueError("Input wajib memiliki kolom 'full_text' dan 'tokoh'")
+
+    df['tokoh'] = df['tokoh'].replace(SHORT_NAMES)
+    if 'username' not in df.columns:
+        df['username'] = None
+    if 'Label' not in df.columns:
+        df['Label'] = float('nan')
+    if 'Sentimen' in df.columns:
+        # Label boleh diberikan sebagai angka ('Label') atau teks ('Sentimen')
+        df['Label'] = df['Label'].fillna(df['Sentimen'].map(SENTIMEN_TO_LABEL))
+    return df[['full_text', 'username', 'Label', 'tokoh']]
+
+
+def hash_set_path(data_path):
+    """Lokasi himpunan hash konten CSV dataset (disimpan bersama log tambahan)."""
+    return os.path.splitext(data_path)[0] + '.hashes'
+
+
+def pending_logs(data_path):
+    """Log tambahan yang sedang (atau gagal) digabungkan ``compact``, urut waktu."""
+    return sorted(glob.glob(glob.escape(append_log_path(data_path)) + '.*.compacting'))
+
+
+def write_hash_set(data_path, hashes):
+    """Menyimpan hash konten CSV beserta sidik jari CSV tersebut (ditulis atomik)."""
+    path = hash_set_path(data_path)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps({'fingerprint': file_fingerprint(data_path)}) + '\n')
+        f.writelines(f"{key}\n" for key in hashes)
+    os.replace(tmp_path, path)
+
+
+def read_hash_set(data_path):
+    """
+    Hash konten CSV dataset dari ``hash_set_path``; dibangun ulang dari CSV hanya
+    jika belum ada atau CSV sudah berubah (mis. ``build_dataset.py`` dijalankan ulang).
+    """
+    try:
+        with open(hash_set_path(data_path), encoding='utf-8') as f:
+            header = json.loads(f.readline() or '{}')
+            if header.get('fingerprint') == file_fingerprint(data_path):
+                return {line.rstrip('\n') for line in f}
+    except (OSError, ValueError):
+        pass
+    hashes = set(pd.read_csv(data_path, usecols=['content_hash'])['content_hash'])
+    write_hash_set(data_path, hashes)
+    return hashes
+
+
+def existing_hashes(data_path):
+    """
+    Hash konten yang sudah ada di dataset dan log tambahannya. Hash CSV dibaca
+    dari himpunan tersimpan, sehingga biaya ingest sebanding ukuran log, bukan ukuran dataset.
+    """
+    hashes = read_hash_set(data_path)
+    for log_path in pending_logs(data_path) + [append_log_path(data_path)]:
+        if os.path.exists(log_path):
+            with open(log_path, encoding='utf-8') as f:
+                hashes.update(json.loads(line)['content_hash'] for line in f if line.strip())
+    return hashes
+
+
+def score_missing_labels(dataset):
+    """Mengisi 'Label' yang kosong dengan prediksi model (teks sudah dipreprocessing)."""
+    missing = dataset['Label'].isna()
+    if missing.any():
+        from loaders import read_model
+
+        vectorizer, fselector, model = read_model()
+        features = fselector.transform(vectorizer.transform(dataset.loc[missing, 'joined_swremove']))
+        dataset.loc[missing, 'Label'] = model.predict(features)
+    dataset['Label'] = dataset['Label'].astype(int)
+    dataset['Sentimen'] = dataset['Label'].map(LABEL_MAPPING)
+    return int(missing.sum())
+
+
+def append_rows(dataset, log_path):
+    """
+    Menambahkan baris ke log dalam satu kali tulis. Pembaca hanya memproses
+    baris yang sudah lengkap, jadi tidak ada baris setengah jadi yang terbaca.
+    """
+    records = dataset[OUTPUT_COLUMNS].astype(object).where(dataset[OUTPUT_COLUMNS].notna(), None)
+    payload = ''.join(json.dumps(record, ensure_ascii=False) + '\n'
+                      for record in records.to_dict(orient='records'))
+    with open(log_path, 'a', encoding='utf-8') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def compact(data_path):
+    """
+    Menggabungkan log tambahan ke CSV (dan salinan Arrow-nya).
+    Dashboard akan memuat ulang penuh satu kali karena file data berubah.
+
+    Log dipindahkan (rename atomik) sebelum CSV diganti, sehingga pembaca yang
+    melihat CSV baru tidak lagi melihat log lama (baris tidak terhitung dua
+    kali), dan baris yang di-ingest selama penggabungan masuk ke log baru.
+    Log yang tertinggal dari penggabungan yang terhenti ikut digabungkan.
+
+    Returns:
+        int: Jumlah baris yang digabungkan.
+    """
+    # 1. Pindahkan log aktif; ingest berikutnya menulis ke log baru
+    log_path = append_log_path(data_path)
+    if os.path.exists(log_path):
+        os.replace(log_path, f"{log_path}.{time.time_ns()}.compacting")
+    pending = pending_logs(data_path)
+    if not pending:
+        return 0
+
+    # 2. Tulis CSV gabungan ke file sementara
+    records = []
+    for path in pending:
+        with open(path, encoding='utf-8') as f:
+            records.extend(json.loads(line) for line in f if line.strip())
+    base = pd.read_csv(data_path)
+    appended = pd.DataFrame.from_records(records, columns=OUTPUT_COLUMNS)
+    # Baris yang sudah masuk CSV (penggabungan sebelumnya terhenti setelah CSV diganti) dilewati
+    appended = appended[~appended['content_hash'].isin(base['content_hash'])]
+    dataset = pd.concat([base, appended], ignore_index=True)
+    tmp_path = f"{data_path}.{os.getpid()}.tmp"
+    dataset.to_csv(tmp_path, index=False)
+
+    # 3. Ganti CSV, lalu salinan Arrow, himpunan hash, dan log yang sudah digabungkan
+    os.replace(tmp_path, data_path)
+    write_columnar(dataset, columnar_path(data_path))
+    write_hash_set(data_path, dataset['content_hash'])
+    for path in pending:
+        os.remove(path)
+    return len(appended)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Menambahkan tweet baru ke dataset analisis tanpa membangun ulang.")
+    parser.add_argument('inputs', nargs='*', help="File JSONL/CSV berisi tweet baru")
+    parser.add_argument('--data', default=DATA_PATH)
+    parser.add_argument('--cache', default=PREPROCESS_CACHE_PATH)
+    parser.add_argument('--workers', type=int, default=1, help="Worker preprocessing (batch kecil: 1)")
+    parser.add_argument('--stem-cache', default=STEM_CACHE_PATH)
+    parser.add_argument('--compact', action='store_true', help="Gabungkan log tambahan ke CSV setelah ingest")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.inputs:
+        # 1. Baca input dan buang tweet yang sudah ada
+        df = pd.concat([read_input(path) for path in args.inputs], ignore_index=True)
+        cache = PreprocessCache(args.cache or None, version=pipeline_version())
+        dataset, _ = build_dataset(df, cache, workers=args.workers, stem_cache_path=args.stem_cache)
+        dataset = dataset.drop_duplicates('content_hash')
+        dataset = dataset[~dataset['content_hash'].isin(existing_hashes(args.data))]
+
+        # 2. Label kosong diisi prediksi model, lalu tulis ke log tambahan
+        n_scored = score_missing_labels(dataset) if len(dataset) else 0
+        if len(dataset):
+            append_rows(dataset, append_log_path(args.data))
+        print(f"{len(dataset):,} tweet ditambahkan ({n_scored:,} dilabeli model, {len(df) - len(dataset):,} "
+              f"dilewati: duplikat/kosong) -> {append_log_path(args.data)}", file=sys.stderr)
+
+    if args.compact:
+        print(f"{compact(args.data):,} baris log digabungkan ke {args.data}", file=sys.stderr)
+
+    print(f"Selesai dalam {time.perf_counter() - start:.1f} detik")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,242 @@
+import atexit
+import functools
+import json
+import multiprocessing
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import nullcontext
+
+# ----------------------------------------------------------------------------
+# Instrumentasi Hot Path (waktu per tahap, jumlah panggilan, puncak alokasi, cache)
+# ----------------------------------------------------------------------------
+
+# INSTRUMENTATION: "" / "0" = mati (tanpa overhead), "1" = waktu & jumlah panggilan,
+# "memory" = ditambah puncak alokasi per tahap (tracemalloc, overhead lebih besar)
+MODE = os.environ.get("INSTRUMENTATION", "")
+ENABLED = MODE not in ("", "0")
+TRACE_MEMORY = MODE == "memory"
+
+# Snapshot metrik ditulis berkala ke direktori ini (metrics.json & metrics.prom); "" = tidak ditulis
+METRICS_DIR = os.environ.get("INSTRUMENTATION_DIR", 'Data/.cache/metrics')
+DUMP_SECONDS = float(os.environ.get("INSTRUMENTATION_DUMP_SECONDS", 15))
+
+METRIC_PREFIX = 'sentimen'
+
+_NULL_STAGE = nullcontext()
+
+
+class Registry:
+    """
+    Statistik per tahap (jumlah panggilan, total & maksimum waktu, puncak
+    alokasi) dan daftar cache yang statistiknya ikut dilaporkan. Aman
+    dipakai dari banyak thread (sesi Streamlit).
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self._stages = {}
+        self._caches = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def record(self, name, seconds, peak_bytes=None):
+        with self._lock:
+            stats = self._stages.get(name)
+            if stats is None:
+                stats = self._stages[name] = [0, 0.0, 0.0, None]
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+            if peak_bytes is not None:
+                stats[3] = max(stats[3] or 0, peak_bytes)
+
+    def register_cache(self, name, stats_fn):
+        """
+        Args:
+            name (str): Nama cache di laporan.
+            stats_fn (Callable[[], dict]): Fungsi yang mengembalikan minimal 'hits' dan 'misses'.
+        """
+        self._caches[name] = stats_fn
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+            self.started_at = time.time()
+
+    def snapshot(self):
+        """
+        Returns:
+            dict: 'mode', 'uptime_seconds', 'stages' (list per tahap, urut total waktu
+            menurun), dan 'caches' (list statistik per cache).
+        """
+        with self._lock:
+            stages = {name: list(stats) for name, stats in self._stages.items()}
+        rows = [{
+            'stage': name,
+            'calls': calls,
+            'total_ms': total * 1000,
+            'mean_ms': total / calls * 1000,
+            'max_ms': longest * 1000,
+            'peak_kb': peak / 1024 if peak is not None else None,
+        } for name, (calls, total, longest, peak) in stages.items()]
+        rows.sort(key=lambda row: row['total_ms'], reverse=True)
+
+        caches = []
+        for name, stats_fn in list(self._caches.items()):
+            stats = stats_fn()
+            total = stats['hits'] + stats['misses']
+            caches.append({'cache': name, 'hits': stats['hits'], 'misses': stats['misses'],
+                           'hit_ratio': stats['hits'] / total if total else 0.0, 'size': stats.get('size')})
+        return {'mode': MODE or '0', 'uptime_seconds': time.time() - self.started_at, 'stages': rows, 'caches': caches}
+
+
+_registry = Registry()
+
+
+class _Stage:
+    # Context manager pengukur satu tahap; tahap bersarang dihitung di masing-masing tahap
+    __slots__ = ('name', 'start', 'memory_start', 'peak_seen')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        if TRACE_MEMORY:
+            # Puncak global di-reset per tahap; puncak yang sudah tercapai di tahap
+            # luar dicatat dulu agar tidak hilang
+            current, peak = tracemalloc.get_traced_memory()
+            stack = _stage_stack()
+            if stack:
+                stack[-1].peak_seen = max(stack[-1].peak_seen, peak)
+            stack.append(self)
+            tracemalloc.reset_peak()
+            self.memory_start = current
+            self.peak_seen = current
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        seconds = time.perf_counter() - self.start
+        peak_bytes = None
+        if TRACE_MEMORY:
+            peak = tracemalloc.get_traced_memory()[1]
+            stack = _stage_stack()
+            stack.pop()
+            if stack:
+                stack[-1].peak_seen = max(stack[-1].peak_seen, peak)
+            peak_bytes = max(self.peak_seen, peak) - self.memory_start
+        _registry.record(self.name, seconds, peak_bytes)
+        return False
+
+
+def _stage_stack():
+    stack = getattr(_registry._local, 'stack', None)
+    if stack is None:
+        stack = _registry._local.stack = []
+    return stack
+
+
+# ----------------------------------------------------------------------------
+# API
+# ----------------------------------------------------------------------------
+
+def stage(name):
+    """
+    Context manager pengukur satu tahap, mis. ``with stage('preprocess.stem'):``.
+    Saat instrumentasi mati mengembalikan context manager kosong bersama.
+
+    Puncak alokasi (mode "memory") memakai tracemalloc yang global per proses,
+    sehingga bila beberapa sesi berjalan bersamaan nilainya adalah perkiraan atas.
+    """
+    return _Stage(name) if ENABLED else _NULL_STAGE
+
+
+def instrumented(name):
+    """
+    Decorator pengukur fungsi sebagai tahap ``name``. Saat instrumentasi mati
+    fungsi dikembalikan apa adanya (tanpa pembungkus).
+    """
+    def decorate(func):
+        if not ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _Stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def register_cache(name, stats_fn):
+    """Mendaftarkan cache yang hit ratio-nya ikut dilaporkan (lihat ``Registry.register_cache``)."""
+    _registry.register_cache(name, stats_fn)
+
+
+def snapshot():
+    """Statistik saat ini (lihat ``Registry.snapshot``)."""
+    return _registry.snapshot()
+
+
+def reset():
+    """Mengosongkan statistik tahap (statistik cache milik masing-masing cache)."""
+    _registry.reset()
+
+
+def to_prometheus(snap=None):
+    """
+    Snapshot dalam format teks Prometheus (untuk di-scrape atau dibaca langsung).
+
+    Returns:
+        str: Metrik ``sentimen_stage_*`` per tahap dan ``sentimen_cache_*`` per cache.
+    """
+    snap = snap or snapshot()
+    lines = []
+
+    def metric(name, kind, label, rows, field, scale=1.0):
+        lines.append(f"# TYPE {METRIC_PREFIX}_{name} {kind}")
+        for row in rows:
+            if row[field] is not None:
+                lines.append(f'{METRIC_PREFIX}_{name}{{{label}="{row[label]}"}} {row[field] * scale:.6g}')
+
+    stages, caches = snap['stages'], snap['caches']
+    metric('stage_calls_total', 'counter', 'stage', stages, 'calls')
+    metric('stage_seconds_total', 'counter', 'stage', stages, 'total_ms', 1e-3)
+    metric('stage_seconds_max', 'gauge', 'stage', stages, 'max_ms', 1e-3)
+    metric('stage_peak_bytes', 'gauge', 'stage', stages, 'peak_kb', 1024)
+    metric('cache_hits_total', 'counter', 'cache', caches, 'hits')
+    metric('cache_misses_total', 'counter', 'cache', caches, 'misses')
+    metric('cache_hit_ratio', 'gauge', 'cache', caches, 'hit_ratio')
+    metric('cache_size', 'gauge', 'cache', caches, 'size')
+    return '\n'.join(lines) + '\n'
+
+
+def dump(directory=METRICS_DIR):
+    """Menulis snapshot ke ``directory`` sebagai metrics.json dan metrics.prom (atomik)."""
+    if not directory:
+        return
+    snap = snapshot()
+    os.makedirs(directory, exist_ok=True)
+    for name, content in (('metrics.json', json.dumps(snap, indent=2)), ('metrics.prom', to_prometheus(snap))):
+        path = os.path.join(directory, name)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+
+def _dump_periodically():
+    while True:
+        time.sleep(DUMP_SECONDS)
+        dump()
+
+
+if ENABLED:
+    if TRACE_MEMORY and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    # Proses worker (mis. preprocess_pool) tidak menimpa snapshot milik proses utama
+    if METRICS_DIR and multiprocessing.parent_process() is None:
+        threading.Thread(target=_dump_periodically, name='instrumentation-dump', daemon=True).start()
+        atexit.register(dump)
@@ -0,0 +1,76 @@
+import threading
+from collections import Counter
+
+import pandas as pd
+
+from hashtag_matrix import HashtagMatrix
+
+# ----------------------------------------------------------------------------
+# Agregat Dashboard yang Diperbarui Secara Inkremental
+# ----------------------------------------------------------------------------
+
+def _key(value):
+    # NaN/None disamakan agar bisa menjadi kunci dict
+    return None if value is None or value != value else value
+
+
+class LiveAggregates:
+    """
+    Jumlah sentimen (``hitung_jumlah``) dan distribusi sentimen per tokoh
+    yang disimpan sebagai counter, serta matriks dokumen x hashtag
+    (``HashtagMatrix``) untuk frekuensi dan pasangan hashtag.
+
+    Baris baru cukup ditambahkan lewat ``update`` (biaya sebanding dengan
+    jumlah baris baru); hasil query identik dengan menghitung ulang dari
+    dataset lengkap, termasuk urutan hashtag dengan frekuensi sama
+    (urutan kemunculan pertama, seperti ``Counter`` pada baris terfilter).
+
+    Args:
+        df (pd.DataFrame): Dataset awal dengan kolom 'tokoh', 'Sentimen', 'hashtag'.
+    """
+
+    def __init__(self, df):
+        self.n_rows = 0
+        self._sentimen = Counter()
+        self._tokoh_sentimen = Counter()
+        self.hashtags = HashtagMatrix()
+        self._lock = threading.RLock()
+        self.update(df)
+
+    def update(self, df):
+        """Menambahkan baris baru ``df`` (urutan sama dengan di dataset)."""
+        with self._lock:
+            for tokoh, sentimen in zip(df['tokoh'], df['Sentimen']):
+                tokoh, sentimen = _key(tokoh), _key(sentimen)
+                if sentimen is not None:
+                    self._sentimen[sentimen] += 1
+                    if tokoh is not None:
+                        self._tokoh_sentimen[(tokoh, sentimen)] += 1
+            self.hashtags.update(df)
+            self.n_rows += len(df)
+
+    # ---- Query --------------------------------------------------------------
+
+    def sentimen_counts(self):
+        """Setara ``df['Sentimen'].value_counts()``."""
+        with self._lock:
+            return pd.Series(dict(self._sentimen), dtype='int64').sort_values(ascending=False)
+
+    def distribution(self):
+        """Setara ``df.groupby(['tokoh', 'Sentimen']).size().reset_index(name='count')``."""
+        with self._lock:
+            rows = sorted((tokoh, sentimen, count) for (tokoh, sentimen), count in self._tokoh_sentimen.items())
+        return pd.DataFrame(rows, columns=['tokoh', 'Sentimen', 'count'])
+
+    def hashtag_counts(self, sentiment_filter='All', tokoh_filter=None):
+        """
+        Frekuensi hashtag untuk filter yang sama dengan ``plot_hashtag_wordcloud_by_sentiment``.
+
+        Returns:
+            Counter: Hashtag -> frekuensi, berurutan sesuai kemunculan pertama.
+        """
+        return self.hashtags.counts(sentiment_filter, tokoh_filter)
+
+    def hashtag_pairs(self, sentiment_filter='All', tokoh_filter=None, top_n=10):
+        """Pasangan hashtag yang paling sering muncul bersama (lihat ``HashtagMatrix.cooccurring_pairs``)."""
+        return self.hashtags.cooccurring_pairs(sentiment_filter, tokoh_filter, top_n)
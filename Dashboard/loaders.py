@@ -0,0 +1,243 @@
+import hashlib
+import os
+import pickle
+
+import pandas as pd
+
+from instrumentation import instrumented
+
+# ----------------------------------------------------------------------------
+# Loader tanpa Streamlit (dipakai aplikasi maupun skrip CLI/benchmark)
+# ----------------------------------------------------------------------------
+
+DATA_PATH = 'Data/data_cagub_analisis.csv'
+COLUMNAR_DATA_PATH = 'Data/data_cagub_analisis.arrow'
+KAMUS_PATH = 'Data/Kamus Normalisasi.csv'
+MODEL_DIR = 'Model'
+VECTORIZER_PATH = 'Model/best_saved_tfidf_vectorizer.pkl'
+SELECTOR_PATH = 'Model/best_saved_selector.pkl'
+MODEL_PATH = 'Model/best_saved_rf_model.pkl'
+FUSED_MODEL_PATH = 'Model/fused_sentiment_model.pkl'
+
+# Peta label numerik ke string
+LABEL_MAPPING = {2: "Negatif", 0: "Netral", 1: "Positif"}
+
+# Peta nama singkat tokoh ke nama lengkap
+NAME_MAPPING = {
+    'Luluk': 'Luluk Nur Hamidah',
+    'Khofifah': 'Khofifah Indar Parawansa',
+    'Risma': 'Tri Rismaharini'
+}
+
+# Kolom berulang yang disimpan sebagai categorical (hemat memori, groupby/filter lebih cepat)
+CATEGORICAL_COLUMNS = ['tokoh', 'Sentimen', 'username']
+
+
+def file_fingerprint(path):
+    """Sidik jari murah (ukuran + waktu modifikasi) untuk mendeteksi perubahan file."""
+    stat = os.stat(path)
+    return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+
+def model_version(model_dir=MODEL_DIR):
+    """
+    Versi artefak model: sidik jari seluruh file di ``model_dir`` (nama, ukuran,
+    waktu modifikasi). Berubah setiap kali ada file model yang ditambah, diganti, atau dihapus.
+    """
+    try:
+        names = sorted(os.listdir(model_dir))
+    except OSError:
+        return None
+    parts = [f"{name}:{file_fingerprint(os.path.join(model_dir, name))}" for name in names
+             if os.path.isfile(os.path.join(model_dir, name))]
+    return hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest()[:16]
+
+
+def columnar_path(path):
+    """Lokasi salinan Arrow IPC dari sebuah file CSV (nama sama, ekstensi ``.arrow``)."""
+    return os.path.splitext(path)[0] + '.arrow'
+
+
+def append_log_path(path):
+    """Lokasi log tambahan (JSONL, ditulis ``ingest.py``) untuk sebuah dataset."""
+    return os.path.splitext(path)[0] + '.append.jsonl'
+
+
+def read_append_log(path, offset=0):
+    """
+    Membaca baris log tambahan mulai byte ``offset``. Hanya baris yang sudah
+    lengkap (diakhiri newline) yang dibaca, sehingga aman dipanggil saat
+    ``ingest.py`` sedang menulis.
+
+    Returns:
+        tuple: (DataFrame baris baru dengan nama tokoh lengkap, offset berikutnya).
+    """
+    import json
+
+    if not os.path.exists(path):
+        return pd.DataFrame(), 0
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        chunk = f.read()
+    complete = chunk[:chunk.rfind(b'\n') + 1]
+    records = [json.loads(line) for line in complete.decode('utf-8').splitlines() if line.strip()]
+
+    df = pd.DataFrame.from_records(records)
+    if len(df):
+        df['tokoh'] = df['tokoh'].map(NAME_MAPPING)
+    return df, offset + len(complete)
+
+
+def to_categorical(df):
+    """Mengubah ``CATEGORICAL_COLUMNS`` yang ada di ``df`` menjadi categorical (in-place)."""
+    for column in CATEGORICAL_COLUMNS:
+        if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype('category')
+    return df
+
+
+def concat_categorical(frames):
+    """
+    ``pd.concat`` yang mempertahankan ``CATEGORICAL_COLUMNS`` sebagai categorical
+    (gabungan kategori), bukan jatuh ke object saat kategorinya berbeda.
+    """
+    from pandas.api.types import union_categoricals
+
+    df = pd.concat(frames, ignore_index=True)
+    for column in CATEGORICAL_COLUMNS:
+        if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            parts = [(frame[column] if column in frame.columns else pd.Series([None] * len(frame), dtype=object))
+                     .astype('category') for frame in frames]
+            df[column] = union_categoricals(parts, ignore_order=True)
+    return df
+
+
+def write_columnar(df, path=COLUMNAR_DATA_PATH):
+    """
+    Menyimpan dataset dalam format Arrow IPC tanpa kompresi, dengan kolom
+    categorical sebagai dictionary, sehingga bisa dibaca lewat memory map.
+
+    Args:
+        df (pd.DataFrame): Dataset analisis.
+        path (str): File tujuan (ditulis secara atomik).
+    """
+    import pyarrow as pa
+
+    # Satu chunk per kolom agar buffer yang dipetakan bersebelahan
+    table = pa.Table.from_pandas(to_categorical(df.copy()), preserve_index=False).combine_chunks()
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with pa.OSFile(tmp_path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp_path, path)
+
+
+def read_columnar(path=COLUMNAR_DATA_PATH, memory_map=True):
+    """
+    Membaca dataset Arrow IPC. Dengan ``memory_map=True`` buffer kolom
+    dipetakan langsung dari file (page cache OS), bukan disalin ke heap.
+
+    Returns:
+        pd.DataFrame: Dataset dengan kolom categorical.
+    """
+    import pyarrow as pa
+
+    source = pa.memory_map(path, 'r') if memory_map else pa.OSFile(path, 'rb')
+    with source:
+        table = pa.ipc.open_file(source).read_all()
+    return table.to_pandas()
+
+
+@instrumented('load_data')
+def read_data(path=DATA_PATH):
+    """
+    Membaca dataset analisis dan mengganti nama singkat tokoh dengan nama lengkap.
+
+    Jika ``path`` berupa CSV dan salinan ``.arrow`` yang tidak lebih tua dari
+    CSV tersedia (ditulis oleh ``build_dataset.py``), salinan Arrow yang
+    dibaca lewat memory map. Kolom 'tokoh', 'Sentimen', dan 'username'
+    selalu bertipe categorical.
+
+    Returns:
+        pd.DataFrame: Dataset analisis sentimen.
+    """
+    arrow_path = path if path.endswith('.arrow') else columnar_path(path)
+    if os.path.exists(arrow_path) and (arrow_path == path or os.path.getmtime(arrow_path) >= os.path.getmtime(path)):
+        df = read_columnar(arrow_path)
+    else:
+        df = to_categorical(pd.read_csv(path))
+    df['tokoh'] = df['tokoh'].map(NAME_MAPPING)
+    return df
+
+
+@instrumented('load_kamus')
+def read_kamus(path=KAMUS_PATH):
+    """
+    Membaca kamus normalisasi kata alay beserta koreksi manual.
+
+    Args:
+        path (str): Lokasi file CSV kamus (tanpa header, kolom: alay, arti).
+
+    Returns:
+        dict: Pemetaan kata alay -> kata baku, urut sesuai isi file.
+    """
+    df_kamus = pd.read_csv(path, encoding='ISO-8859-1', header=None)
+    df_kamus.columns = ['Alay', 'Meaning']
+    norm_dict = dict(zip(df_kamus.Alay, df_kamus.Meaning))
+
+    # Update manual untuk kata-kata khusus
+    norm_dict.update({
+        'p': 'perjuangan',
+        'iniiii': 'ini',
+        'bauuuuu': 'bau',
+        'anake': 'anak',
+        'ibuibu': 'ibu ibu',
+        'nu': 'nahdlatul ulama',
+        'pragib': 'prabowo gibran',
+        'dahal': 'padahal',
+        'lagiiiii': 'lagi',
+        'kopipa': 'khofifah',
+        'kopipah': 'khofifah',
+        'khopipah': 'khofifah',
+        'hopipah': 'khofifah'
+    })
+
+    return norm_dict
+
+
+@instrumented('load_model')
+def read_model(vectorizer_path=VECTORIZER_PATH, selector_path=SELECTOR_PATH, model_path=MODEL_PATH,
+               fused_path=FUSED_MODEL_PATH):
+    """
+    Memuat TF-IDF vectorizer, selektor fitur Mutual Information, dan model Random Forest.
+
+    Jika artefak gabungan ``fused_path`` (hasil ``fused_model.py``) ada dan
+    tidak lebih tua dari ketiga pickle sumbernya, artefak itu yang dimuat:
+    vectorizer-nya langsung menghasilkan fitur terpilih dan selektornya
+    hanya meneruskan matriks.
+
+    Dengan environment ``COMPILED_FOREST=1`` model Random Forest dibungkus
+    ``CompiledForest`` (evaluator array NumPy) agar prediksi satu teks atau
+    batch kecil lebih cepat; batch besar tetap memakai model asal.
+
+    Returns:
+        tuple: (vectorizer, fselector, model)
+    """
+    if fused_path and os.path.exists(fused_path):
+        fused_mtime = os.path.getmtime(fused_path)
+        sources = (vectorizer_path, selector_path, model_path)
+        if all(not os.path.exists(path) or os.path.getmtime(path) <= fused_mtime for path in sources):
+            with open(fused_path, "rb") as f:
+                return _maybe_compile(*pickle.load(f).components())
+
+    with open(vectorizer_path, "rb") as f_vec, open(selector_path, "rb") as f_select, open(model_path, "rb") as f_model:
+        vectorizer = pickle.load(f_vec)
+        fselector = pickle.load(f_select)
+        model = pickle.load(f_model)
+    return _maybe_compile(vectorizer, fselector, model)
+
+
+def _maybe_compile(vectorizer, fselector, model):
+    if os.environ.get("COMPILED_FOREST") == "1" and hasattr(model, 'estimators_'):
+        from compiled_forest import CompiledForest
+        model = CompiledForest.from_sklearn(model)
+    return vectorizer, fselector, model
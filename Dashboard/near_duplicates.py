@@ -0,0 +1,184 @@
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+from loaders import DATA_PATH, read_data
+
+# ----------------------------------------------------------------------------
+# Deteksi Tweet Hampir Duplikat (MinHash + LSH)
+# ----------------------------------------------------------------------------
+
+# 64 permutasi MinHash dibagi 16 band x 4 baris: pasangan dengan kemiripan Jaccard
+# 0.8 menjadi kandidat dengan peluang > 99.9%, lalu diverifikasi dengan signature
+NUM_PERM = 64
+BANDS = 16
+SIMILARITY_THRESHOLD = 0.8
+
+# Shingle = dua kata berurutan (teks satu kata memakai kata itu sendiri)
+SHINGLE_SIZE = 2
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+
+def dedup_version(threshold=SIMILARITY_THRESHOLD, num_perm=NUM_PERM, bands=BANDS):
+    """Penanda parameter deduplikasi (bagian dari fingerprint data hasil deduplikasi)."""
+    return f"minhash-{num_perm}x{bands}-{threshold}"
+
+
+def _shingle_hashes(texts):
+    # (posisi dokumen, hash 32-bit shingle) untuk seluruh teks, terurut per dokumen
+    tokens = pd.Series(list(texts), dtype=object).fillna('').str.split().explode().dropna()
+    docs = tokens.index.to_numpy(np.int64)
+    token_hashes = pd.util.hash_array(tokens.to_numpy(dtype=object))
+    if len(docs) == 0:
+        return docs, token_hashes
+
+    # Shingle dua kata: gabungan hash dua token berurutan di dokumen yang sama
+    same_doc = docs[:-1] == docs[1:]
+    with np.errstate(over='ignore'):
+        pairs = pd.util.hash_array((token_hashes[:-1] * _MIX) ^ token_hashes[1:])
+    first = np.r_[True, ~same_doc]
+    last = np.r_[~same_doc, True]
+    single = first & last
+
+    docs = np.concatenate([docs[:-1][same_doc], docs[single]])
+    hashes = np.concatenate([pairs[same_doc], token_hashes[single]])
+    order = np.argsort(docs, kind='stable')
+    return docs[order], hashes[order] & _MAX_HASH
+
+
+def minhash_signatures(texts, num_perm=NUM_PERM, seed=1):
+    """
+    Signature MinHash setiap teks (shingle dua kata).
+
+    Args:
+        texts (iterable[str]): Teks bersih (token dipisahkan spasi).
+        num_perm (int): Jumlah fungsi hash.
+        seed (int): Seed koefisien hash (hasil deterministik).
+
+    Returns:
+        tuple: (signature ``np.ndarray`` (n_dokumen_berisi, num_perm), posisi dokumen yang
+        memiliki minimal satu shingle). Teks kosong tidak memiliki signature.
+    """
+    docs, hashes = _shingle_hashes(texts)
+    doc_ids, starts = np.unique(docs, return_index=True)
+
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, int(_MAX_HASH), size=num_perm, dtype=np.uint64)
+    b = rng.integers(0, int(_MAX_HASH), size=num_perm, dtype=np.uint64)
+
+    signatures = np.empty((len(doc_ids), num_perm), dtype=np.uint64)
+    for i in range(num_perm):
+        # (a * h + b) mod p tidak overflow: a, b, h < 2^32
+        permuted = ((a[i] * hashes + b[i]) % _MERSENNE_PRIME) & _MAX_HASH
+        signatures[:, i] = np.minimum.reduceat(permuted, starts) if len(starts) else permuted[:0]
+    return signatures, doc_ids
+
+
+def cluster_near_duplicates(texts, threshold=SIMILARITY_THRESHOLD, num_perm=NUM_PERM, bands=BANDS, seed=1):
+    """
+    Mengelompokkan teks yang hampir sama (estimasi Jaccard shingle >= ``threshold``).
+
+    Setiap band signature di-hash menjadi bucket (hash table, linear); setiap
+    anggota bucket dibandingkan dengan anggota pertama bucket itu, dan
+    pasangan yang lolos verifikasi signature menjadi sisi graf. Klaster =
+    komponen terhubung graf tersebut.
+
+    Args:
+        texts (iterable[str]): Teks bersih, mis. kolom 'clean_text'.
+        threshold (float): Batas kemiripan Jaccard hasil estimasi MinHash.
+        num_perm (int): Jumlah fungsi hash MinHash.
+        bands (int): Jumlah band LSH (``num_perm`` harus habis dibagi ``bands``).
+        seed (int): Seed koefisien hash.
+
+    Returns:
+        tuple: (cluster_id, cluster_size) berupa ``np.ndarray`` sepanjang input.
+        ``cluster_id`` adalah posisi baris pertama di klaster (baris wakil).
+    """
+    texts = list(texts)
+    n_rows = len(texts)
+    signatures, doc_ids = minhash_signatures(texts, num_perm=num_perm, seed=seed)
+    n_docs = len(doc_ids)
+    rows_per_band = num_perm // bands
+
+    # 1. Kandidat per band: setiap dokumen -> dokumen pertama di bucket yang sama
+    sources, targets = [], []
+    for band in range(bands):
+        band_values = pd.DataFrame(signatures[:, band * rows_per_band:(band + 1) * rows_per_band])
+        codes, _ = pd.factorize(pd.util.hash_pandas_object(band_values, index=False).to_numpy())
+        # factorize memberi kode sesuai urutan kemunculan: kemunculan pertama = kode baru
+        first_of_code = np.flatnonzero(np.r_[True, codes[1:] > np.maximum.accumulate(codes)[:-1]])
+        representative = first_of_code[codes]
+        candidates = np.flatnonzero(representative != np.arange(n_docs))
+        sources.append(candidates)
+        targets.append(representative[candidates])
+    sources = np.concatenate(sources) if sources else np.empty(0, np.int64)
+    targets = np.concatenate(targets) if targets else np.empty(0, np.int64)
+
+    # 2. Verifikasi: estimasi Jaccard = proporsi nilai signature yang sama
+    if len(sources):
+        similar = (signatures[sources] == signatures[targets]).mean(axis=1) >= threshold
+        sources, targets = sources[similar], targets[similar]
+
+    # 3. Komponen terhubung, diberi id baris pertama (teks kosong = klaster sendiri)
+    graph = coo_matrix((np.ones(len(sources), dtype=np.int8), (sources, targets)), shape=(n_docs, n_docs))
+    _, labels = connected_components(graph, directed=False)
+    cluster_id = np.arange(n_rows)
+    first_doc = pd.Series(doc_ids).groupby(labels).transform('min').to_numpy()
+    cluster_id[doc_ids] = first_doc
+    cluster_size = np.bincount(cluster_id, minlength=n_rows)[cluster_id]
+    return cluster_id, cluster_size
+
+
+def add_cluster_columns(df, column='clean_text', **kwargs):
+    """
+    Menambahkan kolom 'cluster_id' dan 'cluster_size' (lihat ``cluster_near_duplicates``).
+
+    Returns:
+        pd.DataFrame: DataFrame baru; ``df`` tidak diubah.
+    """
+    cluster_id, cluster_size = cluster_near_duplicates(df[column], **kwargs)
+    return df.assign(cluster_id=cluster_id, cluster_size=cluster_size)
+
+
+def deduplicate(df):
+    """
+    Satu baris wakil (yang pertama) per klaster untuk setiap tokoh, sehingga
+    tweet yang sama tetap dihitung sekali untuk masing-masing tokoh.
+
+    Args:
+        df (pd.DataFrame): Hasil ``add_cluster_columns``.
+    """
+    return df[~df.duplicated(['cluster_id', 'tokoh'])].reset_index(drop=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mengelompokkan tweet hampir duplikat pada dataset analisis.")
+    parser.add_argument('--data', default=DATA_PATH)
+    parser.add_argument('--output', help="Tulis dataset beserta kolom 'cluster_id' dan 'cluster_size' (CSV)")
+    parser.add_argument('--threshold', type=float, default=SIMILARITY_THRESHOLD)
+    args = parser.parse_args()
+
+    df = read_data(args.data)
+    start = time.perf_counter()
+    clustered = add_cluster_columns(df, threshold=args.threshold)
+    elapsed = time.perf_counter() - start
+    deduplicated = deduplicate(clustered)
+
+    print(f"{len(df):,} tweet -> {len(deduplicated):,} setelah deduplikasi "
+          f"({1 - len(deduplicated) / len(df):.1%} lebih kecil, "
+          f"{(clustered['cluster_size'] > 1).sum():,} tweet berada di klaster duplikat) "
+          f"dalam {elapsed:.2f} detik", file=sys.stderr)
+    if args.output:
+        clustered.to_csv(args.output, index=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,285 @@
+import argparse
+import json
+import os
+import re
+import shutil
+import threading
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from loaders import DATA_PATH, file_fingerprint, read_data
+
+# ----------------------------------------------------------------------------
+# Indeks Frekuensi N-gram
+# ----------------------------------------------------------------------------
+
+NGRAM_INDEX_DIR = 'Data/.cache/ngram_index'
+SENTIMEN_LIST = ['Positif', 'Netral', 'Negatif']
+NGRAM_SIZES = {'unigram': 1, 'bigram': 2, 'trigram': 3}
+
+
+def ngram_tokens(texts):
+    """Token kolom 'joined_swremove' yang digabung menjadi satu aliran (tokenisasi ``count_ngrams``)."""
+    cleaned = texts.apply(lambda x: re.sub(r"[\[\]',]", '', x) if isinstance(x, str) else x)
+    return ' '.join(cleaned.astype(str)).split()
+
+
+def count_ngrams(texts, n):
+    """
+    Menghitung frekuensi n-gram dengan tokenisasi yang sama seperti
+    ``visualize_ngram_frequency`` (teks digabung lalu dipecah per spasi).
+
+    Args:
+        texts (pd.Series): Kolom 'joined_swremove'.
+        n (int): Ukuran n-gram.
+
+    Returns:
+        Counter: Frekuensi tiap n-gram.
+    """
+    tokens = ngram_tokens(texts)
+    return Counter(' '.join(ng) for ng in zip(*[tokens[i:] for i in range(n)]))
+
+
+def _sorted_table(counts):
+    # Urut frekuensi menurun, lalu alfabetis: sama dengan nlargest(keep='first') pada hasil groupby
+    items = sorted(counts.items(), key=lambda x: (-x[1], x[0]))
+    ngrams = np.array([ng for ng, _ in items], dtype=str)
+    freqs = np.array([freq for _, freq in items], dtype=np.int64)
+    return ngrams, freqs
+
+
+def _slug(text):
+    return re.sub(r'[^a-z0-9]+', '_', str(text).lower()).strip('_')
+
+
+class NgramIndex:
+    """
+    Tabel frekuensi n-gram per (tokoh, Sentimen, n) yang dibangun sekali dan
+    disimpan di disk (satu file ``.npz`` per tabel, sudah terurut).
+
+    Tabel dimuat secara lazy saat pertama diminta, sehingga grafik top-N
+    cukup mengambil potongan awal tabel tanpa tokenisasi ulang.
+    Selain tiga kelas sentimen, disimpan juga tabel gabungan 'All'.
+
+    Baris baru (lihat ``ingest.py``) ditambahkan lewat ``update`` tanpa
+    membangun ulang: selisih frekuensinya disimpan terpisah dan baru
+    digabung ke tabel saat tabel itu diminta.
+    """
+
+    def __init__(self, index_dir, manifest):
+        self.index_dir = index_dir
+        self.manifest = manifest
+        self._tables = {}
+        self._pending = {}
+        self._tails = None
+        self._lock = threading.Lock()
+
+    @property
+    def fingerprint(self):
+        return self.manifest['fingerprint']
+
+    # ---- Build & load -------------------------------------------------------
+
+    @classmethod
+    def build(cls, df, index_dir=NGRAM_INDEX_DIR, fingerprint=None):
+        """
+        Membangun seluruh tabel dari DataFrame dan menyimpannya ke ``index_dir``.
+
+        Args:
+            df (pd.DataFrame): Dataset dengan kolom 'tokoh', 'Sentimen', 'joined_swremove'.
+            index_dir (str): Direktori tujuan (isi lama diganti).
+            fingerprint (str | None): Sidik jari file sumber.
+
+        Returns:
+            NgramIndex: Indeks yang baru dibangun.
+        """
+        tmp_dir = f"{index_dir}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+
+        files = {}
+        for tokoh, df_tokoh in df.groupby('tokoh', sort=False):
+            for n in NGRAM_SIZES.values():
+                total = Counter()
+                for label in SENTIMEN_LIST:
+                    counts = count_ngrams(df_tokoh.loc[df_tokoh['Sentimen'] == label, 'joined_swremove'], n)
+                    total.update(counts)
+                    files[cls._key(tokoh, label, n)] = cls._save_table(tmp_dir, tokoh, label, n, counts)
+                files[cls._key(tokoh, 'All', n)] = cls._save_table(tmp_dir, tokoh, 'All', n, total)
+
+        manifest = {'fingerprint': fingerprint, 'files': files}
+        with open(os.path.join(tmp_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False)
+
+        shutil.rmtree(index_dir, ignore_errors=True)
+        os.replace(tmp_dir, index_dir)
+        return cls(index_dir, manifest)
+
+    @staticmethod
+    def _key(tokoh, sentimen, n):
+        return f"{tokoh}|{sentimen}|{n}"
+
+    @staticmethod
+    def _save_table(index_dir, tokoh, sentimen, n, counts):
+        filename = f"{_slug(tokoh)}_{_slug(sentimen)}_{n}.npz"
+        ngrams, freqs = _sorted_table(counts)
+        np.savez_compressed(os.path.join(index_dir, filename), ngrams=ngrams, freqs=freqs)
+        return filename
+
+    @classmethod
+    def load(cls, index_dir=NGRAM_INDEX_DIR):
+        """Membuka indeks yang sudah ada (hanya manifest; tabel dimuat lazy)."""
+        with open(os.path.join(index_dir, 'manifest.json'), encoding='utf-8') as f:
+            return cls(index_dir, json.load(f))
+
+    @classmethod
+    def open(cls, data_path=DATA_PATH, index_dir=NGRAM_INDEX_DIR):
+        """
+        Membuka indeks untuk ``data_path``, membangun ulang otomatis jika indeks
+        belum ada atau file data sudah berubah.
+        """
+        return cls.open_frame(lambda: read_data(data_path), file_fingerprint(data_path), index_dir=index_dir)
+
+    @classmethod
+    def open_frame(cls, load_df, fingerprint, index_dir=NGRAM_INDEX_DIR):
+        """
+        Membuka indeks di ``index_dir`` jika fingerprint-nya sama dengan
+        ``fingerprint``; jika tidak, indeks dibangun dari ``load_df()``. Dipakai
+        juga untuk dataset turunan tanpa file sendiri (mis. hasil deduplikasi).
+        """
+        try:
+            index = cls.load(index_dir)
+            if index.fingerprint == fingerprint:
+                return index
+        except (OSError, ValueError, KeyError):
+            pass
+        return cls.build(load_df(), index_dir=index_dir, fingerprint=fingerprint)
+
+    def table(self, tokoh, sentimen, n):
+        """
+        Tabel frekuensi terurut untuk satu kombinasi (dimuat dari disk saat pertama diminta).
+
+        Returns:
+            pd.Series: Frekuensi dengan index n-gram, terurut menurun.
+        """
+        key = self._key(tokoh, sentimen, n)
+        table = self._tables.get(key)
+        if table is None or key in self._pending:
+            with self._lock:
+                table = self._tables.get(key)
+                if table is None:
+                    filename = self.manifest['files'].get(key)
+                    if filename is None:
+                        table = pd.Series(dtype=np.int64)
+                    else:
+                        with np.load(os.path.join(self.index_dir, filename)) as data:
+                            table = pd.Series(data['freqs'], index=data['ngrams'])
+
+                # Gabungkan frekuensi baris baru, lalu urutkan ulang (tabel lama tidak diubah)
+                pending = self._pending.pop(key, None)
+                if pending:
+                    counts = Counter(dict(zip(table.index.tolist(), table.tolist())))
+                    counts.update(pending)
+                    ngrams, freqs = _sorted_table(counts)
+                    table = pd.Series(freqs, index=ngrams)
+                self._tables[key] = table
+        return table
+
+    # ---- Update inkremental -------------------------------------------------
+
+    def follow(self, df):
+        """
+        Menandai ``df`` sebagai isi indeks saat ini, sebagai titik awal ``update``.
+
+        N-gram dihitung dari aliran token per (tokoh, Sentimen) yang digabung,
+        sehingga n-gram bisa melintasi batas dua tweet; untuk itu disimpan
+        ``max(n) - 1`` token terakhir setiap aliran.
+        """
+        keep = max(NGRAM_SIZES.values()) - 1
+        tails = {}
+        for (tokoh, label), texts in df.groupby(['tokoh', 'Sentimen'], observed=True, sort=False)['joined_swremove']:
+            # Cukup beberapa baris terakhir (diperlebar jika barisnya kosong)
+            rows = keep
+            while True:
+                tokens = ngram_tokens(texts.iloc[-rows:])
+                if len(tokens) >= keep or rows >= len(texts):
+                    break
+                rows *= 2
+            tails[(tokoh, label)] = tokens[-keep:]
+        self._tails = tails
+
+    def update(self, df):
+        """
+        Menambahkan frekuensi n-gram dari baris baru ``df`` (urutan sama dengan
+        di dataset). Hasilnya identik dengan membangun ulang indeks dari
+        dataset lama + ``df``; biayanya sebanding dengan jumlah baris baru.
+
+        Raises:
+            RuntimeError: Jika ``follow`` belum dipanggil.
+        """
+        if self._tails is None:
+            raise RuntimeError("Panggil follow(df) dengan dataset saat ini sebelum update()")
+
+        keep = max(NGRAM_SIZES.values()) - 1
+        deltas = {}
+        for (tokoh, label), texts in df.groupby(['tokoh', 'Sentimen'], observed=True, sort=False)['joined_swremove']:
+            tail = self._tails.get((tokoh, label), [])
+            tokens = tail + ngram_tokens(texts)
+            for n in NGRAM_SIZES.values():
+                # Hanya n-gram yang memuat minimal satu token baru
+                start = max(len(tail) - (n - 1), 0)
+                counts = Counter(' '.join(ng) for ng in zip(*[tokens[start + i:] for i in range(n)]))
+                deltas.setdefault(self._key(tokoh, label, n), Counter()).update(counts)
+                deltas.setdefault(self._key(tokoh, 'All', n), Counter()).update(counts)
+            self._tails[(tokoh, label)] = tokens[-keep:]
+
+        with self._lock:
+            for key, counts in deltas.items():
+                self._pending.setdefault(key, Counter()).update(counts)
+
+    # ---- Query --------------------------------------------------------------
+
+    def top_ngrams(self, tokoh, sentimen='All', ngram='unigram', top_n=10):
+        """
+        Mengambil top-N n-gram dalam format ``ngram_df`` milik ``visualize_ngram_frequency``.
+
+        Returns:
+            pd.DataFrame: Kolom 'n-gram', 'Frekuensi', 'Sentimen'.
+        """
+        if ngram not in NGRAM_SIZES:
+            raise ValueError("ngram harus salah satu dari: 'unigram', 'bigram', atau 'trigram'")
+        n = NGRAM_SIZES[ngram]
+
+        sentimen_list = SENTIMEN_LIST if sentimen == 'All' else [sentimen]
+        top_index = self.table(tokoh, sentimen, n).index[:top_n]
+
+        frames = []
+        for label in sentimen_list:
+            freqs = self.table(tokoh, label, n).reindex(top_index).dropna()
+            frames.append(pd.DataFrame({
+                'n-gram': freqs.index,
+                'Frekuensi': freqs.values.astype(np.int64),
+                'Sentimen': label
+            }))
+        return pd.concat(frames, ignore_index=True)
+
+
+# ----------------------------------------------------------------------------
+# CLI: build indeks
+# ----------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Membangun indeks frekuensi n-gram untuk dashboard.")
+    parser.add_argument('--data', default=DATA_PATH)
+    parser.add_argument('--output', default=NGRAM_INDEX_DIR)
+    args = parser.parse_args()
+
+    index = NgramIndex.build(read_data(args.data), index_dir=args.output,
+                             fingerprint=file_fingerprint(args.data))
+    print(f"{len(index.manifest['files'])} tabel n-gram disimpan di {args.output}")
+
+
+if __name__ == '__main__':
+    main()
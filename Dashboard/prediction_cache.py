@@ -0,0 +1,115 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+# ----------------------------------------------------------------------------
+# Cache Hasil Prediksi Bersama
+# ----------------------------------------------------------------------------
+
+# Jumlah maksimum hasil prediksi yang disimpan
+PREDICTION_CACHE_SIZE = 10_000
+
+
+def text_key(clean_text, version):
+    """Kunci cache: versi artefak model + hash teks hasil preprocessing."""
+    digest = hashlib.blake2b(clean_text.encode('utf-8'), digest_size=16).hexdigest()
+    return version, digest
+
+
+class PredictionCache:
+    """
+    Cache hasil prediksi (LRU, terbatas) yang dipakai bersama oleh seluruh
+    sesi dalam satu proses.
+
+    Retweet dan slogan yang identik setelah ``preprocess_tweet`` cukup
+    diprediksi sekali: kunci cache adalah hash teks hasil preprocessing
+    beserta versi artefak model (``loaders.model_version``), sehingga hasil
+    dari model lama tidak pernah dipakai lagi setelah isi ``Model/`` berubah.
+
+    Args:
+        maxsize (int): Jumlah maksimum hasil yang disimpan.
+    """
+
+    def __init__(self, maxsize=PREDICTION_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.saved_seconds = 0.0
+        self.miss_seconds = 0.0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def predict(self, predictor, text, version):
+        """
+        Memprediksi satu teks mentah, memakai hasil tersimpan jika teks hasil
+        preprocessing-nya sudah pernah diprediksi dengan versi model yang sama.
+
+        Args:
+            predictor (SentimentPredictor): Predictor untuk ``version``.
+            text (str): Teks tweet/pendapat pengguna.
+            version (str): Versi artefak model milik ``predictor``.
+
+        Returns:
+            dict: Format sama dengan ``SentimentPredictor.predict``.
+        """
+        clean_text = predictor.preprocess(text)
+        if clean_text is None:
+            return predictor.predict_clean([None])[0]
+
+        key = text_key(clean_text, version)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                result, seconds = entry
+                self.hits += 1
+                self.saved_seconds += seconds
+                return _copy(result)
+
+        # Vektorisasi dan prediksi di luar lock agar sesi lain tidak ikut menunggu
+        start = time.perf_counter()
+        result = predictor.predict_clean([clean_text])[0]
+        seconds = time.perf_counter() - start
+
+        with self._lock:
+            self.misses += 1
+            self.miss_seconds += seconds
+            self._entries[key] = (_copy(result), seconds)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self):
+        """Mengosongkan cache (statistik tetap), mis. setelah artefak model berubah."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Statistik pemakaian cache.
+
+        Returns:
+            dict: hits, misses, hit_ratio, size, maxsize, saved_seconds (total
+            waktu vektorisasi + prediksi yang dilewati berkat hit), dan
+            miss_ms (rata-rata waktu prediksi saat miss).
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / total if total else 0.0,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'saved_seconds': self.saved_seconds,
+            'miss_ms': self.miss_seconds / self.misses * 1000 if self.misses else 0.0,
+        }
+
+
+def _copy(result):
+    # Salinan agar hasil tersimpan tidak ikut berubah jika pemanggil memodifikasinya
+    return {**result, 'confidence': dict(result['confidence'])}
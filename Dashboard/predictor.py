@@ -0,0 +1,115 @@
+import numpy as np
+
+from instrumentation import stage
+from loaders import LABEL_MAPPING
+from text_preprocessing import preprocess_tweet
+
+# ----------------------------------------------------------------------------
+# Sentiment Predictor
+# ----------------------------------------------------------------------------
+
+class SentimentPredictor:
+    """
+    API prediksi sentimen yang membungkus keluaran ``load_model()`` dan
+    ``preprocess_tweet``.
+
+    Label diambil dari argmax satu kali ``predict_proba`` sehingga forest
+    hanya ditelusuri sekali per permintaan.
+
+    Args:
+        vectorizer, fselector, model: Keluaran ``load_model()``.
+        normalizer (KamusNormalizer | None): Normalisasi kata.
+        stop_words_remover (StopWordRemover | None): Penghapus stopword.
+        stemmer: Objek dengan method ``stem(word)``, mis. StemCache.
+            Komponen preprocessing yang None dibangun saat pertama dibutuhkan.
+    """
+
+    def __init__(self, vectorizer, fselector, model, normalizer=None, stop_words_remover=None, stemmer=None):
+        self.vectorizer = vectorizer
+        self.fselector = fselector
+        self.model = model
+        self.normalizer = normalizer
+        self.stop_words_remover = stop_words_remover
+        self.stemmer = stemmer
+        self.labels = [LABEL_MAPPING[int(lbl)] for lbl in model.classes_]
+
+    def _ensure_preprocessing(self):
+        if self.normalizer is None:
+            from loaders import read_kamus
+            from text_preprocessing import KamusNormalizer
+            self.normalizer = KamusNormalizer(read_kamus())
+        if self.stop_words_remover is None:
+            from text_preprocessing import build_stop_words_remover
+            self.stop_words_remover = build_stop_words_remover()
+        if self.stemmer is None:
+            from stem_cache import create_stem_cache
+            self.stemmer = create_stem_cache(path=None)
+
+    def preprocess(self, text):
+        """Menjalankan ``preprocess_tweet``; None jika teks kosong setelah diproses."""
+        if not isinstance(text, str):
+            return None
+        self._ensure_preprocessing()
+        return preprocess_tweet(text, self.normalizer, self.stop_words_remover, self.stemmer)
+
+    def predict_proba_clean(self, clean_texts):
+        """
+        Menghitung probabilitas kelas untuk teks yang sudah dipreprocessing.
+
+        Args:
+            clean_texts (list[str]): Teks bersih (tanpa None).
+
+        Returns:
+            np.ndarray: Matriks probabilitas (n_teks, n_kelas) sesuai urutan ``labels``.
+        """
+        with stage('predict.vectorize'):
+            selected = self.fselector.transform(self.vectorizer.transform(clean_texts))
+        if hasattr(self.model, "predict_proba"):
+            with stage('predict.model'):
+                return self.model.predict_proba(selected)
+
+        # Model tanpa predict_proba: kelas terprediksi diberi keyakinan penuh
+        predicted = self.model.predict(selected)
+        return (np.asarray(predicted)[:, None] == self.model.classes_[None, :]).astype(float)
+
+    def predict_clean(self, clean_texts):
+        """
+        Memprediksi label dan confidence untuk daftar teks bersih (boleh berisi None).
+
+        Returns:
+            list[dict]: Lihat ``predict``.
+        """
+        results = [self._empty_result() for _ in clean_texts]
+        valid = [i for i, text in enumerate(clean_texts) if text is not None]
+        if not valid:
+            return results
+
+        probas = self.predict_proba_clean([clean_texts[i] for i in valid])
+        for i, row in zip(valid, probas):
+            confidence = {label: round(float(prob) * 100, 2) for label, prob in zip(self.labels, row)}
+            results[i] = {
+                'label': self.labels[int(row.argmax())],
+                'confidence': dict(sorted(confidence.items(), key=lambda x: x[1], reverse=True)),
+                'clean_text': clean_texts[i],
+            }
+        return results
+
+    def predict(self, texts):
+        """
+        Memprediksi sentimen satu teks atau daftar teks mentah.
+
+        Args:
+            texts (str | list[str]): Teks tweet/pendapat pengguna.
+
+        Returns:
+            dict | list[dict]: ``{'label', 'confidence', 'clean_text'}`` dengan
+            confidence dalam persen, terurut dari skor tertinggi. Jika hasil
+            preprocessing kosong, label bernilai None dan confidence kosong.
+        """
+        if isinstance(texts, str):
+            return self.predict([texts])[0]
+        return self.predict_clean([self.preprocess(text) for text in texts])
+
+    @staticmethod
+    def _empty_result():
+        return {'label': None, 'confidence': {}, 'clean_text': None}
@@ -0,0 +1,113 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from loaders import read_kamus
+from stem_cache import STEM_CACHE_PATH, create_stem_cache
+from text_preprocessing import (KamusNormalizer, build_stop_words_remover, clean_text, clean_text_series, filter_and_stem,
+                                filter_and_stem_series)
+
+# ----------------------------------------------------------------------------
+# Preprocessing Paralel (Process Pool)
+# ----------------------------------------------------------------------------
+
+# Objek preprocessing milik masing-masing worker, dibangun sekali oleh init_worker
+_worker = {}
+
+
+def init_worker(stem_cache_path=STEM_CACHE_PATH):
+    """Membangun normalizer, stopword remover, dan stemmer untuk proses ini."""
+    stemmer = create_stem_cache(path=None)
+    if stem_cache_path and os.path.exists(stem_cache_path):
+        stemmer.load(stem_cache_path)
+
+    _worker['normalizer'] = KamusNormalizer(read_kamus())
+    _worker['stop_words_remover'] = build_stop_words_remover()
+    _worker['stemmer'] = stemmer
+
+
+def preprocess_text(text):
+    """``preprocess_tweet`` dengan objek milik worker; None untuk nilai non-string."""
+    return preprocess_stages(text)[1]
+
+
+def preprocess_stages(text):
+    """
+    Menjalankan preprocessing dan mengembalikan hasil antara serta hasil akhir.
+
+    Returns:
+        tuple: (teks bersih ternormalisasi, teks akhir atau None).
+    """
+    if not isinstance(text, str):
+        return '', None
+    normalized = _worker['normalizer'].normalize(clean_text(text))
+    return normalized, filter_and_stem(normalized, _worker['stop_words_remover'], _worker['stemmer'])
+
+
+def preprocess_batch(texts):
+    """Versi batch ``preprocess_text`` (list teks -> list hasil), hasil identik per baris."""
+    return [final for _, final in preprocess_stages_batch(texts)]
+
+
+def preprocess_stages_batch(texts):
+    """
+    Versi batch ``preprocess_stages``: cleaning tervektorisasi, lalu stopword
+    removal dan stemming sekaligus untuk seluruh potongan (lihat ``preprocess_series``).
+
+    Returns:
+        list[tuple]: (teks bersih ternormalisasi, teks akhir atau None) per teks.
+    """
+    normalizer = _worker['normalizer']
+    normalized = clean_text_series(texts).map(lambda text: normalizer.normalize(text) if text is not None else '')
+    final = filter_and_stem_series(normalized, _worker['stop_words_remover'], _worker['stemmer'])
+    return list(zip(normalized, final))
+
+
+class PreprocessPool:
+    """
+    Menjalankan fungsi preprocessing tingkat modul di banyak core: per teks
+    (``preprocess_text``, ``preprocess_stages``) lewat ``map``, atau per
+    potongan (``preprocess_batch``, ``preprocess_stages_batch``) lewat ``map_batches``.
+
+    Args:
+        workers (int | None): Jumlah worker process; default seluruh core.
+            Nilai 1 menjalankan preprocessing di proses utama.
+        stem_cache_path (str | None): File cache stemming untuk pre-seed worker.
+    """
+
+    def __init__(self, workers=None, stem_cache_path=STEM_CACHE_PATH):
+        self.workers = workers or os.cpu_count() or 1
+        self.stem_cache_path = stem_cache_path
+        self._executor = None
+
+    def __enter__(self):
+        if self.workers > 1:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=init_worker,
+                initargs=(self.stem_cache_path,),
+            )
+        else:
+            init_worker(self.stem_cache_path)
+        return self
+
+    def __exit__(self, *exc):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def map(self, func, texts):
+        """Menerapkan ``func`` ke seluruh teks, urutan hasil sama dengan input."""
+        texts = list(texts)
+        if self._executor is None:
+            return [func(text) for text in texts]
+        chunksize = max(1, len(texts) // (self.workers * 4))
+        return list(self._executor.map(func, texts, chunksize=chunksize))
+
+    def map_batches(self, func, texts):
+        """Menerapkan ``func`` (list teks -> list hasil) per potongan, urutan hasil sama dengan input."""
+        texts = list(texts)
+        if self._executor is None:
+            return func(texts)
+        size = max(1, -(-len(texts) // (self.workers * 4)))
+        chunks = [texts[start:start + size] for start in range(0, len(texts), size)]
+        return [result for results in self._executor.map(func, chunks) for result in results]
@@ -0,0 +1,159 @@
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import sys
+import time
+
+# ----------------------------------------------------------------------------
+# Artefak Panel Prerender (siap saji dari disk)
+# ----------------------------------------------------------------------------
+
+PRERENDER_DIR = 'Data/.cache/prerender'
+MANIFEST_NAME = 'manifest.json'
+
+# Figure plotly disimpan sebagai dict {_FIGURE_TAG: figure.to_dict()} agar dimuat tanpa validasi ulang
+_FIGURE_TAG = '__plotly_figure__'
+
+
+def _encode(value):
+    from plotly.basedatatypes import BaseFigure
+
+    if isinstance(value, tuple):
+        return tuple(_encode(item) for item in value)
+    if isinstance(value, BaseFigure):
+        return {_FIGURE_TAG: value.to_dict()}
+    return value
+
+
+def _decode(value):
+    if isinstance(value, tuple):
+        return tuple(_decode(item) for item in value)
+    if isinstance(value, dict) and _FIGURE_TAG in value:
+        import plotly.graph_objects as go
+
+        # Spesifikasi berasal dari figure yang sudah divalidasi saat prerender
+        return go.Figure(value[_FIGURE_TAG], _validate=False)
+    return value
+
+
+class PrerenderedPanels:
+    """
+    Isi panel dashboard yang sudah dihitung ``prerender.py`` untuk satu versi
+    data: satu file pickle per kunci panel di ``root/<fingerprint>/``.
+
+    Panel dicari per kunci saat dibutuhkan, sehingga artefak yang dibangun
+    setelah aplikasi berjalan langsung terpakai; data yang berubah
+    (fingerprint baru) tidak memakai artefak versi lama.
+
+    Args:
+        fingerprint (str): Versi data (``SharedStore.data_fingerprint`` / ``DataView.data_fingerprint``).
+        root (str): Direktori induk artefak prerender.
+    """
+
+    def __init__(self, fingerprint, root=PRERENDER_DIR):
+        self.fingerprint = fingerprint
+        self.root = root
+        self.directory = os.path.join(root, str(fingerprint))
+
+    def _path(self, key):
+        digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, f"{digest}.pkl")
+
+    def get(self, key):
+        """
+        Returns:
+            Isi panel, atau None jika panel ini belum di-prerender.
+        """
+        try:
+            with open(self._path(key), 'rb') as f:
+                return _decode(pickle.load(f))
+        except FileNotFoundError:
+            return None
+
+    def save(self, key, value):
+        """Menyimpan isi panel (ditulis atomik); mengembalikan ukuran file (byte)."""
+        path = self._path(key)
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(_encode(value), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        return os.path.getsize(path)
+
+    def manifest(self):
+        """Ringkasan build terakhir (None jika belum pernah selesai dibangun)."""
+        try:
+            with open(os.path.join(self.directory, MANIFEST_NAME), encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def write_manifest(self, summary):
+        with open(os.path.join(self.directory, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+
+
+def prerender(view, root=PRERENDER_DIR, keys=None):
+    """
+    Menghitung dan menyimpan seluruh panel ``view`` untuk setiap kombinasi filter.
+
+    Args:
+        view (SharedStore | DataView): Sumber data.
+        root (str): Direktori induk artefak prerender.
+        keys (Iterable[tuple] | None): Kunci panel (default: ``panel_keys`` untuk seluruh filter).
+
+    Returns:
+        dict: fingerprint, panels, bytes, dan seconds (juga ditulis ke manifest).
+    """
+    from dashboard_panels import compute_panel, panel_keys
+
+    if keys is None:
+        keys = panel_keys(["All"] + sorted(view.df_sentimen["Sentimen"].dropna().unique()))
+    panels = PrerenderedPanels(view.data_fingerprint, root=root)
+
+    start = time.perf_counter()
+    count = size = 0
+    for key in keys:
+        size += panels.save(key, compute_panel(view, key))
+        count += 1
+    summary = {'fingerprint': view.data_fingerprint, 'panels': count, 'bytes': size,
+               'seconds': round(time.perf_counter() - start, 2)}
+    panels.write_manifest(summary)
+    return summary
+
+
+def remove_stale(data_fingerprint, root=PRERENDER_DIR):
+    """Menghapus artefak versi data lain (view turunan, mis. deduplikasi, memakai fingerprint ``<data>+...``)."""
+    if not os.path.isdir(root):
+        return
+    for name in os.listdir(root):
+        if name != data_fingerprint and not name.startswith(f"{data_fingerprint}+"):
+            shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+
+def main():
+    from loaders import DATA_PATH
+    from shared_store import SharedStore
+
+    parser = argparse.ArgumentParser(
+        description="Membangun seluruh grafik, word cloud, dan tabel dashboard untuk setiap kombinasi filter.")
+    parser.add_argument('--data', default=DATA_PATH)
+    parser.add_argument('--output', default=PRERENDER_DIR)
+    parser.add_argument('--views', nargs='+', choices=['full', 'dedup'], default=['full', 'dedup'],
+                        help="Dataset lengkap dan/atau hasil deduplikasi (filter 'Gabungkan tweet hampir duplikat')")
+    args = parser.parse_args()
+
+    store = SharedStore(data_path=args.data, stem_cache_path=None, prerender_dir=None)
+    for name in args.views:
+        view = store if name == 'full' else store.dedup
+        summary = prerender(view, root=args.output)
+        print(f"{name}: {summary['panels']:,} panel ({summary['bytes'] / 1e6:,.1f} MB) dalam "
+              f"{summary['seconds']:.1f} detik -> {os.path.join(args.output, view.data_fingerprint)}", file=sys.stderr)
+    remove_stale(store.data_fingerprint, root=args.output)
+
+
+if __name__ == '__main__':
+    main()
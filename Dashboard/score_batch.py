@@ -0,0 +1,158 @@
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from loaders import read_model
+from predictor import SentimentPredictor
+from preprocess_pool import PreprocessPool, preprocess_batch
+from stem_cache import STEM_CACHE_PATH
+
+# ----------------------------------------------------------------------------
+# Batch Scorer
+# ----------------------------------------------------------------------------
+
+class BatchScorer:
+    """
+    Menilai sentimen banyak teks sekaligus dengan rantai preprocessing,
+    vectorizer, selektor, dan model yang sama dengan halaman prediksi.
+
+    Preprocessing dijalankan paralel di process pool, sedangkan transformasi
+    dan ``predict_proba`` dipanggil sekali per batch.
+
+    Args:
+        vectorizer, fselector, model: Keluaran ``read_model()``.
+        workers (int | None): Jumlah worker process; default seluruh core.
+            Nilai 1 menjalankan preprocessing di proses utama.
+        stem_cache_path (str | None): File cache stemming untuk pre-seed worker.
+    """
+
+    def __init__(self, vectorizer, fselector, model, workers=None, stem_cache_path=STEM_CACHE_PATH):
+        self.predictor = SentimentPredictor(vectorizer, fselector, model)
+        self.labels = self.predictor.labels
+        self.pool = PreprocessPool(workers=workers, stem_cache_path=stem_cache_path)
+
+    def __enter__(self):
+        self.pool.__enter__()
+        return self
+
+    def __exit__(self, *exc):
+        self.pool.__exit__(*exc)
+
+    def preprocess(self, texts):
+        """
+        Menjalankan ``preprocess_tweet`` (versi batch) pada seluruh teks.
+
+        Returns:
+            list: Teks bersih per baris (None jika hasil preprocessing kosong).
+        """
+        return self.pool.map_batches(preprocess_batch, texts)
+
+    def predict(self, clean_texts):
+        """
+        Memprediksi label dan skor confidence untuk teks yang sudah diproses.
+
+        Args:
+            clean_texts (list): Keluaran ``preprocess``.
+
+        Returns:
+            pd.DataFrame: Kolom 'Prediksi', 'Confidence', dan 'Skor_<label>' (dalam persen).
+        """
+        valid = np.array([text is not None for text in clean_texts], dtype=bool)
+        scores = np.full((len(clean_texts), len(self.labels)), np.nan)
+
+        if valid.any():
+            probas = self.predictor.predict_proba_clean([text for text in clean_texts if text is not None])
+            scores[valid] = probas * 100
+
+        result = pd.DataFrame(scores.round(2), columns=[f'Skor_{label}' for label in self.labels])
+        best = np.where(valid, np.nan_to_num(scores, nan=-1).argmax(axis=1), -1)
+        result.insert(0, 'Prediksi', [self.labels[i] if i >= 0 else None for i in best])
+        result.insert(1, 'Confidence', result.iloc[:, 1:].max(axis=1))
+        return result
+
+    def score_frame(self, df, text_column='full_text'):
+        """
+        Menambahkan kolom 'clean_text' dan hasil prediksi ke DataFrame.
+
+        Returns:
+            pd.DataFrame: Salinan ``df`` dengan kolom hasil scoring.
+        """
+        clean_texts = self.preprocess(df[text_column])
+        result = self.predict(clean_texts)
+        result.index = df.index
+        return pd.concat([df.assign(clean_text=clean_texts), result], axis=1)
+
+
+# ----------------------------------------------------------------------------
+# Streaming File CSV/JSONL
+# ----------------------------------------------------------------------------
+
+def _is_jsonl(path):
+    return path.endswith(('.jsonl', '.ndjson'))
+
+
+def iter_chunks(path, chunksize):
+    """Membaca file CSV atau JSONL per potongan berukuran ``chunksize`` baris."""
+    if _is_jsonl(path):
+        return pd.read_json(path, lines=True, chunksize=chunksize, dtype=False)
+    return pd.read_csv(path, chunksize=chunksize)
+
+
+def write_chunk(df, path, first):
+    """Menulis satu potongan hasil ke file CSV/JSONL (mode append setelah potongan pertama)."""
+    if _is_jsonl(path):
+        df.to_json(path, orient='records', lines=True, force_ascii=False, mode='w' if first else 'a')
+    else:
+        df.to_csv(path, index=False, mode='w' if first else 'a', header=first)
+
+
+def score_file(input_path, output_path, text_column='full_text', chunksize=5000,
+               workers=None, stem_cache_path=STEM_CACHE_PATH, log=sys.stderr):
+    """
+    Menilai seluruh baris file input secara streaming dan menulis hasilnya ke output.
+
+    Returns:
+        dict: Jumlah baris, durasi (detik), dan throughput (baris/detik).
+    """
+    vectorizer, fselector, model = read_model()
+    total_rows = 0
+    start = time.perf_counter()
+
+    with BatchScorer(vectorizer, fselector, model, workers=workers, stem_cache_path=stem_cache_path) as scorer:
+        for i, chunk in enumerate(iter_chunks(input_path, chunksize)):
+            scored = scorer.score_frame(chunk, text_column=text_column)
+            write_chunk(scored, output_path, first=(i == 0))
+
+            total_rows += len(chunk)
+            elapsed = time.perf_counter() - start
+            print(f"[chunk {i + 1}] {total_rows:,} baris, {total_rows / elapsed:,.1f} baris/detik", file=log)
+
+    elapsed = time.perf_counter() - start
+    return {
+        'rows': total_rows,
+        'seconds': elapsed,
+        'rows_per_second': total_rows / elapsed if elapsed else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scoring sentimen massal untuk file CSV/JSONL tweet.")
+    parser.add_argument('input', help="File input (.csv, .jsonl, atau .ndjson)")
+    parser.add_argument('output', help="File output (.csv, .jsonl, atau .ndjson)")
+    parser.add_argument('--text-column', default='full_text')
+    parser.add_argument('--chunksize', type=int, default=5000)
+    parser.add_argument('--workers', type=int, default=None, help="Default: jumlah core CPU")
+    parser.add_argument('--stem-cache', default=STEM_CACHE_PATH)
+    args = parser.parse_args()
+
+    stats = score_file(args.input, args.output, text_column=args.text_column, chunksize=args.chunksize,
+                       workers=args.workers, stem_cache_path=args.stem_cache)
+    print(f"Selesai: {stats['rows']:,} baris dalam {stats['seconds']:.1f} detik "
+          f"({stats['rows_per_second']:,.1f} baris/detik) -> {args.output}")
+
+
+if __name__ == '__main__':
+    main()
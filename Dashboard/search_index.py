@@ -0,0 +1,109 @@
+import re
+import time
+from collections import defaultdict
+
+import numpy as np
+
+from instrumentation import instrumented
+
+# ----------------------------------------------------------------------------
+# Indeks Pencarian Teks & Username
+# ----------------------------------------------------------------------------
+
+# Query yang memuat karakter khusus regex dicocokkan sebagai regex, seperti
+# ``str.contains(query, case=False)`` pada panel pencarian sebelum memakai indeks
+REGEX_CHARS = frozenset('.^$*+?{}[]\\|()')
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class SearchIndex:
+    """
+    Indeks pencarian substring (tidak peka huruf besar/kecil) atas beberapa
+    kolom teks, dibangun sekali saat data dimuat.
+
+    Setiap baris dipecah menjadi trigram karakter; query sepanjang 3 karakter
+    atau lebih cukup memeriksa irisan posting list trigram-nya lalu
+    memverifikasi kandidat. Query yang lebih pendek langsung memverifikasi
+    seluruh teks yang sudah di-lowercase, tanpa menyalin DataFrame.
+
+    Query yang memuat karakter khusus regex (``REGEX_CHARS``, mis.
+    ``risma|khofifah``) diperlakukan sebagai regex dan dicocokkan ke seluruh
+    baris tanpa indeks; regex yang tidak valid dicari sebagai teks biasa.
+
+    Args:
+        df (pd.DataFrame): Dataset yang diindeks.
+        columns (tuple): Kolom yang dicari (baris cocok jika salah satu kolom cocok).
+    """
+
+    @instrumented('search.build')
+    def __init__(self, df, columns=('full_text', 'username')):
+        self.columns = columns
+        self.size = len(df)
+        # NaN -> '' lewat where: fillna('') gagal pada kolom categorical (kategori baru)
+        self._texts = [df[column].astype(str).where(df[column].notna(), '').str.lower().reset_index(drop=True)
+                       for column in columns]
+
+        postings = defaultdict(list)
+        for row, values in enumerate(zip(*(texts.tolist() for texts in self._texts))):
+            grams = set()
+            for value in values:
+                grams |= _trigrams(value)
+            for gram in grams:
+                postings[gram].append(row)
+        self._postings = {gram: np.array(rows, dtype=np.int32) for gram, rows in postings.items()}
+
+    def _verify(self, candidates, query):
+        # Verifikasi kandidat secara vektor pada teks yang sudah di-lowercase
+        # (query berupa teks literal, atau pola regex hasil compile)
+        regex = isinstance(query, re.Pattern)
+        mask = np.zeros(len(candidates), dtype=bool)
+        for texts in self._texts:
+            subset = texts if len(candidates) == self.size else texts.take(candidates)
+            mask |= subset.str.contains(query, regex=regex).to_numpy(dtype=bool)
+        return candidates[mask]
+
+    @instrumented('search')
+    def search(self, query):
+        """
+        Mencari baris yang mengandung ``query`` di salah satu kolom.
+
+        Args:
+            query (str): Kata kunci (substring literal, atau regex jika memuat ``REGEX_CHARS``).
+
+        Returns:
+            np.ndarray: Posisi baris (urut sesuai dataset) yang cocok.
+        """
+        if not REGEX_CHARS.isdisjoint(query):
+            try:
+                pattern = re.compile(query, re.IGNORECASE)
+            except re.error:
+                pass
+            else:
+                return self._verify(np.arange(self.size, dtype=np.int32), pattern)
+
+        query = query.lower()
+        if not query:
+            return np.arange(self.size)
+
+        if len(query) < 3:
+            candidates = np.arange(self.size, dtype=np.int32)
+        else:
+            grams = sorted(_trigrams(query), key=lambda g: len(self._postings.get(g, ())))
+            candidates = self._postings.get(grams[0])
+            if candidates is None:
+                return np.array([], dtype=np.int32)
+            for gram in grams[1:]:
+                candidates = np.intersect1d(candidates, self._postings[gram], assume_unique=True)
+                if not len(candidates):
+                    break
+
+        return self._verify(candidates, query)
+
+    def timed_search(self, query):
+        """Sama dengan ``search`` tetapi juga mengembalikan durasi query (detik)."""
+        start = time.perf_counter()
+        rows = self.search(query)
+        return rows, time.perf_counter() - start
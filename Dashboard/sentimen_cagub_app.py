@@ -1,6 +1,10 @@
+import uuid
+
 import pandas as pd
 import streamlit as st
-import pickle
+import instrumentation
+from dashboard_panels import TOP_NUMBER_MAX, TOP_NUMBER_MIN
+from shared_store import SESSION_FOOTPRINT_TTL, get_store, session_footprint
 
 # Konfigurasi awal Streamlit
 st.set_page_config(page_title="Analisis Sentimen Pemilihan Calon Gubernur Jawa Timur 2024", page_icon="📊", layout="wide")
@@ -9,65 +13,10 @@ st.set_page_config(page_title="Analisis Sentimen Pemilihan Calon Gubernur Jawa T
 # Data Processing Code 
 # ----------------------------------------------------------------------------
 
-@st.cache_data
-def load_data():
-    df = pd.read_csv("Data/data_cagub_analisis.csv")
-    
-    name_mapping = {
-        'Luluk': 'Luluk Nur Hamidah',
-        'Khofifah': 'Khofifah Indar Parawansa',
-        'Risma': 'Tri Rismaharini'
-    }
-    df['tokoh'] = df['tokoh'].map(name_mapping)
-    
-    return df
-
-@st.cache_data
-def load_kamus():
-    df_kamus = pd.read_csv('Data/Kamus Normalisasi.csv', encoding='ISO-8859-1', header=None)
-    df_kamus.columns = ['Alay', 'Meaning']
-    norm_dict = dict(zip(df_kamus.Alay, df_kamus.Meaning))
-    
-    # Update manual untuk kata-kata khusus
-    norm_dict.update({
-        'p': 'perjuangan',
-        'iniiii': 'ini',
-        'bauuuuu': 'bau',
-        'anake': 'anak',
-        'ibuibu': 'ibu ibu',
-        'nu': 'nahdlatul ulama',
-        'pragib': 'prabowo gibran',
-        'dahal': 'padahal',
-        'lagiiiii': 'lagi',
-        'kopipa': 'khofifah',
-        'kopipah': 'khofifah',
-        'khopipah': 'khofifah',
-        'hopipah': 'khofifah'
-    })
-
-    return norm_dict
-
-
-# Load model
-@st.cache_resource 
-def load_model():
-    with open("Model/best_saved_tfidf_vectorizer.pkl", "rb") as f_vec, open("Model/best_saved_selector.pkl", "rb") as f_select, open("Model/best_saved_rf_model.pkl", "rb") as f_model:
-        vectorizer = pickle.load(f_vec)
-        fselector = pickle.load(f_select)
-        model = pickle.load(f_model)
-    return vectorizer, fselector, model
-
-# Inisialisasi session_state untuk data dan kamus normalisasi
-if "df_sentimen" not in st.session_state or "norm_dict" not in st.session_state:
-    st.session_state.df_sentimen = load_data()
-    st.session_state.norm_dict = load_kamus()
-
-# Inisialisasi session_state untuk model
-if "vectorizer" not in st.session_state or "model" not in st.session_state or "fselector" not in st.session_state:
-    vectorizer, fselector, model = load_model()
-    st.session_state.vectorizer = vectorizer
-    st.session_state.fselector = fselector
-    st.session_state.model = model
+# Dataset, kamus, dan model dibaca dari store bersama milik proses (bukan disalin
+# ke session_state), sehingga menambah sesi tidak menambah salinan data.
+# Store memuat ulang data secara otomatis ketika file data berubah.
+store = get_store()
 
 # Inisialisasi session_state untuk filter
 if "select_cagub" not in st.session_state:
@@ -77,10 +26,16 @@ if "label_sentimen" not in st.session_state:
     st.session_state.label_sentimen = "All"
 
 if "top_number" not in st.session_state:
-    st.session_state.top_number = 10
+    st.session_state.top_number = 20
+
+if "dedup" not in st.session_state:
+    st.session_state.dedup = False
 
-# Gunakan data dari session state, tanpa memuat ulang
-df_sentimen = st.session_state.df_sentimen
+# Kunci sesi untuk catatan memori sesi di store (lihat expander "Memori Sesi")
+if "session_key" not in st.session_state:
+    st.session_state.session_key = uuid.uuid4().hex
+
+df_sentimen = store.df_sentimen
 
 
 # ----------------------------------------------------------------------------
@@ -96,6 +51,10 @@ pages = {
     ]
 }
 
+# Halaman admin instrumentasi hanya tersedia bila INSTRUMENTATION aktif
+if instrumentation.ENABLED:
+    pages["Admin"] = [st.Page(page="app-pages/page_admin.py", title="Instrumentasi", icon="⏱️")]
+
 # Navigation setup
 pg = st.navigation(pages)
 
@@ -104,25 +63,36 @@ pg = st.navigation(pages)
 st.sidebar.subheader("🔍 Filters")
 
 # Sidebar: Filter pilih cagub
+# Widget terikat langsung ke session_state lewat key, sehingga perubahan filter
+# berlaku di run yang sama (tanpa st.rerun() dan eksekusi ulang seluruh halaman)
 list_cagub = ["Luluk Nur Hamidah", "Khofifah Indar Parawansa", "Tri Rismaharini"]
-select_cagub = st.sidebar.selectbox("Calon Gubernur:", options=list_cagub, index=0)
+st.sidebar.selectbox("Calon Gubernur:", options=list_cagub, key="select_cagub")
 
 # Sidebar: Filter label sentimen
 sentimen_cat = ["All"] + sorted(df_sentimen["Sentimen"].unique())
-label_sentimen = st.sidebar.selectbox("Jenis Sentimen:", options=sentimen_cat, index=0)
+st.sidebar.selectbox("Jenis Sentimen:", options=sentimen_cat, key="label_sentimen")
 
 # Sidebar: Filter top data
-top_number = st.sidebar.number_input("Jumlah Data Teratas", min_value=5, max_value=50, value=20)
-
-# Update session_state jika ada perubahan & refresh halaman
-if (
-    select_cagub != st.session_state.select_cagub or
-    label_sentimen != st.session_state.label_sentimen or
-    top_number != st.session_state.top_number
-):
-    st.session_state.select_cagub = select_cagub
-    st.session_state.label_sentimen = label_sentimen
-    st.session_state.top_number = top_number
-    st.rerun()  # Refresh agar filter berlaku
+st.sidebar.number_input("Jumlah Data Teratas", min_value=TOP_NUMBER_MIN, max_value=TOP_NUMBER_MAX, key="top_number")
+
+# Sidebar: analisis dataset lengkap atau tanpa tweet hampir duplikat (retweet, salin-tempel)
+st.sidebar.toggle("Gabungkan tweet hampir duplikat", key="dedup",
+                  help="Tweet yang hanya berbeda mention/URL dihitung sekali per calon gubernur (MinHash + LSH).")
+
+# Sidebar: akuntansi memori sesi (data & model dihitung di store bersama)
+# Deep sizeof atas seluruh sesi mahal, sehingga hanya dihitung saat tombol ditekan,
+# bukan di setiap rerun
+with st.sidebar.expander("🧮 Memori Sesi"):
+    if st.button("Hitung memori sesi"):
+        footprint = session_footprint(st.session_state, store)
+        store.record_session_footprint(st.session_state.session_key, int(footprint['Byte'].sum()))
+        recorded = store.session_footprints()
+        st.metric("Memori sesi ini", f"{footprint['Byte'].sum() / 1024:,.1f} KB")
+        st.metric(f"Total {len(recorded)} sesi tercatat", f"{sum(recorded.values()) / 1024:,.1f} KB")
+        st.caption(f"Sesi lain ikut terhitung setelah menekan tombol ini dalam "
+                   f"{SESSION_FOOTPRINT_TTL // 60} menit terakhir.")
+        shared_bytes = store.memory_bytes()
+        st.metric("Store bersama (sekali per proses)", f"{sum(shared_bytes.values()) / 1e6:,.1f} MB")
+        st.dataframe(footprint, hide_index=True, use_container_width=True)
 
 pg.run()
@@ -0,0 +1,526 @@
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+from instrumentation import register_cache, stage
+from live_aggregates import LiveAggregates
+from loaders import (DATA_PATH, append_log_path, concat_categorical, file_fingerprint, model_version,
+                     read_append_log, read_data, read_kamus, read_model)
+from near_duplicates import add_cluster_columns, dedup_version, deduplicate
+from ngram_index import NGRAM_INDEX_DIR, NgramIndex
+from prediction_cache import PredictionCache
+from predictor import SentimentPredictor
+from prerender import PRERENDER_DIR, PrerenderedPanels
+from search_index import SearchIndex
+from stem_cache import STEM_CACHE_PATH, create_stem_cache
+from text_preprocessing import KamusNormalizer, build_stop_words_remover
+from wordcloud_cache import WORDCLOUD_CACHE_DIR, WordCloudCache
+
+# ----------------------------------------------------------------------------
+# Penyimpanan Bersama (satu salinan per proses, read-only)
+# ----------------------------------------------------------------------------
+
+# Jumlah maksimum hasil panel dashboard yang disimpan (lihat SharedStore.panel)
+PANEL_CACHE_SIZE = 256
+
+# Catatan memori sesi yang lebih lama dari ini (detik) dianggap milik sesi yang sudah ditutup
+SESSION_FOOTPRINT_TTL = 30 * 60
+
+
+class PanelCache:
+    """
+    Hasil panel dashboard (mis. figure plotly) per kombinasi input, dipakai
+    bersama seluruh sesi untuk satu versi data; hasilnya diperlakukan
+    read-only. Dibatasi ``maxsize`` entri (LRU).
+
+    Panel yang belum ada di memori diambil dari artefak ``prerendered`` jika
+    tersedia, dan baru dihitung langsung jika belum di-prerender.
+    """
+
+    def __init__(self, maxsize=PANEL_CACHE_SIZE, prerendered=None):
+        self.maxsize = maxsize
+        self.prerendered = prerendered
+        self.hits = 0
+        self.prerendered_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, compute):
+        """
+        Args:
+            key (tuple): Nama panel beserta seluruh inputnya.
+            compute (callable): Fungsi tanpa argumen yang menghasilkan isi panel.
+        """
+        entries = self._entries
+        try:
+            value = entries[key]
+            entries.move_to_end(key)
+            self.hits += 1
+            return value
+        except KeyError:
+            pass
+
+        value = self.prerendered.get(key) if self.prerendered is not None else None
+        if value is None:
+            value = compute()
+            self.misses += 1
+        else:
+            self.prerendered_hits += 1
+        with self._lock:
+            entries[key] = value
+            while len(entries) > self.maxsize:
+                entries.popitem(last=False)
+        return value
+
+    def stats(self):
+        """
+        Returns:
+            dict: hits (memori + artefak prerender), prerendered (bagian dari hits),
+            misses (panel dihitung langsung), dan size.
+        """
+        return {'hits': self.hits + self.prerendered_hits, 'prerendered': self.prerendered_hits,
+                'misses': self.misses, 'size': len(self._entries)}
+
+
+class DataView:
+    """
+    Dataset turunan (mis. hasil deduplikasi) beserta agregat, indeks n-gram,
+    indeks pencarian, dan cache panelnya sendiri, dengan atribut yang sama
+    seperti bagian data ``SharedStore`` sehingga halaman bisa memakai keduanya.
+
+    Args:
+        df (pd.DataFrame): Dataset turunan.
+        fingerprint (str): Versi data (kunci cache gambar, indeks n-gram, dan artefak prerender).
+        ngram_index_dir (str): Direktori indeks n-gram milik view ini.
+        wordcloud_cache_dir (str | None): Direktori cache gambar milik view ini.
+        prerender_dir (str | None): Direktori artefak ``prerender.py`` (None = selalu dihitung langsung).
+    """
+
+    def __init__(self, df, fingerprint, ngram_index_dir, wordcloud_cache_dir=None, prerender_dir=None):
+        self.df_sentimen = df
+        self.data_fingerprint = fingerprint
+        self.aggregates = LiveAggregates(df)
+        self.ngram_index = NgramIndex.open_frame(lambda: df, fingerprint, index_dir=ngram_index_dir)
+        self.wordcloud_cache = WordCloudCache(cache_dir=wordcloud_cache_dir)
+        self._panels = PanelCache(prerendered=_prerendered(fingerprint, prerender_dir))
+        self._search_index = None
+        self._lock = threading.Lock()
+
+    @property
+    def search_index(self):
+        if self._search_index is None:
+            with self._lock:
+                if self._search_index is None:
+                    self._search_index = SearchIndex(self.df_sentimen)
+        return self._search_index
+
+    def panel(self, key, compute):
+        """Lihat ``SharedStore.panel``."""
+        return self._panels.get(key, compute)
+
+
+class SharedStore:
+    """
+    Dataset, kamus, dan artefak model yang dipakai bersama oleh seluruh sesi
+    dalam satu proses. Halaman membaca atribut store ini secara langsung,
+    sehingga tidak ada salinan per sesi di ``st.session_state``.
+
+    Objek di dalam store diperlakukan read-only: kamus dibungkus
+    ``MappingProxyType`` dan DataFrame dilindungi Copy-on-Write pandas
+    (perubahan oleh satu halaman selalu menghasilkan salinan baru).
+
+    Bagian data (dataset, agregat, indeks n-gram, indeks pencarian) dibangun
+    ulang ketika fingerprint file data berubah, dan diperbarui inkremental
+    ketika log tambahan bertambah; artefak model dimuat ulang (dan cache
+    prediksi dikosongkan) ketika isi ``Model/`` berubah; kamus tetap.
+
+    Agar halaman pertama cepat tampil, artefak model (beserta scikit-learn),
+    indeks pencarian, dan dataset hasil deduplikasi (``dedup``) baru dimuat
+    saat pertama kali diakses.
+
+    Args:
+        data_path (str): Lokasi dataset analisis.
+        stem_cache_path (str | None): File cache stemming ("" / None = hanya memori).
+        ngram_index_dir (str): Direktori indeks n-gram untuk ``data_path``.
+        prerender_dir (str | None): Direktori artefak ``prerender.py`` ("" / None = panel selalu
+            dihitung langsung).
+    """
+
+    def __init__(self, data_path=DATA_PATH, stem_cache_path=STEM_CACHE_PATH, ngram_index_dir=NGRAM_INDEX_DIR,
+                 prerender_dir=PRERENDER_DIR):
+        self.data_path = data_path
+        self.ngram_index_dir = ngram_index_dir
+        self.prerender_dir = prerender_dir or None
+        self._lock = threading.Lock()
+
+        # 1. Kamus & preprocessing
+        self.norm_dict = MappingProxyType(read_kamus())
+        self.normalizer = KamusNormalizer(self.norm_dict)
+        self.stem_cache = create_stem_cache(path=stem_cache_path or None)
+
+        # 2. Artefak model (lazy, lihat _ensure_model) & cache hasil prediksi
+        self._model_state = None
+        self.prediction_cache = PredictionCache()
+
+        # 3. Cache gambar (tidak bergantung versi data; kunci memuat fingerprint)
+        self.wordcloud_cache = WordCloudCache()
+
+        # 4. Dataset & indeks turunannya (+ baris dari log tambahan ingest.py)
+        self.log_path = append_log_path(data_path)
+        self.data_fingerprint = None
+        self._base_fingerprint = None
+        self._log_offset = 0
+        self.refresh()
+
+        # 5. Statistik cache untuk instrumentasi (cache panel diganti per versi data)
+        register_cache('stem', self.stem_cache.stats)
+        register_cache('prediksi', self.prediction_cache.stats)
+        register_cache('wordcloud', self.wordcloud_cache.stats)
+        register_cache('panel', lambda: self._panels.stats())
+
+        # 6. Memori per sesi yang dicatat sesi masing-masing (lihat record_session_footprint)
+        self._session_footprints = {}
+
+    # ---- Artefak model (lazy) ----------------------------------------------
+
+    def _ensure_model(self):
+        """
+        Memuat (ulang) artefak model bila belum dimuat atau ``Model/`` berubah.
+
+        Returns:
+            tuple: (versi, predictor, (vectorizer, fselector, model)) dari satu pembacaan,
+            sehingga versi dan predictor selalu sepasang walau thread lain sedang memuat ulang.
+        """
+        version = model_version()
+        state = self._model_state
+        if state is None or state[0] != version:
+            with self._lock:
+                state = self._model_state
+                if state is None or state[0] != version:
+                    vectorizer, fselector, model = read_model()
+                    predictor = SentimentPredictor(vectorizer, fselector, model,
+                                                   normalizer=self.normalizer,
+                                                   stop_words_remover=build_stop_words_remover(),
+                                                   stemmer=self.stem_cache)
+                    # Versi, predictor, dan artefak diganti dalam satu assignment
+                    state = (version, predictor, (vectorizer, fselector, model))
+                    self._model_state = state
+                    self.prediction_cache.clear()
+                    self._shared_ids = None
+                    self._memory_bytes = None
+        return state
+
+    @property
+    def model_loaded(self):
+        return self._model_state is not None
+
+    @property
+    def predictor(self):
+        return self._ensure_model()[1]
+
+    def predict(self, text):
+        """
+        Memprediksi satu teks lewat cache prediksi bersama (lihat ``PredictionCache``).
+
+        Returns:
+            dict: Format sama dengan ``SentimentPredictor.predict``.
+        """
+        version, predictor, _ = self._ensure_model()
+        return self.prediction_cache.predict(predictor, text, version)
+
+    @property
+    def vectorizer(self):
+        return self._ensure_model()[2][0]
+
+    @property
+    def fselector(self):
+        return self._ensure_model()[2][1]
+
+    @property
+    def model(self):
+        return self._ensure_model()[2][2]
+
+    @property
+    def search_index(self):
+        """Indeks pencarian untuk versi data saat ini (dibangun saat pertama dibutuhkan)."""
+        index = self._search_index
+        if index is None:
+            with self._lock:
+                index = self._search_index
+                if index is None:
+                    index = self._search_index = SearchIndex(self.df_sentimen)
+                    self._shared_ids = None
+                    self._memory_bytes = None
+        return index
+
+    # ---- Cache hasil panel dashboard ----------------------------------------
+
+    def panel(self, key, compute):
+        """
+        Hasil sebuah panel dashboard (mis. figure plotly) untuk versi data saat ini.
+
+        Panel dihitung sekali per kombinasi input (atau dimuat dari artefak
+        ``prerender.py`` untuk versi data ini) dan dipakai bersama seluruh
+        sesi; hasilnya diperlakukan read-only. Cache dikosongkan saat data
+        berubah dan dibatasi ``PANEL_CACHE_SIZE`` entri (LRU).
+
+        Args:
+            key (tuple): Nama panel beserta seluruh inputnya.
+            compute (callable): Fungsi tanpa argumen yang menghasilkan isi panel.
+        """
+        return self._panels.get(key, compute)
+
+    # ---- Dataset hasil deduplikasi (lazy) ------------------------------------
+
+    @property
+    def dedup(self):
+        """
+        ``DataView`` berisi satu tweet wakil per klaster hampir duplikat untuk
+        setiap tokoh (kolom 'cluster_id' dan 'cluster_size', lihat
+        ``near_duplicates``). Dibangun saat pertama diminta untuk versi data saat ini.
+        """
+        view = self._dedup
+        if view is None:
+            with self._lock:
+                view = self._dedup
+                if view is None:
+                    with stage('dedup'):
+                        df = deduplicate(add_cluster_columns(self.df_sentimen))
+                    view = self._dedup = DataView(df, f"{self.data_fingerprint}+{dedup_version()}",
+                                                  ngram_index_dir=f"{self.ngram_index_dir}_dedup",
+                                                  wordcloud_cache_dir=f"{WORDCLOUD_CACHE_DIR}_dedup",
+                                                  prerender_dir=self.prerender_dir)
+                    register_cache('wordcloud_dedup', view.wordcloud_cache.stats)
+                    register_cache('panel_dedup', view._panels.stats)
+                    self._shared_ids = None
+                    self._memory_bytes = None
+        return view
+
+    # ---- Data ----------------------------------------------------------------
+
+    def refresh(self):
+        """
+        Memuat ulang dataset dan indeksnya jika file data berubah.
+
+        Baris baru di log tambahan (``ingest.py``) diterapkan secara
+        inkremental: agregat dan indeks n-gram diperbarui sebanding jumlah
+        baris baru, tanpa membaca ulang dataset. Dataset utama yang berubah
+        (atau log yang dipadatkan) memicu muat ulang penuh.
+
+        Objek lama tidak diubah, hanya diganti referensinya, sehingga sesi
+        yang sedang membaca versi lama tetap konsisten (kecuali agregat dan
+        indeks n-gram, yang hanya bertambah dan aman dibaca bersamaan).
+
+        Returns:
+            bool: True jika data dimuat ulang atau bertambah.
+        """
+        fingerprint = file_fingerprint(self.data_path)
+        log_size = _file_size(self.log_path)
+        if fingerprint == self._base_fingerprint and log_size == self._log_offset:
+            return False
+
+        with self._lock:
+            log_size = _file_size(self.log_path)
+            if fingerprint == self._base_fingerprint and log_size == self._log_offset:
+                return False
+
+            # 1. Muat ulang penuh: dataset utama berubah atau log dipadatkan/dihapus
+            if fingerprint != self._base_fingerprint or log_size < self._log_offset:
+                df_sentimen = read_data(self.data_path)
+                with stage('load_ngram_index'):
+                    # Indeks dibangun dari dataset yang sudah dimuat (file data tidak dibaca dua kali)
+                    ngram_index = NgramIndex.open_frame(lambda: df_sentimen, fingerprint, index_dir=self.ngram_index_dir)
+                    ngram_index.follow(df_sentimen)
+                self.aggregates = LiveAggregates(df_sentimen)
+                self.ngram_index = ngram_index
+                self.df_sentimen = df_sentimen
+                self._base_fingerprint = fingerprint
+                self._log_offset = 0
+
+            # 2. Baris baru dari log tambahan
+            batch, self._log_offset = read_append_log(self.log_path, self._log_offset)
+            if len(batch):
+                with stage('load_append_log'):
+                    batch = batch[self.df_sentimen.columns.intersection(batch.columns)]
+                    self.aggregates.update(batch)
+                    self.ngram_index.update(batch)
+                    self.df_sentimen = concat_categorical([self.df_sentimen, batch])
+
+            self._search_index = None
+            self._dedup = None
+            self.data_fingerprint = f"{fingerprint}+{self._log_offset}"
+            self._panels = PanelCache(prerendered=_prerendered(self.data_fingerprint, self.prerender_dir))
+            self._shared_ids = None
+            self._memory_bytes = None
+        return True
+
+    def shared_ids(self):
+        """Id seluruh objek yang dijangkau store (untuk membedakan memori bersama dan memori sesi)."""
+        if self._shared_ids is None:
+            ids = set()
+            _deep_sizeof(self.__dict__, ids)
+            self._shared_ids = ids
+        return self._shared_ids
+
+    def memory_bytes(self):
+        """Perkiraan ukuran komponen utama store (byte), dihitung sekali per versi data."""
+        if self._memory_bytes is None:
+            # Komponen lazy yang belum dimuat tidak dihitung (dan tidak dipaksa dimuat)
+            components = {'df_sentimen': self.df_sentimen, 'norm_dict': dict(self.norm_dict),
+                          'search_index': self._search_index}
+            state = self._model_state
+            if state is not None:
+                components.update(zip(['vectorizer', 'fselector', 'model'], state[2]))
+            self._memory_bytes = {name: deep_sizeof(obj) for name, obj in components.items() if obj is not None}
+        return self._memory_bytes
+
+    # ---- Memori sesi -------------------------------------------------------
+
+    def record_session_footprint(self, session_key, footprint_bytes):
+        """
+        Mencatat memori terakhir satu sesi (hasil ``session_footprint``).
+
+        Store tidak membaca ``session_state`` sesi lain; setiap sesi mencatat
+        miliknya sendiri, dan catatan yang lebih lama dari ``SESSION_FOOTPRINT_TTL``
+        dibuang.
+
+        Args:
+            session_key (str): Kunci unik sesi (disimpan di ``st.session_state``).
+            footprint_bytes (int): Memori sesi di luar store (byte).
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._session_footprints[session_key] = (footprint_bytes, now)
+            for key, (_, recorded_at) in list(self._session_footprints.items()):
+                if now - recorded_at > SESSION_FOOTPRINT_TTL:
+                    del self._session_footprints[key]
+
+    def session_footprints(self):
+        """
+        Returns:
+            dict: Kunci sesi -> memori terakhir yang dicatat (byte), hanya sesi yang
+            mencatat dalam ``SESSION_FOOTPRINT_TTL`` detik terakhir.
+        """
+        now = time.monotonic()
+        return {key: footprint for key, (footprint, recorded_at) in list(self._session_footprints.items())
+                if now - recorded_at <= SESSION_FOOTPRINT_TTL}
+
+
+def _prerendered(fingerprint, prerender_dir):
+    return PrerenderedPanels(fingerprint, root=prerender_dir) if prerender_dir else None
+
+
+def _file_size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """
+    Mengambil ``SharedStore`` milik proses ini (dibuat saat pertama dipanggil)
+    dan memastikan datanya mengikuti versi file terbaru.
+
+    Set ``STEM_CACHE_PATH=""`` untuk menonaktifkan penyimpanan cache stemming ke disk,
+    dan ``PRERENDER_DIR=""`` agar panel dashboard selalu dihitung langsung.
+    """
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = SharedStore(stem_cache_path=os.environ.get("STEM_CACHE_PATH", STEM_CACHE_PATH),
+                                     prerender_dir=os.environ.get("PRERENDER_DIR", PRERENDER_DIR))
+    _store.refresh()
+    return _store
+
+
+# ----------------------------------------------------------------------------
+# Akuntansi Memori per Sesi
+# ----------------------------------------------------------------------------
+
+def _deep_sizeof(obj, seen):
+    # Ukuran objek beserta isinya; objek yang id-nya sudah ada di ``seen`` tidak dihitung lagi
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        usage = obj.memory_usage(deep=True, index=True)
+        return int(usage.sum() if isinstance(usage, pd.Series) else usage)
+    if isinstance(obj, np.ndarray):
+        # getsizeof hanya mencakup buffer bila array memiliki datanya sendiri
+        return sys.getsizeof(obj) + (0 if obj.flags.owndata else obj.nbytes)
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, int, float, bool)) or obj is None:
+        return size
+    # Isi container disalin dulu (operasi C, tanpa berpindah thread): cache bersama
+    # dapat bertambah oleh sesi lain selama penghitungan
+    if isinstance(obj, dict):
+        size += sum(_deep_sizeof(k, seen) + _deep_sizeof(v, seen) for k, v in list(dict.items(obj)))
+    elif isinstance(obj, MappingProxyType):
+        size += sum(_deep_sizeof(k, seen) + _deep_sizeof(v, seen) for k, v in list(obj.items()))
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_deep_sizeof(item, seen) for item in list(obj))
+    elif hasattr(obj, '__dict__'):
+        size += _deep_sizeof(vars(obj), seen)
+    else:
+        # Objek ekstensi (mis. Tree scikit-learn) menyimpan buffernya di state pickle.
+        # State ini objek sementara, jadi id-nya tidak dicatat di ``seen``.
+        try:
+            state = obj.__getstate__()
+        except Exception:
+            state = None
+        if isinstance(state, dict):
+            size += _deep_sizeof(state, set())
+    return size
+
+
+def deep_sizeof(obj, exclude_ids=()):
+    """
+    Perkiraan ukuran memori sebuah objek beserta isinya (byte).
+
+    Args:
+        obj (object): Objek yang diukur.
+        exclude_ids (set): Id objek yang tidak dihitung (mis. milik ``SharedStore``).
+    """
+    return _deep_sizeof(obj, set(exclude_ids))
+
+
+def session_footprint(session_state, store):
+    """
+    Memori yang dipegang satu sesi di luar ``SharedStore``.
+
+    Args:
+        session_state (Mapping): ``st.session_state`` sesi yang diukur.
+        store (SharedStore): Store bersama; objek yang dijangkau store dihitung 0.
+
+    Returns:
+        pd.DataFrame: Kolom 'Key', 'Byte', 'Bersama' (True jika objek milik store).
+    """
+    shared = store.shared_ids()
+    rows = []
+    for key in list(session_state.keys()):
+        value = session_state[key]
+        if isinstance(value, (str, bytes, int, float, bool)) or value is None:
+            # Skalar (mis. nilai filter) selalu milik sesi, walau id-nya bisa kebetulan sama (interning)
+            rows.append({'Key': key, 'Byte': sys.getsizeof(value), 'Bersama': False})
+            continue
+        rows.append({
+            'Key': key,
+            'Byte': deep_sizeof(value, exclude_ids=shared),
+            'Bersama': id(value) in shared,
+        })
+    return pd.DataFrame(rows, columns=['Key', 'Byte', 'Bersama'])
@@ -0,0 +1,202 @@
+import argparse
+import atexit
+import glob
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+
+# ----------------------------------------------------------------------------
+# Cache Stemming Bersama
+# ----------------------------------------------------------------------------
+
+STEM_CACHE_PATH = 'Data/.cache/stem_cache.json'
+
+
+class StemCache:
+    """
+    Cache memoization (LRU, terbatas) untuk stemmer Sastrawi yang aman dipakai
+    bersama oleh banyak sesi Streamlit dalam satu proses.
+
+    Args:
+        stemmer: Objek dengan method ``stem(word)``, mis. ``Stemmer`` Sastrawi.
+        maxsize (int): Jumlah maksimum kata yang disimpan.
+        path (str | None): Lokasi file JSON untuk persistensi. ``None`` berarti
+            cache hanya hidup di memori.
+        autosave_every (int): Simpan ke disk setiap sejumlah miss baru.
+    """
+
+    def __init__(self, stemmer, maxsize=200_000, path=None, autosave_every=500):
+        self.stemmer = stemmer
+        self.maxsize = maxsize
+        self.path = path
+        self.autosave_every = autosave_every
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._unsaved = 0
+
+        if path:
+            self.load(path)
+            atexit.register(self.save)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stem(self, word):
+        """
+        Mengembalikan bentuk dasar kata, memakai hasil yang sudah tersimpan jika ada.
+
+        Args:
+            word (str): Satu token huruf kecil.
+
+        Returns:
+            str: Hasil stemming.
+        """
+        with self._lock:
+            stem = self._entries.get(word)
+            if stem is not None:
+                self._entries.move_to_end(word)
+                self.hits += 1
+                return stem
+
+        # Stemming dijalankan di luar lock agar sesi lain tidak ikut menunggu
+        stem = self.stemmer.stem(word)
+
+        with self._lock:
+            self.misses += 1
+            self._put(word, stem)
+            self._unsaved += 1
+            should_save = self.path and self._unsaved >= self.autosave_every
+
+        if should_save:
+            self.save()
+        return stem
+
+    def _put(self, word, stem):
+        self._entries[word] = stem
+        self._entries.move_to_end(word)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def seed(self, words):
+        """
+        Mengisi cache terlebih dahulu dari daftar kata (kata yang sudah ada dilewati).
+
+        Args:
+            words (Iterable[str]): Kata-kata yang akan di-stem.
+
+        Returns:
+            int: Jumlah kata baru yang ditambahkan.
+        """
+        added = 0
+        for word in words:
+            if not word:
+                continue
+            with self._lock:
+                known = word in self._entries
+            if known:
+                continue
+
+            # Stemming di luar lock, seperti stem()
+            stem = self.stemmer.stem(word)
+            with self._lock:
+                if word in self._entries:
+                    # Sudah diisi sesi lain selama stemming
+                    continue
+                self._put(word, stem)
+                self._unsaved += 1
+            added += 1
+        return added
+
+    def stats(self):
+        """
+        Statistik pemakaian cache.
+
+        Returns:
+            dict: hits, misses, hit_ratio, size, dan maxsize.
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / total if total else 0.0,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+        }
+
+    def load(self, path=None):
+        """Memuat isi cache dari file JSON jika file tersebut ada."""
+        path = path or self.path
+        if not path or not os.path.exists(path):
+            return
+        with open(path, encoding='utf-8') as f:
+            entries = json.load(f)
+        with self._lock:
+            for word, stem in entries.items():
+                self._put(word, stem)
+
+    def save(self, path=None):
+        """Menyimpan isi cache ke file JSON secara atomik."""
+        path = path or self.path
+        if not path:
+            return
+        with self._lock:
+            entries = dict(self._entries)
+            self._unsaved = 0
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+
+def create_stem_cache(path=STEM_CACHE_PATH, maxsize=200_000):
+    """
+    Membuat StemCache dengan stemmer Sastrawi tanpa cache internalnya
+    (cache bawaan Sastrawi tidak terbatas dan tidak dibagi antar objek).
+    """
+    from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
+
+    stemmer = StemmerFactory().create_stemmer().delegatedStemmer
+    return StemCache(stemmer, maxsize=maxsize, path=path or None)
+
+
+# ----------------------------------------------------------------------------
+# CLI: pre-seed cache dari vocabulary TF-IDF dan korpus ReLabeling
+# ----------------------------------------------------------------------------
+
+def iter_seed_words(vectorizer_path, corpus_glob):
+    import pandas as pd
+
+    from loaders import read_kamus
+    from text_preprocessing import KamusNormalizer, clean_text
+
+    with open(vectorizer_path, 'rb') as f:
+        vectorizer = pickle.load(f)
+    yield from vectorizer.vocabulary_
+
+    normalizer = KamusNormalizer(read_kamus())
+    for path in sorted(glob.glob(corpus_glob)):
+        for text in pd.read_csv(path)['full_text'].dropna().astype(str):
+            yield from normalizer.normalize(clean_text(text)).split()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-seed cache stemming Sastrawi ke disk.")
+    parser.add_argument('--output', default=STEM_CACHE_PATH)
+    parser.add_argument('--vectorizer', default='Model/best_saved_tfidf_vectorizer.pkl')
+    parser.add_argument('--corpus', default='Data/ReLabeling - *.csv')
+    parser.add_argument('--maxsize', type=int, default=200_000)
+    args = parser.parse_args()
+
+    cache = create_stem_cache(path=args.output, maxsize=args.maxsize)
+    added = cache.seed(iter_seed_words(args.vectorizer, args.corpus))
+    cache.save()
+    print(f"{added:,} kata baru di-stem, total {len(cache):,} entri tersimpan di {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,373 @@
+import functools
+import os
+import re
+
+from instrumentation import instrumented, stage
+
+# ----------------------------------------------------------------------------
+# Cleaning & Case Folding
+# ----------------------------------------------------------------------------
+
+def clean_text(text):
+    """
+    Membersihkan teks tweet (URL, entitas HTML, mention, hashtag, angka, simbol)
+    lalu mengubahnya menjadi huruf kecil.
+
+    Args:
+        text (str): Teks tweet mentah.
+
+    Returns:
+        str: Teks bersih berisi huruf a-z yang dipisahkan satu spasi.
+    """
+    # 1. Cleaning
+    text = re.sub(r'https?://\S+|www\.\S+', ' ', text)
+    text = re.sub(r'&[a-zA-Z0-9#]+;', ' ', text)
+    text = re.sub(r'<[^>]+>', ' ', text)
+    text = re.sub(r'(?<=\w)\.(?=\w)', ' ', text)
+    text = text.replace('\xa0', ' ')
+    text = re.sub(r'[@#]\w+|RT[\s]+', ' ', text)
+    text = re.sub(r'[0-9]', ' ', text)
+    text = re.sub(r'[^A-Za-z ]', ' ', text)
+    text = re.sub(r'[\n\r]', ' ', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+
+    # 2. Case folding
+    return text.lower()
+
+
+# ----------------------------------------------------------------------------
+# Cleaning & Case Folding Batch (satu Series sekaligus)
+# ----------------------------------------------------------------------------
+
+# Kasus sulit untuk jalur batch (RE2 pyarrow) vs clean_text per tweet: URL, entitas HTML,
+# tag, 'RT', titik di antara kata, spasi non-ASCII, huruf non-Latin (dipakai tes & benchmark parity)
+EDGE_CASES = [
+    "RT @user: halo", "RT.bagus sekali", "RT.RT.RT.x", "xRT.y", "RT. x", "RT\xa0kabar", "RT\u2003x",
+    "#RT.mantap", "@user.name oke", "a.b.c", "https://t.co/x<b>y</b>", "<a href=http://x>teks</a>",
+    "R&amp;T", "RT&amp;x", "RT<b>x</b>", "RThttps://t.co/x y", "www.jatim.go.id.", "&#8217;kata&gt;",
+    "satu\n\ndua\r\ntiga", "angka 2024 dan 3x", "émoji ✨ dan ñ", "ＲＴ lebar", "é_#tag é", "\xa0#\xa0x",
+    "", "   ", "yang yang dan dan di di", "dan dan x dan", "pilkada #Jatim2024 @KPU_Jatim",
+]
+
+# Satu-satunya bagian clean_text yang butuh lookaround: titik di antara dua karakter kata
+# menjadi spasi, dan spasi itu bisa membuat 'RT' diikuti whitespace (mis. 'RT.x')
+_MENTION_HASHTAG_RT = re.compile(r'[@#]\w+|RT(?:\s+|\.(?=\w))')
+
+
+def _re2_class(python_class, negate=False):
+    # Kelas karakter RE2 berisi code point yang cocok dengan kelas ``re`` Python (mis. r'\w'),
+    # agar \w / \s / \S Unicode berperilaku sama persis di kedua mesin regex.
+    # Surrogate (D800-DFFF) tidak mungkin ada di string Arrow, jadi dilewati.
+    ranges = []
+    for first, last in ((0, 0xD7FF), (0xE000, 0x10FFFF)):
+        segment = ''.join(map(chr, range(first, last + 1)))
+        for match in re.finditer(python_class + '+', segment):
+            start, end = first + match.start(), first + match.end() - 1
+            ranges.append(f'\\x{{{start:x}}}' if start == end else f'\\x{{{start:x}}}-\\x{{{end:x}}}')
+    return f"[{'^' if negate else ''}{''.join(ranges)}]"
+
+
+@functools.lru_cache(maxsize=None)
+def _batch_cleaning_patterns():
+    """
+    Pola RE2 (pyarrow) yang menggantikan sepuluh langkah ``clean_text``.
+
+    - Langkah URL dan entitas HTML/tag tetap terpisah karena hasil penggantiannya
+      bisa membentuk 'RT' + whitespace baru untuk langkah mention/hashtag.
+    - Entitas HTML dan tag digabung: entitas tidak memuat '<' atau '>', jadi
+      keduanya tidak pernah beririsan sebagian.
+    - Titik di antara karakter kata dan '\xa0' hanya berpengaruh lewat 'RT.';
+      sisanya sudah bukan huruf, sehingga ikut hilang di langkah terakhir.
+    - Angka, simbol, newline, dan spasi berulang menjadi satu penggantian ``[^A-Za-z]+``.
+    """
+    word = _re2_class(r'\w')
+    space = _re2_class(r'\s')
+    not_space = _re2_class(r'\s', negate=True)
+    return (rf'https?://{not_space}+|www\.{not_space}+',
+            r'&[a-zA-Z0-9#]+;|<[^>]+>',
+            rf'[@#]{word}+|RT{space}+')
+
+
+def clean_text_series(texts):
+    """
+    Versi batch ``clean_text``: hasilnya identik per baris, tetapi seluruh
+    Series diproses dengan empat penggantian regex tervektorisasi (pyarrow)
+    alih-alih sepuluh ``re.sub`` per tweet.
+
+    Args:
+        texts (pd.Series | list): Teks tweet mentah. Nilai non-string menghasilkan None.
+
+    Returns:
+        pd.Series: Teks bersih (indeks sama dengan input jika berupa Series).
+    """
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    index = texts.index if isinstance(texts, pd.Series) else None
+    values = pa.array([text if isinstance(text, str) else None for text in texts], type=pa.large_string())
+    url_pattern, html_pattern, mention_pattern = _batch_cleaning_patterns()
+
+    # 1. URL, lalu entitas HTML dan tag
+    values = pc.replace_substring_regex(values, url_pattern, ' ')
+    values = pc.replace_substring_regex(values, html_pattern, ' ')
+
+    # 2. Mention, hashtag, dan 'RT'; baris yang memuat 'RT.' memakai regex Python (butuh lookahead)
+    rt_dot = pc.fill_null(pc.match_substring(values, 'RT.'), False)
+    cleaned = pc.replace_substring_regex(values, mention_pattern, ' ')
+    if pc.any(rt_dot).as_py():
+        rows = pc.filter(values, rt_dot).to_pylist()
+        cleaned = pc.replace_with_mask(cleaned, rt_dot,
+                                       pa.array([_MENTION_HASHTAG_RT.sub(' ', text) for text in rows],
+                                                type=pa.large_string()))
+
+    # 3. Hanya huruf a-z yang tersisa, dipisahkan satu spasi, lalu case folding
+    cleaned = pc.replace_substring_regex(cleaned, '[^A-Za-z]+', ' ')
+    cleaned = pc.ascii_lower(pc.utf8_trim(cleaned, ' '))
+    return pd.Series(cleaned.to_pylist(), index=index, dtype=object)
+
+
+# ----------------------------------------------------------------------------
+# Normalisasi Kata
+# ----------------------------------------------------------------------------
+
+# Kunci kamus yang bisa muncul pada teks hasil clean_text (huruf kecil + spasi tunggal)
+_VALID_KEY = re.compile(r'[a-z]+(?: [a-z]+)*')
+
+
+class KamusNormalizer:
+    """
+    Normalisasi kata berbasis lookup token terhadap kamus normalisasi.
+
+    Menghasilkan keluaran yang sama dengan substitusi regex
+    ``\\b(k1|k2|...)\\b`` atas seluruh kunci kamus, tetapi dibangun sekali
+    saja sehingga tiap pesan cukup dipindai token per token.
+
+    Kunci multi-kata (mis. 'tgg jwb') dicocokkan terhadap token-token berikutnya.
+    Jika beberapa kunci cocok pada posisi yang sama, kunci yang lebih dulu
+    muncul di kamus yang dipakai, sama seperti urutan alternation pada regex.
+    Kunci yang memuat karakter selain huruf kecil dan spasi diabaikan karena
+    tidak mungkin muncul setelah cleaning.
+    """
+
+    def __init__(self, norm_dict):
+        # Kandidat per token pertama: list (urutan kamus, token kunci, pengganti)
+        candidates = {}
+        for rank, (key, value) in enumerate(norm_dict.items()):
+            if not isinstance(key, str) or not _VALID_KEY.fullmatch(key):
+                continue
+            key_tokens = tuple(key.split(' '))
+            candidates.setdefault(key_tokens[0], []).append((rank, key_tokens, value))
+
+        # Kunci satu kata tanpa pesaing multi-kata cukup disimpan sebagai dict biasa
+        self._single = {}
+        self._multi = {}
+        for first, entries in candidates.items():
+            if len(entries) == 1 and len(entries[0][1]) == 1:
+                self._single[first] = entries[0][2]
+            else:
+                self._multi[first] = [(key_tokens, value) for _, key_tokens, value in sorted(entries)]
+
+    def __len__(self):
+        return len(self._single) + sum(len(entries) for entries in self._multi.values())
+
+    def normalize(self, text):
+        """
+        Menormalisasi teks hasil ``clean_text``.
+
+        Args:
+            text (str): Teks huruf kecil dengan token dipisahkan satu spasi.
+
+        Returns:
+            str: Teks dengan kata tidak baku diganti sesuai kamus.
+        """
+        if not text:
+            return text
+
+        tokens = text.split(' ')
+        single = self._single
+        multi = self._multi
+        n_tokens = len(tokens)
+        result = []
+        i = 0
+
+        while i < n_tokens:
+            token = tokens[i]
+            entries = multi.get(token)
+            if entries is None:
+                result.append(single.get(token, token))
+                i += 1
+                continue
+
+            for key_tokens, value in entries:
+                width = len(key_tokens)
+                if width == 1 or tuple(tokens[i:i + width]) == key_tokens:
+                    result.append(value)
+                    i += width
+                    break
+            else:
+                result.append(token)
+                i += 1
+
+        return ' '.join(result)
+
+    __call__ = normalize
+
+
+# ----------------------------------------------------------------------------
+# Stopword Removal & Pipeline Lengkap
+# ----------------------------------------------------------------------------
+
+# Stopword tambahan di luar daftar NLTK dan Sastrawi
+MORE_STOP_WORDS = ["loh", "lah", "dong"]
+
+
+# Salinan daftar stopword NLTK 'indonesian' yang dibundel bersama proyek
+# (tidak perlu nltk.download maupun import nltk saat aplikasi berjalan)
+NLTK_STOPWORDS_PATH = 'Data/stopwords_indonesian.txt'
+
+
+def load_nltk_stopwords(path=NLTK_STOPWORDS_PATH):
+    """
+    Membaca daftar stopword NLTK bahasa Indonesia dari salinan lokal.
+    Korpus NLTK hanya dipakai jika salinan tidak ada (tanpa download).
+
+    Returns:
+        list[str]: Daftar stopword.
+    """
+    if path and os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            return [line.strip() for line in f if line.strip()]
+
+    from nltk.corpus import stopwords
+    return stopwords.words('indonesian')
+
+
+def build_stop_words_remover():
+    """
+    Membuat StopWordRemover Sastrawi dari gabungan stopword NLTK, Sastrawi,
+    dan ``MORE_STOP_WORDS``.
+
+    Returns:
+        StopWordRemover: Objek penghapus stopword.
+    """
+    from Sastrawi.StopWordRemover.StopWordRemoverFactory import StopWordRemoverFactory, StopWordRemover, ArrayDictionary
+
+    combined_stopwords = set(load_nltk_stopwords() +
+                             StopWordRemoverFactory().get_stop_words() +
+                             MORE_STOP_WORDS)
+    stopword_dictionary = ArrayDictionary(list(combined_stopwords))
+    return StopWordRemover(stopword_dictionary)
+
+
+@instrumented('preprocess')
+def preprocess_tweet(text, normalizer, stop_words_remover, stemmer):
+    """
+    Menjalankan seluruh tahap preprocessing pada satu tweet.
+
+    Args:
+        text (str): Teks tweet mentah.
+        normalizer (KamusNormalizer): Normalisasi kata alay.
+        stop_words_remover (StopWordRemover): Penghapus stopword.
+        stemmer: Objek dengan method ``stem(word)``.
+
+    Returns:
+        str | None: Teks hasil preprocessing, atau None jika hasilnya kosong.
+    """
+    # 1-2. Cleaning & case folding
+    with stage('preprocess.clean'):
+        text = clean_text(text)
+
+    # 3. Normalisasi kata
+    with stage('preprocess.normalize'):
+        text = normalizer.normalize(text)
+
+    return filter_and_stem(text, stop_words_remover, stemmer)
+
+
+def filter_and_stem(text, stop_words_remover, stemmer):
+    """
+    Tahap 4-9 ``preprocess_tweet``: tokenisasi, stopword removal, stemming,
+    dan pembuangan kata satu huruf pada teks yang sudah dinormalisasi.
+
+    Returns:
+        str | None: Teks hasil preprocessing, atau None jika hasilnya kosong.
+    """
+    # 4. Tokenisasi
+    tokens = text.split()
+
+    # 5. Stopword removal
+    with stage('preprocess.stopwords'):
+        filtered_text = stop_words_remover.remove(' '.join(tokens)).split()
+
+    # 6. Stemming
+    with stage('preprocess.stem'):
+        stemmed = [stemmer.stem(word) for word in filtered_text]
+
+    # 7. Hapus kata satu huruf
+    final_tokens = [word for word in stemmed if len(word) > 1]
+
+    # 8. Gabungkan kembali menjadi satu string
+    final_text = ' '.join(final_tokens)
+
+    # 9. Validasi hasil kosong
+    return final_text if final_text.strip() else None
+
+
+def _remove_stopwords(words, stop_words):
+    # Algoritma StopWordRemover.remove Sastrawi apa adanya (list diubah selama
+    # iterasi, sehingga kata tepat setelah stopword yang dihapus ikut terlewati),
+    # hanya lookup-nya memakai set alih-alih list ArrayDictionary
+    for word in words:
+        if word in stop_words:
+            words.remove(word)
+    return words
+
+
+def filter_and_stem_series(texts, stop_words_remover, stemmer):
+    """
+    Versi batch ``filter_and_stem``: stopword dicek lewat set (sekali bangun
+    per batch) dan setiap kata unik distem satu kali untuk seluruh batch.
+
+    Args:
+        texts (pd.Series): Teks yang sudah dinormalisasi.
+
+    Returns:
+        pd.Series: Teks hasil preprocessing (None jika kosong), indeks sama dengan input.
+    """
+    import pandas as pd
+
+    stop_words = frozenset(stop_words_remover.get_dictionary().words)
+
+    # 4-5. Tokenisasi & stopword removal
+    filtered = [_remove_stopwords((text or '').split(), stop_words) for text in texts]
+
+    # 6. Stemming per kata unik
+    stems = {word: stemmer.stem(word) for word in {word for words in filtered for word in words}}
+
+    # 7-9. Hapus kata satu huruf, gabungkan, validasi hasil kosong
+    results = []
+    for words in filtered:
+        final_text = ' '.join(stem for stem in map(stems.__getitem__, words) if len(stem) > 1)
+        results.append(final_text if final_text.strip() else None)
+    return pd.Series(results, index=texts.index, dtype=object)
+
+
+@instrumented('preprocess_series')
+def preprocess_series(texts, normalizer, stop_words_remover, stemmer):
+    """
+    Versi batch ``preprocess_tweet`` untuk satu Series; hasil per baris identik.
+
+    Args:
+        texts (pd.Series): Teks tweet mentah (string).
+        normalizer (KamusNormalizer): Normalisasi kata alay.
+        stop_words_remover (StopWordRemover): Penghapus stopword.
+        stemmer: Objek dengan method ``stem(word)``.
+
+    Returns:
+        pd.Series: Teks hasil preprocessing, atau None untuk baris yang kosong.
+    """
+    # 1-3. Cleaning, case folding (batch) & normalisasi kata
+    normalized = clean_text_series(texts).map(normalizer.normalize)
+
+    return filter_and_stem_series(normalized, stop_words_remover, stemmer)
@@ -0,0 +1,223 @@
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import sys
+import time
+from functools import partial
+
+import numpy as np
+
+from build_dataset import PREPROCESS_CACHE_PATH, RELABELING_PATHS, PreprocessCache, build_dataset, \
+    pipeline_version, read_relabeling
+from loaders import MODEL_PATH, SELECTOR_PATH, VECTORIZER_PATH
+from stem_cache import STEM_CACHE_PATH
+
+# ----------------------------------------------------------------------------
+# Pipeline Training: ReLabeling -> TF-IDF -> Mutual Information -> Random Forest
+# ----------------------------------------------------------------------------
+
+TRAINING_CACHE_DIR = 'Data/.cache/training'
+REPORT_PATH = 'Model/training_report.json'
+
+# Parameter artefak di Model/ (lihat get_params() pickle yang ada)
+VECTORIZER_PARAMS = {'max_df': 0.9, 'min_df': 1, 'ngram_range': (1, 1), 'sublinear_tf': False}
+SELECTOR_PERCENTILE = 70
+PARAM_GRID = {
+    'n_estimators': [100, 200],
+    'max_depth': [None, 100],
+    'min_samples_split': [2, 5],
+}
+
+
+class StageTimer:
+    """Mencatat durasi setiap tahap training untuk laporan."""
+
+    def __init__(self, log=sys.stderr):
+        self.stages = {}
+        self.log = log
+
+    def run(self, name, func):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        self.stages[name] = round(elapsed, 3)
+        print(f"[{name}] {elapsed:.1f} detik", file=self.log)
+        return result
+
+
+def data_hash(*parts):
+    """Hash gabungan teks/label/parameter; kunci cache matriks dan skor MI."""
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(repr(part).encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()[:16]
+
+
+def cached(path, compute):
+    """Memuat hasil dari ``path`` (pickle) atau menghitung dan menyimpannya secara atomik."""
+    if path and os.path.exists(path):
+        with open(path, 'rb') as f:
+            return pickle.load(f), True
+
+    result = compute()
+    if path:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    return result, False
+
+
+def save_artifact(obj, path):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(obj, f)
+    os.replace(tmp_path, path)
+
+
+def train(texts, labels, workers=-1, cache_dir=TRAINING_CACHE_DIR, test_size=0.2, cv=3,
+          param_grid=PARAM_GRID, percentile=SELECTOR_PERCENTILE, random_state=0, timer=None):
+    """
+    Melatih vectorizer, selektor fitur, dan model dari teks yang sudah dipreprocessing.
+
+    Matriks TF-IDF dan skor Mutual Information disimpan di ``cache_dir`` dengan
+    kunci hash data, sehingga training ulang pada data yang sama langsung
+    masuk ke pencarian hyperparameter.
+
+    Args:
+        texts (list): Teks hasil preprocessing (kolom 'joined_swremove').
+        labels (list): Label numerik (kolom 'Label').
+        workers (int): Jumlah core untuk Mutual Information dan GridSearchCV (-1 = semua).
+        cache_dir (str | None): Direktori cache (None = tanpa cache).
+        cv (int): Jumlah fold cross-validation pencarian hyperparameter.
+
+    Returns:
+        tuple: (vectorizer, fselector, model, metrics).
+    """
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.feature_selection import SelectPercentile, mutual_info_classif
+    from sklearn.metrics import accuracy_score, f1_score
+    from sklearn.model_selection import GridSearchCV, StratifiedKFold, train_test_split
+
+    timer = timer or StageTimer()
+    labels = np.asarray(labels)
+
+    def cache_path(name, key):
+        return os.path.join(cache_dir, f"{name}-{key}.pkl") if cache_dir else None
+
+    # 1. Split + TF-IDF (di-cache per hash data dan parameter)
+    tfidf_key = data_hash(texts, labels.tolist(), VECTORIZER_PARAMS, test_size, random_state)
+
+    def fit_tfidf():
+        train_texts, test_texts, y_train, y_test = train_test_split(
+            texts, labels, test_size=test_size, stratify=labels, random_state=random_state)
+        vectorizer = TfidfVectorizer(**VECTORIZER_PARAMS)
+        return vectorizer, vectorizer.fit_transform(train_texts), vectorizer.transform(test_texts), y_train, y_test
+
+    (vectorizer, X_train, X_test, y_train, y_test), hit = timer.run(
+        'tfidf', lambda: cached(cache_path('tfidf', tfidf_key), fit_tfidf))
+    print(f"  TF-IDF {'dari cache' if hit else 'baru'}: {X_train.shape[0]:,} latih x "
+          f"{X_train.shape[1]:,} fitur, {X_test.shape[0]:,} uji", file=timer.log)
+
+    # 2. Mutual Information (paralel per fitur; skor di-cache)
+    score_func = partial(mutual_info_classif, random_state=random_state, n_jobs=workers)
+    scores, hit = timer.run('mutual_info', lambda: cached(
+        cache_path('mi', data_hash(tfidf_key, random_state)), lambda: score_func(X_train, y_train)))
+
+    fselector = SelectPercentile(score_func, percentile=percentile)
+    # Setara fselector.fit(X_train, y_train) tanpa menghitung ulang skor
+    fselector.scores_, fselector.pvalues_ = np.asarray(scores), None
+    fselector.n_features_in_ = X_train.shape[1]
+    X_train_sel, X_test_sel = fselector.transform(X_train), fselector.transform(X_test)
+    print(f"  {X_train_sel.shape[1]:,} fitur terpilih (persentil {percentile})", file=timer.log)
+
+    # 3. Pencarian hyperparameter Random Forest (paralel per kombinasi x fold)
+    search = GridSearchCV(
+        RandomForestClassifier(random_state=random_state, n_jobs=1), param_grid,
+        cv=StratifiedKFold(cv, shuffle=True, random_state=random_state),
+        scoring='f1_macro', n_jobs=workers, refit=False,
+    )
+    timer.run('grid_search', lambda: search.fit(X_train_sel, y_train))
+
+    # 4. Model akhir dengan parameter terbaik pada seluruh data latih
+    model = RandomForestClassifier(random_state=random_state, n_jobs=-1, **search.best_params_)
+    timer.run('fit_final', lambda: model.fit(X_train_sel, y_train))
+
+    predicted = timer.run('evaluate', lambda: model.predict(X_test_sel))
+    metrics = {
+        'best_params': search.best_params_,
+        'cv_f1_macro': round(float(search.best_score_), 4),
+        'test_accuracy': round(float(accuracy_score(y_test, predicted)), 4),
+        'test_f1_macro': round(float(f1_score(y_test, predicted, average='macro')), 4),
+        'n_train': int(X_train.shape[0]),
+        'n_test': int(X_test.shape[0]),
+        'n_features': int(X_train.shape[1]),
+        'n_selected': int(X_train_sel.shape[1]),
+    }
+    return vectorizer, fselector, model, metrics
+
+
+# ----------------------------------------------------------------------------
+# CLI
+# ----------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Melatih ulang artefak Model/ dari file ReLabeling.")
+    parser.add_argument('inputs', nargs='*', default=RELABELING_PATHS)
+    parser.add_argument('--output-dir', default=os.path.dirname(MODEL_PATH))
+    parser.add_argument('--workers', type=int, default=-1, help="Default: seluruh core CPU")
+    parser.add_argument('--cv', type=int, default=3)
+    parser.add_argument('--cache-dir', default=TRAINING_CACHE_DIR, help='"" untuk menonaktifkan cache')
+    parser.add_argument('--preprocess-cache', default=PREPROCESS_CACHE_PATH)
+    parser.add_argument('--stem-cache', default=STEM_CACHE_PATH)
+    args = parser.parse_args()
+
+    timer = StageTimer()
+    start = time.perf_counter()
+
+    # 1. Preprocessing (cache per hash konten tweet, sama dengan build_dataset.py)
+    def preprocess():
+        cache = PreprocessCache(args.preprocess_cache or None, version=pipeline_version())
+        dataset, n_new = build_dataset(read_relabeling(args.inputs), cache,
+                                       workers=None if args.workers < 1 else args.workers,
+                                       stem_cache_path=args.stem_cache)
+        print(f"  {len(dataset):,} tweet ({n_new:,} baru diproses)", file=timer.log)
+        return dataset
+
+    dataset = timer.run('preprocess', preprocess)
+
+    # 2. TF-IDF, Mutual Information, GridSearchCV, model akhir
+    vectorizer, fselector, model, metrics = train(
+        dataset['joined_swremove'].tolist(), dataset['Label'].tolist(), workers=args.workers,
+        cache_dir=args.cache_dir or None, cv=args.cv, timer=timer)
+
+    # 3. Tiga artefak yang dimuat read_model()
+    os.makedirs(args.output_dir, exist_ok=True)
+    paths = {name: os.path.join(args.output_dir, os.path.basename(path)) for name, path in
+             (('vectorizer', VECTORIZER_PATH), ('selector', SELECTOR_PATH), ('model', MODEL_PATH))}
+    timer.run('save', lambda: [save_artifact(obj, paths[name]) for name, obj in
+                               (('vectorizer', vectorizer), ('selector', fselector), ('model', model))])
+
+    report = {
+        'inputs': args.inputs,
+        'artifacts': paths,
+        'metrics': metrics,
+        'stage_seconds': timer.stages,
+        'total_seconds': round(time.perf_counter() - start, 3),
+        'workers': args.workers if args.workers > 0 else os.cpu_count(),
+    }
+    report_path = os.path.join(args.output_dir, os.path.basename(REPORT_PATH))
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"Selesai dalam {report['total_seconds']:.1f} detik; F1 makro uji {metrics['test_f1_macro']:.4f}, "
+          f"parameter {metrics['best_params']} -> {args.output_dir} (laporan: {report_path})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+import hashlib
+import io
+import os
+import shutil
+import threading
+from collections import OrderedDict
+
+from instrumentation import instrumented
+
+# ----------------------------------------------------------------------------
+# Render & Cache Gambar WordCloud
+# ----------------------------------------------------------------------------
+
+WORDCLOUD_CACHE_DIR = 'Data/.cache/wordcloud'
+
+# Seed tetap agar tata letak dan warna acak selalu sama untuk input yang sama
+WORDCLOUD_SEED = 42
+
+
+@instrumented('render.wordcloud')
+def render_wordcloud_png(frequencies, width=800, height=400, color_func=None, **kwargs):
+    """
+    Membuat WordCloud dari tabel frekuensi dan mengembalikannya sebagai PNG.
+
+    Args:
+        frequencies (dict): Pemetaan kata -> frekuensi.
+        width (int): Lebar gambar (piksel).
+        height (int): Tinggi gambar (piksel).
+        color_func (Callable | None): Fungsi warna WordCloud.
+
+    Returns:
+        bytes: Gambar PNG.
+    """
+    from wordcloud import WordCloud
+
+    wordcloud = WordCloud(
+        width=width,
+        height=height,
+        background_color='white',
+        color_func=color_func,
+        random_state=WORDCLOUD_SEED,
+        **kwargs
+    ).generate_from_frequencies(frequencies)
+
+    buffer = io.BytesIO()
+    wordcloud.to_image().save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+class WordCloudCache:
+    """
+    Cache gambar PNG dua tingkat: LRU di memori lalu file di disk.
+
+    File disimpan per fingerprint data; ketika fingerprint baru muncul,
+    direktori fingerprint lama dihapus.
+
+    Args:
+        cache_dir (str | None): Direktori cache di disk (None = hanya memori).
+        max_items (int): Jumlah gambar maksimum di memori.
+    """
+
+    def __init__(self, cache_dir=WORDCLOUD_CACHE_DIR, max_items=128):
+        self.cache_dir = cache_dir
+        self.max_items = max_items
+        self.hits = 0
+        self.misses = 0
+        self._images = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_render(self, key, render, fingerprint=None):
+        """
+        Mengambil gambar dari cache atau membuatnya dengan ``render()``.
+
+        Args:
+            key (tuple): Identitas gambar, mis. (jenis, tokoh, sentimen, lebar, tinggi).
+            render (Callable[[], bytes]): Fungsi pembuat PNG jika cache kosong.
+            fingerprint (str | None): Sidik jari data sumber.
+
+        Returns:
+            bytes: Gambar PNG.
+        """
+        digest = hashlib.sha1(repr((fingerprint, key)).encode('utf-8')).hexdigest()
+
+        with self._lock:
+            image = self._images.get(digest)
+            if image is not None:
+                self._images.move_to_end(digest)
+                self.hits += 1
+                return image
+
+        path = self._path(digest, fingerprint)
+        if path and os.path.exists(path):
+            with open(path, 'rb') as f:
+                image = f.read()
+            self.hits += 1
+        else:
+            image = render()
+            self.misses += 1
+            if path:
+                self._write(path, image, fingerprint)
+
+        with self._lock:
+            self._images[digest] = image
+            if len(self._images) > self.max_items:
+                self._images.popitem(last=False)
+        return image
+
+    def stats(self):
+        """
+        Returns:
+            dict: hits (memori atau disk), misses (gambar dirender), dan size (gambar di memori).
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._images)}
+
+    def _path(self, digest, fingerprint):
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, str(fingerprint), f"{digest}.png")
+
+    def _write(self, path, image, fingerprint):
+        directory = os.path.dirname(path)
+        if not os.path.isdir(directory):
+            # Fingerprint baru: buang gambar dari versi data sebelumnya
+            if os.path.isdir(self.cache_dir):
+                for name in os.listdir(self.cache_dir):
+                    if name != str(fingerprint):
+                        shutil.rmtree(os.path.join(self.cache_dir, name), ignore_errors=True)
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(image)
+        os.replace(tmp_path, path)
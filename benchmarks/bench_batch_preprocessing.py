@@ -0,0 +1,86 @@
+"""
+Parity check dan benchmark preprocessing batch (``preprocess_series``)
+vs ``preprocess_tweet`` per tweet.
+
+Seluruh korpus ``ReLabeling - Gabungan.csv`` diproses dengan kedua jalur;
+hasil cleaning dan hasil akhir harus identik untuk setiap baris. Kasus
+sulit buatan (URL, entitas HTML, tag, 'RT', titik di antara kata, spasi
+non-ASCII, huruf non-Latin) ikut dibandingkan.
+
+Kedua jalur memakai cache stemming yang di-pre-seed dari file yang sama,
+sehingga perbandingan tidak didominasi stemming Sastrawi dingin.
+
+Jalankan dari direktori utama proyek:
+    python benchmarks/bench_batch_preprocessing.py [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'Dashboard'))
+
+import pandas as pd
+
+from build_dataset import RELABELING_PATHS, read_relabeling
+from loaders import read_kamus
+from stem_cache import STEM_CACHE_PATH, create_stem_cache
+from text_preprocessing import (EDGE_CASES, KamusNormalizer, build_stop_words_remover, clean_text,
+                                clean_text_series, preprocess_series, preprocess_tweet)
+
+
+def load_pipeline():
+    stemmer = create_stem_cache(path=None)
+    if os.path.exists(STEM_CACHE_PATH):
+        stemmer.load(STEM_CACHE_PATH)
+    return KamusNormalizer(read_kamus()), build_stop_words_remover(), stemmer
+
+
+def best_of(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    texts = read_relabeling(RELABELING_PATHS)['full_text']
+    normalizer, stop_words_remover, stemmer = load_pipeline()
+
+    # 1. Parity (korpus + kasus sulit)
+    mismatches = []
+    for name, series in [('korpus', texts), ('kasus sulit', pd.Series(EDGE_CASES))]:
+        cleaned = clean_text_series(series)
+        final = preprocess_series(series, normalizer, stop_words_remover, stemmer)
+        for i, text in enumerate(series):
+            if cleaned.iloc[i] != clean_text(text):
+                mismatches.append(f'{name} clean_text {text!r}')
+            if final.iloc[i] != preprocess_tweet(text, normalizer, stop_words_remover, stemmer):
+                mismatches.append(f'{name} preprocess {text!r}')
+    print(f"Parity ({len(texts):,} tweet korpus + {len(EDGE_CASES)} kasus sulit): "
+          f"{'identik' if not mismatches else 'BERBEDA: ' + ', '.join(mismatches[:10])}")
+
+    # 2. Waktu (cache stemming sudah hangat untuk kedua jalur)
+    print(f"\n{'tahap':<22}{'per tweet (s)':>15}{'batch (s)':>11}{'speedup':>9}")
+    rows = [
+        ('cleaning', lambda: [clean_text(text) for text in texts], lambda: clean_text_series(texts)),
+        ('preprocessing penuh', lambda: [preprocess_tweet(text, normalizer, stop_words_remover, stemmer)
+                                         for text in texts],
+         lambda: preprocess_series(texts, normalizer, stop_words_remover, stemmer)),
+    ]
+    for name, single, batch in rows:
+        single_time, _ = best_of(single, args.repeat)
+        batch_time, _ = best_of(batch, args.repeat)
+        print(f"{name:<22}{single_time:>15.3f}{batch_time:>11.3f}{single_time / batch_time:>8.1f}x")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""
+Perbandingan waktu muat, RSS, dan kecepatan filter/groupby dataset analisis:
+CSV (dtype default) vs Arrow IPC dengan kolom categorical (memory map).
+
+Setiap format diukur di proses terpisah agar RSS tidak saling memengaruhi.
+Gunakan ``--scale`` untuk menggandakan dataset (mis. 20x) dan melihat efeknya
+pada ukuran data yang lebih besar.
+
+Jalankan dari direktori utama proyek:
+    python benchmarks/bench_columnar.py [--scale 20]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'Dashboard'))
+
+import pandas as pd
+
+from loaders import DATA_PATH, NAME_MAPPING, read_columnar, to_categorical, write_columnar
+
+MODES = ['csv', 'arrow', 'arrow-mmap']
+
+
+def rss_mb():
+    # RSS proses saat ini dari /proc (Linux)
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1e6
+
+
+def load(mode, csv_path, arrow_path):
+    if mode == 'csv':
+        # Jalur lama load_data(): read_csv dengan dtype default
+        df = pd.read_csv(csv_path)
+        df['tokoh'] = df['tokoh'].map(NAME_MAPPING)
+        return df
+    df = read_columnar(arrow_path, memory_map=(mode == 'arrow-mmap'))
+    df['tokoh'] = df['tokoh'].map(NAME_MAPPING)
+    return df
+
+
+def dashboard_ops(df):
+    # Pola akses page_dashboard.py: filter boolean per (tokoh, sentimen) dan groupby distribusi
+    for tokoh in df['tokoh'].unique():
+        for sentimen in ['Positif', 'Netral', 'Negatif']:
+            len(df[(df['tokoh'] == tokoh) & (df['Sentimen'] == sentimen)])
+    df.groupby(['tokoh', 'Sentimen']).size()
+    df['Sentimen'].value_counts()
+
+
+def measure(mode, csv_path, arrow_path, repeat=20):
+    # Dijalankan di subprocess: satu format per proses
+    import pyarrow  # noqa: F401 (dimuat lebih dulu agar biaya import tidak dihitung sebagai data)
+
+    base = rss_mb()
+    start = time.perf_counter()
+    df = load(mode, csv_path, arrow_path)
+    load_time = time.perf_counter() - start
+    rss = rss_mb() - base
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        dashboard_ops(df)
+    ops_time = (time.perf_counter() - start) / repeat
+
+    deep = df.memory_usage(deep=True).sum() / 1e6
+    print(f"{mode},{load_time},{rss},{deep},{ops_time}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scale', type=int, default=1, help="Gandakan dataset N kali")
+    parser.add_argument('--measure', choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument('--csv', help=argparse.SUPPRESS)
+    parser.add_argument('--arrow', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(args.measure, args.csv, args.arrow)
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = os.path.join(tmp_dir, 'data.csv')
+        arrow_path = os.path.join(tmp_dir, 'data.arrow')
+
+        df = pd.read_csv(DATA_PATH)
+        df = pd.concat([df] * args.scale, ignore_index=True)
+        df.to_csv(csv_path, index=False)
+        write_columnar(df, arrow_path)
+
+        # Parity: isi Arrow identik dengan CSV (selain dtype categorical)
+        expected = to_categorical(pd.read_csv(csv_path))
+        pd.testing.assert_frame_equal(read_columnar(arrow_path), expected, check_categorical=False)
+        print(f"Parity: isi Arrow identik dengan CSV ({len(df):,} baris)")
+        print(f"Ukuran file: CSV {os.path.getsize(csv_path) / 1e6:.1f} MB, "
+              f"Arrow {os.path.getsize(arrow_path) / 1e6:.1f} MB\n")
+
+        print(f"{'format':<12}{'muat (ms)':>12}{'RSS +MB':>10}{'memori df MB':>14}{'filter+groupby (ms)':>22}")
+        for mode in MODES:
+            output = subprocess.run(
+                [sys.executable, __file__, '--measure', mode, '--csv', csv_path, '--arrow', arrow_path],
+                capture_output=True, text=True, check=True
+            ).stdout.strip().splitlines()[-1]
+            _, load_time, rss, deep, ops_time = output.split(',')
+            print(f"{mode:<12}{float(load_time) * 1000:>12.1f}{float(rss):>10.1f}"
+                  f"{float(deep):>14.1f}{float(ops_time) * 1000:>22.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
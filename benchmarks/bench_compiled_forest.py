@@ -0,0 +1,73 @@
+"""
+Parity check dan benchmark latensi ``CompiledForest`` vs
+``RandomForestClassifier.predict_proba`` (jalur page_prediksi.py) pada
+batch 1 sampai 64 baris dan 10.000 baris, untuk menentukan ``BATCH_THRESHOLD``.
+
+Kolom "compiled" selalu memakai evaluator array (tanpa fallback) agar
+terlihat di mana ia unggul; kolom "hybrid" adalah perilaku
+``COMPILED_FOREST=1`` (batch besar diserahkan ke scikit-learn).
+
+Jalankan dari direktori utama proyek:
+    python benchmarks/bench_compiled_forest.py
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'Dashboard'))
+
+import numpy as np
+import scipy.sparse as sp
+
+from compiled_forest import CompiledForest
+from loaders import read_data, read_model
+
+BATCH_SIZES = [1, 2, 4, 8, 16, 32, 64, 10_000]
+
+
+def timed(func, min_time=1.0):
+    # Diulang sampai minimal ``min_time`` detik; mengembalikan rata-rata per panggilan
+    func()
+    calls, start = 0, time.perf_counter()
+    while True:
+        func()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return elapsed / calls
+
+
+def main():
+    vectorizer, fselector, model = read_model()
+    texts = read_data()['joined_swremove'].dropna().tolist()
+    X = fselector.transform(vectorizer.transform(texts)).tocsr()
+
+    start = time.perf_counter()
+    hybrid = CompiledForest.from_sklearn(model)
+    compile_time = time.perf_counter() - start
+    compiled = CompiledForest.from_sklearn(model, batch_threshold=0)
+
+    # 1. Parity: seluruh dataset, dievaluasi penuh oleh evaluator array
+    expected = model.predict_proba(X)
+    actual = compiled.predict_proba(X)
+    max_diff = float(np.abs(expected - actual).max())
+    label_diff = int((expected.argmax(axis=1) != actual.argmax(axis=1)).sum())
+    n_nodes = len(compiled.feature)
+    print(f"Model: {compiled.n_estimators} pohon, {n_nodes:,} node; kompilasi {compile_time * 1000:.0f} ms")
+    print(f"Parity: selisih probabilitas maks {max_diff:.1e}, label berbeda {label_diff}/{X.shape[0]:,}\n")
+
+    # 2. Latensi per batch (baris diulang bila dataset lebih kecil dari batch)
+    print(f"{'batch':>7}{'sklearn (ms)':>15}{'compiled (ms)':>15}{'hybrid (ms)':>13}")
+    for size in BATCH_SIZES:
+        rows = np.arange(size) % X.shape[0]
+        batch = sp.csr_matrix(X[rows])
+        min_time = 0.5 if size < 1000 else 0.0
+        t_sklearn = timed(lambda: model.predict_proba(batch), min_time)
+        t_compiled = timed(lambda: compiled.predict_proba(batch), min_time)
+        t_hybrid = timed(lambda: hybrid.predict_proba(batch), min_time)
+        print(f"{size:>7,}{t_sklearn * 1000:>15.2f}{t_compiled * 1000:>15.2f}{t_hybrid * 1000:>13.2f}")
+    return 1 if label_diff or max_diff > 1e-9 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
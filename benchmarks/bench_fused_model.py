@@ -0,0 +1,73 @@
+"""
+Parity check dan benchmark artefak gabungan (fused_model.py) vs rantai
+tiga pickle (vectorizer -> selektor -> model).
+
+Membutuhkan ``Model/fused_sentiment_model.pkl``; buat dengan:
+    python Dashboard/fused_model.py
+
+Jalankan dari direktori utama proyek:
+    python benchmarks/bench_fused_model.py
+"""
+import os
+import pickle
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'Dashboard'))
+
+import numpy as np
+
+from loaders import FUSED_MODEL_PATH, MODEL_PATH, SELECTOR_PATH, VECTORIZER_PATH, read_data, read_model
+
+
+def timed(func, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return result, (time.perf_counter() - start) / repeat
+
+
+def main():
+    # scikit-learn diimport lebih dulu: keduanya butuh sklearn untuk model, biaya import tidak dihitung
+    import sklearn.ensemble  # noqa: F401
+
+    (vectorizer, fselector, model), chain_load = timed(
+        lambda: read_model(VECTORIZER_PATH, SELECTOR_PATH, MODEL_PATH, fused_path=None))
+    fused, fused_load = timed(lambda: pickle.load(open(FUSED_MODEL_PATH, 'rb')))
+    fused_vectorizer = fused.vectorizer
+
+    # Teks hasil preprocessing (seperti input model) ditambah teks mentah sebagai uji tambahan
+    df = read_data()
+    texts = df['joined_swremove'].dropna().tolist() + df['full_text'].dropna().tolist()
+
+    X_chain, chain_time = timed(lambda: fselector.transform(vectorizer.transform(texts)))
+    X_fused, fused_time = timed(lambda: fused_vectorizer.transform(texts))
+    same_matrix = (X_chain.shape == X_fused.shape and
+                   np.array_equal(X_chain.toarray(), X_fused.toarray()))
+
+    proba_chain = model.predict_proba(X_chain)
+    proba_fused = fused.model.predict_proba(X_fused)
+    mismatches = int((proba_chain != proba_fused).any(axis=1).sum())
+
+    print(f"Parity: matriks fitur {'identik' if same_matrix else 'BERBEDA'}; "
+          f"probabilitas identik untuk {len(texts) - mismatches:,}/{len(texts):,} teks")
+
+    source_size = sum(os.path.getsize(path) for path in (VECTORIZER_PATH, SELECTOR_PATH, MODEL_PATH))
+    vec_size = len(pickle.dumps((vectorizer, fselector)))
+    fused_vec_size = len(pickle.dumps(fused_vectorizer))
+    print(f"Ukuran     : 3 pickle {source_size / 1e6:.2f} MB -> artefak {os.path.getsize(FUSED_MODEL_PATH) / 1e6:.2f} MB "
+          f"(vectorizer+selektor {vec_size / 1e3:.0f} KB -> {fused_vec_size / 1e3:.0f} KB)")
+    print(f"Waktu muat : {chain_load * 1000:.0f} ms -> {fused_load * 1000:.0f} ms")
+    print(f"Transform  : {chain_time / len(texts) * 1e6:.1f} -> {fused_time / len(texts) * 1e6:.1f} us per teks "
+          f"(batch {len(texts):,})")
+
+    single = texts[:200]
+    _, chain_single = timed(lambda: [fselector.transform(vectorizer.transform([t])) for t in single])
+    _, fused_single = timed(lambda: [fused_vectorizer.transform([t]) for t in single])
+    print(f"Transform 1 teks: {chain_single / len(single) * 1e6:.0f} -> {fused_single / len(single) * 1e6:.0f} us")
+    return 1 if mismatches or not same_matrix else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Parity check dan benchmark frekuensi hashtag lewat matriks dokumen x
+hashtag (``HashtagMatrix``) vs jalur lama (filter DataFrame lalu
+``Counter`` atas hashtag setiap baris).
+
+Parity mencakup seluruh kombinasi filter tokoh/sentimen, termasuk urutan
+hashtag berfrekuensi sama, dan pasangan hashtag dibandingkan dengan
+hitungan langsung per tweet.
+
+Jalankan dari direktori utama proyek:
+    python benchmarks/bench_hashtag_matrix.py [--repeat 20]
+"""
+import argparse
+import sys
+import time
+from collections import Counter
+from itertools import combinations
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'Dashboard'))
+
+from hashtag_matrix import HashtagMatrix
+from loaders import read_data
+from ngram_index import SENTIMEN_LIST
+
+
+def counts_baseline(df, sentiment_filter, tokoh_filter):
+    # Jalur lama plot_hashtag_wordcloud_by_sentiment
+    filtered_df = df.copy()
+    if sentiment_filter != 'All':
+        filtered_df = filtered_df[filtered_df['Sentimen'] == sentiment_filter]
+    if tokoh_filter is not None:
+        filtered_df = filtered_df[filtered_df['tokoh'] == tokoh_filter]
+    all_hashtags = []
+    for tags in filtered_df['hashtag']:
+        if isinstance(tags, str):
+            all_hashtags.extend(tags.split())
+    return Counter(all_hashtags)
+
+
+def pairs_baseline(df, sentiment_filter, tokoh_filter):
+    if sentiment_filter != 'All':
+        df = df[df['Sentimen'] == sentiment_filter]
+    if tokoh_filter is not None:
+        df = df[df['tokoh'] == tokoh_filter]
+    pairs = Counter()
+    for tags in df['hashtag']:
+        if isinstance(tags, str):
+            pairs.update(combinations(sorted(set(tags.split())), 2))
+    return pairs
+
+
+def best_of(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    df = read_data()
+    start = time.perf_counter()
+    matrix = HashtagMatrix(df)
+    build_time = time.perf_counter() - start
+    print(f"Matriks {matrix.matrix.shape[0]:,} x {matrix.matrix.shape[1]:,} ({matrix.matrix.nnz:,} entri) "
+          f"dibangun dalam {build_time * 1000:.1f} ms")
+
+    # 1. Parity seluruh kombinasi filter
+    filters = [(sentimen, tokoh) for sentimen in ['All'] + SENTIMEN_LIST
+               for tokoh in [None] + df['tokoh'].dropna().unique().tolist()]
+    mismatches = []
+    for sentimen, tokoh in filters:
+        if list(counts_baseline(df, sentimen, tokoh).items()) != list(matrix.counts(sentimen, tokoh).items()):
+            mismatches.append(f'frekuensi {sentimen}/{tokoh}')
+        expected = pairs_baseline(df, sentimen, tokoh)
+        pairs = matrix.cooccurring_pairs(sentimen, tokoh, top_n=len(expected))
+        if {(a, b): n for a, b, n in pairs.itertuples(index=False)} != dict(expected):
+            mismatches.append(f'pasangan {sentimen}/{tokoh}')
+    print(f"Parity ({len(filters)} kombinasi filter): "
+          f"{'identik' if not mismatches else 'BERBEDA: ' + ', '.join(mismatches[:10])}")
+
+    # 2. Waktu per query (rata-rata seluruh kombinasi filter, waktu terbaik dari --repeat)
+    baseline = sum(best_of(lambda f=f: counts_baseline(df, *f), args.repeat) for f in filters) / len(filters)
+    counts = sum(best_of(lambda f=f: matrix.counts(*f), args.repeat) for f in filters) / len(filters)
+    pairs = sum(best_of(lambda f=f: matrix.cooccurring_pairs(*f), args.repeat) for f in filters) / len(filters)
+    print(f"\n{'query':<34}{'ms':>8}")
+    print(f"{'frekuensi (filter + Counter)':<34}{baseline * 1000:>8.2f}")
+    print(f"{'frekuensi (HashtagMatrix)':<34}{counts * 1000:>8.2f}")
+    print(f"{'pasangan teratas (HashtagMatrix)':<34}{pairs * 1000:>8.2f}")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+Parity check dan benchmark ingest inkremental (log tambahan + agregat live)
+vs muat ulang penuh dataset.
+
+Dataset asli dibagi menjadi bagian awal (CSV sementara) dan sisanya yang
+ditambahkan batch demi batch lewat log tambahan. Setelah semua batch
+masuk, agregat ``SharedStore`` (jumlah sentimen, distribusi per tokoh,
+hashtag, seluruh tabel n-gram) dibandingkan dengan hasil hitung ulang dari
+dataset lengkap.
+
+Jalankan dari direktori utama proyek:
+    python benchmarks/bench_ingest.py
+"""
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'Dashboard'))
+
+import pandas as pd
+
+from dashboard_charts import hitung_jumlah
+from ingest import append_rows
+from live_aggregates import LiveAggregates
+from loaders import DATA_PATH, append_log_path, read_data
+from ngram_index import NGRAM_SIZES, SENTIMEN_LIST, NgramIndex
+from shared_store import SharedStore
+
+BATCH_SIZES = [10, 100, 1000]
+
+
+def hashtag_counts(df, sentiment_filter, tokoh_filter):
+    # Jalur lama plot_hashtag_wordcloud_by_sentiment
+    if sentiment_filter != 'All':
+        df = df[df['Sentimen'] == sentiment_filter]
+    if tokoh_filter is not None:
+        df = df[df['tokoh'] == tokoh_filter]
+    return Counter(tag for tags in df['hashtag'] if isinstance(tags, str) for tag in tags.split())
+
+
+def check_parity(store, tmp_dir):
+    """Jumlah kombinasi yang berbeda antara agregat live dan hitung ulang penuh."""
+    df = store.df_sentimen
+    mismatches = []
+
+    if hitung_jumlah(df) != hitung_jumlah(df, sentimen_counts=store.aggregates.sentimen_counts()):
+        mismatches.append('hitung_jumlah')
+
+    expected = df.groupby(['tokoh', 'Sentimen'], observed=True).size().reset_index(name='count')
+    expected = expected.astype({'tokoh': str, 'Sentimen': str}).sort_values(['tokoh', 'Sentimen'])
+    if not expected.reset_index(drop=True).equals(store.aggregates.distribution()):
+        mismatches.append('distribusi')
+
+    tokoh_list = [None] + df['tokoh'].dropna().unique().tolist()
+    for sentimen in ['All'] + SENTIMEN_LIST:
+        for tokoh in tokoh_list:
+            # Urutan item ikut dibandingkan (menentukan urutan hashtag berfrekuensi sama)
+            if list(hashtag_counts(df, sentimen, tokoh).items()) != \
+                    list(store.aggregates.hashtag_counts(sentimen, tokoh).items()):
+                mismatches.append(f'hashtag {sentimen}/{tokoh}')
+
+    rebuilt = NgramIndex.build(df, index_dir=os.path.join(tmp_dir, 'ngram_full'))
+    for tokoh in tokoh_list[1:]:
+        for sentimen in ['All'] + SENTIMEN_LIST:
+            for n in NGRAM_SIZES.values():
+                if not rebuilt.table(tokoh, sentimen, n).equals(store.ngram_index.table(tokoh, sentimen, n)):
+                    mismatches.append(f'n-gram {tokoh}/{sentimen}/{n}')
+    return mismatches
+
+
+def main():
+    full = pd.read_csv(DATA_PATH)
+    n_base = len(full) - sum(BATCH_SIZES)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_path = os.path.join(tmp_dir, 'data.csv')
+        full.iloc[:n_base].to_csv(data_path, index=False)
+        store = SharedStore(data_path=data_path, stem_cache_path=None,
+                            ngram_index_dir=os.path.join(tmp_dir, 'ngram'))
+
+        # 1. Tambahkan batch lewat log, ukur waktu refresh (termasuk baca log)
+        print(f"{'batch':>7}{'refresh inkremental (ms)':>27}{'muat ulang penuh (ms)':>24}")
+        start_row = n_base
+        for size in BATCH_SIZES:
+            batch = full.iloc[start_row:start_row + size]
+            start_row += size
+            append_rows(batch, append_log_path(data_path))
+
+            start = time.perf_counter()
+            store.refresh()
+            incremental = time.perf_counter() - start
+
+            # Pembanding: muat ulang seluruh dataset yang sama dan bangun ulang indeks serta agregat
+            combined_path = os.path.join(tmp_dir, 'combined.csv')
+            full.iloc[:start_row].to_csv(combined_path, index=False)
+            start = time.perf_counter()
+            df = read_data(combined_path)
+            NgramIndex.build(df, index_dir=os.path.join(tmp_dir, 'ngram_reload')).follow(df)
+            LiveAggregates(df)
+            reload_time = time.perf_counter() - start
+            print(f"{size:>7,}{incremental * 1000:>27.1f}{reload_time * 1000:>24.1f}")
+
+        # 2. Parity setelah seluruh batch masuk
+        mismatches = check_parity(store, tmp_dir)
+        print(f"\nParity ({len(store.df_sentimen):,} baris = {n_base:,} awal + {sum(BATCH_SIZES):,} baru): "
+              f"{'identik' if not mismatches else 'BERBEDA: ' + ', '.join(mismatches[:10])}")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+Benchmark overhead instrumentasi (``instrumentation.py``) pada hot path.
+
+Workload yang sama dijalankan di proses terpisah untuk setiap mode
+``INSTRUMENTATION`` (mode dibaca saat import): mati, "1" (waktu & jumlah
+panggilan), dan "memory" (ditambah puncak alokasi lewat tracemalloc).
+
+Workload: ``preprocess_tweet`` untuk setiap tweet korpus ``ReLabeling``
+(cache stemming sudah hangat), prediksi batch 256 teks bersih, dan
+seluruh panel n-gram/hashtag satu tokoh yang dihitung langsung.
+
+Jalankan dari direktori utama proyek:
+    python benchmarks/bench_instrumentation.py [--limit 3000] [--repeat 5]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import warnings
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'Dashboard'))
+
+MODES = [('mati', ''), ('INSTRUMENTATION=1', '1'), ('INSTRUMENTATION=memory', 'memory')]
+
+
+def workload(limit, repeat):
+    # Dijalankan di proses anak: mengembalikan waktu terbaik per bagian (detik)
+    from build_dataset import RELABELING_PATHS, read_relabeling
+    from dashboard_panels import NGRAMS, compute_panel
+    from shared_store import SharedStore
+    from text_preprocessing import preprocess_tweet
+
+    import instrumentation
+
+    warnings.filterwarnings('ignore')
+    texts = read_relabeling(RELABELING_PATHS)['full_text'].dropna().astype(str).tolist()[:limit]
+    store = SharedStore(prerender_dir=None)
+    predictor = store.predictor
+    predictor._ensure_preprocessing()
+    clean = [predictor.preprocess(text) for text in texts]  # pemanasan (stem cache & import)
+    batch = [text for text in clean if text][:256]
+    tokoh = store.df_sentimen['tokoh'].iloc[0]
+    keys = [('ngram', tokoh, 'All', ngram, 20) for ngram in NGRAMS] + [('hashtag_pairs', tokoh, 'All', 20)]
+
+    def preprocess():
+        for text in texts:
+            preprocess_tweet(text, predictor.normalizer, predictor.stop_words_remover, predictor.stemmer)
+
+    def predict():
+        for _ in range(20):
+            predictor.predict_proba_clean(batch)
+
+    def panels():
+        for key in keys:
+            compute_panel(store, key)
+
+    best = {}
+    for name, func in (('preprocess', preprocess), ('predict', predict), ('panel', panels)):
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+        best[name] = min(times)
+    best['stages'] = len(instrumentation.snapshot()['stages'])
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--limit', type=int, default=3000, help="Jumlah tweet untuk preprocess_tweet")
+    parser.add_argument('--repeat', type=int, default=5, help="Pengulangan per bagian (diambil yang tercepat)")
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(workload(args.limit, args.repeat)))
+        return 0
+
+    results = {}
+    for label, mode in MODES:
+        env = dict(os.environ, INSTRUMENTATION=mode, INSTRUMENTATION_DIR='')
+        output = subprocess.run([sys.executable, __file__, '--worker', '--limit', str(args.limit),
+                                 '--repeat', str(args.repeat)], env=env, check=True, capture_output=True, text=True)
+        results[label] = json.loads(output.stdout.strip().splitlines()[-1])
+
+    base = results['mati']
+    print(f"{'mode':<24}{'preprocess ms':>15}{'predict ms':>12}{'panel ms':>10}{'tahap':>7}")
+    for label, row in results.items():
+        cells = ''.join(f"{row[part] * 1000:>{width}.1f}" for part, width in (('preprocess', 15), ('predict', 12), ('panel', 10)))
+        print(f"{label:<24}{cells}{row['stages']:>7}")
+    print(f"\nOverhead vs mati ({args.limit:,} tweet preprocess, 20x prediksi batch 256, 4 panel):")
+    for label, row in list(results.items())[1:]:
+        print(f"  {label:<24}" + '  '.join(f"{part} {row[part] / base[part] - 1:+.1%}" for part in ('preprocess', 'predict', 'panel')))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,302 @@
+"""
+Load test tanpa jaringan: banyak sesi Streamlit simulasi (AppTest, satu
+thread per sesi seperti script runner Streamlit) berjalan bersamaan di satu
+proses dan terus berinteraksi dengan halaman dashboard (ganti filter, tab,
+pencarian) dan halaman prediksi (chat), dengan input dari korpus
+``ReLabeling``.
+
+Untuk setiap tingkat konkurensi dilaporkan latensi p50/p95/p99 per
+interaksi (waktu satu rerun), throughput, error, dan RSS proses, lalu titik
+jenuh: tingkat konkurensi saat throughput berhenti naik dan saat p95
+melewati batas ``--slo-ms``.
+
+Jalankan dari direktori utama proyek:
+    python benchmarks/bench_load.py [--concurrency 1 2 4 8 16] [--duration 20]
+"""
+import argparse
+import contextlib
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import warnings
+from collections import Counter
+from pathlib import Path
+from unittest import mock
+
+DASHBOARD_DIR = Path(__file__).resolve().parents[1] / 'Dashboard'
+sys.path.insert(0, str(DASHBOARD_DIR))
+
+import numpy as np
+from streamlit.runtime import Runtime
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.testing.v1 import AppTest, app_test
+
+from build_dataset import RELABELING_PATHS, read_relabeling
+
+CONCURRENCY = [1, 2, 4, 8, 16]
+RESULTS_PATH = 'benchmarks/results/bench_load.jsonl'
+
+CAGUB = ["Luluk Nur Hamidah", "Khofifah Indar Parawansa", "Tri Rismaharini"]
+SENTIMEN = ["All", "Negatif", "Netral", "Positif"]
+TABS = ["📊 Distribusi Sentimen", "📝 Analisis Teks", "👥 Analisis Pengguna"]
+
+# Throughput dianggap berhenti naik jika bertambah kurang dari ini dibanding tingkat sebelumnya
+SATURATION_GAIN = 0.10
+
+
+def rss_mb():
+    # RSS proses saat ini dari /proc (Linux)
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1e6
+
+
+@contextlib.contextmanager
+def concurrent_apptest():
+    """
+    Menyesuaikan AppTest agar banyak sesi dapat berjalan bersamaan seperti di server:
+
+    - AppTest memasang Runtime tiruan global di awal setiap run dan menghapusnya di
+      akhir, sehingga run yang selesai di satu thread membuat run lain gagal
+      ("Runtime hasn't been created!"). Runtime tiruan terakhir tetap dipakai.
+    - AppTest membuat ``ScriptCache`` baru per run (script di-parse ulang setiap
+      rerun, dan ``ast.parse`` paralel di Python 3.11 tidak aman); server memakai
+      satu cache untuk semua sesi, begitu pula di sini.
+    """
+    last = [None]
+
+    def instance(cls):
+        if cls._instance is not None:
+            last[0] = cls._instance
+        if last[0] is None:
+            raise RuntimeError("Runtime hasn't been created!")
+        return last[0]
+
+    script_cache = ScriptCache()
+    original_instance, original_exists = Runtime.__dict__['instance'], Runtime.__dict__['exists']
+    Runtime.instance = classmethod(instance)
+    Runtime.exists = classmethod(lambda cls: cls._instance is not None or last[0] is not None)
+    try:
+        with mock.patch.object(app_test, 'ScriptCache', lambda: script_cache):
+            yield
+    finally:
+        Runtime.instance, Runtime.exists = original_instance, original_exists
+
+
+class Corpus:
+    """Input realistis dari korpus ReLabeling: teks tweet untuk chat dan kata untuk pencarian."""
+
+    def __init__(self, paths=RELABELING_PATHS):
+        texts = read_relabeling(paths)['full_text'].dropna().astype(str)
+        self.texts = texts.tolist()
+        words = texts.str.lower().str.findall(r'[a-z]{4,}').explode().dropna()
+        self.words = words.value_counts().index[:2000].tolist()
+
+
+# ----------------------------------------------------------------------------
+# Sesi Simulasi
+# ----------------------------------------------------------------------------
+
+class SimulatedUser:
+    """
+    Satu sesi Streamlit (AppTest) yang menjalankan interaksi acak pada satu halaman.
+
+    Args:
+        page (str): 'dashboard' atau 'prediksi'.
+        corpus (Corpus): Sumber input.
+        seed (int): Seed pilihan interaksi.
+    """
+
+    def __init__(self, page, corpus, seed):
+        self.page = page
+        self.corpus = corpus
+        self.rng = np.random.default_rng(seed)
+        self.tab = TABS[0]
+        self.at = AppTest.from_file(str(DASHBOARD_DIR / 'sentimen_cagub_app.py'), default_timeout=300)
+        self.at.run()
+        if page == 'prediksi':
+            self.at.switch_page("app-pages/page_prediksi.py")
+            self.at.run()
+
+    def _choice(self, values):
+        return values[int(self.rng.integers(len(values)))]
+
+    def next_action(self):
+        """Menerapkan satu interaksi ke widget (belum dijalankan); mengembalikan namanya."""
+        at = self.at
+        if self.page == 'prediksi':
+            at.chat_input[0].set_value(self._choice(self.corpus.texts))
+            return 'chat'
+
+        action = self._choice(['cagub', 'sentimen', 'top', 'tab', 'search'])
+        if action == 'tab':
+            self.tab = self._choice(TABS)
+        # AppTest tidak mengirim ulang tab yang aktif: diset setiap run seperti browser yang tetap di tab itu
+        at.session_state["dashboard_tab"] = self.tab
+        if action == 'cagub':
+            at.sidebar.selectbox[0].set_value(self._choice(CAGUB))
+        elif action == 'sentimen':
+            at.sidebar.selectbox[1].set_value(self._choice(SENTIMEN))
+        elif action == 'top':
+            at.sidebar.number_input[0].set_value(int(self.rng.integers(5, 51)))
+        elif action == 'search':
+            at.text_input[0].set_value(self._choice(self.corpus.words))
+        return action
+
+    def step(self):
+        """
+        Returns:
+            tuple: (nama interaksi, latensi detik, pesan error atau None).
+        """
+        try:
+            action = self.next_action()
+        except IndexError:
+            # Run sebelumnya gagal sebelum widget dirender: muat ulang halaman
+            action = 'reload'
+        start = time.perf_counter()
+        self.at.run()
+        elapsed = time.perf_counter() - start
+        if self.at.exception:
+            return action, elapsed, self.at.exception[0].message
+        return action, elapsed, 'widget hilang setelah run gagal' if action == 'reload' else None
+
+
+def run_level(users, duration):
+    """
+    Menjalankan seluruh ``users`` bersamaan selama ``duration`` detik (closed loop:
+    interaksi berikutnya dikirim segera setelah rerun sebelumnya selesai).
+
+    Returns:
+        tuple: (list (halaman, interaksi, latensi, error), waktu total, RSS puncak MB)
+    """
+    records = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+    peak = [rss_mb()]
+    done = threading.Event()
+
+    def worker(user):
+        local = []
+        while time.perf_counter() < deadline:
+            action, elapsed, error = user.step()
+            local.append((user.page, action, elapsed, error))
+        with lock:
+            records.extend(local)
+
+    def sample_memory():
+        while not done.wait(0.2):
+            peak[0] = max(peak[0], rss_mb())
+
+    sampler = threading.Thread(target=sample_memory, daemon=True)
+    sampler.start()
+    threads = [threading.Thread(target=worker, args=(user,)) for user in users]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+    done.set()
+    sampler.join()
+    return records, wall, max(peak[0], rss_mb())
+
+
+def summarize(concurrency, records, wall, peak_rss):
+    latencies = np.array([elapsed for _, _, elapsed, _ in records]) * 1000
+    summary = {
+        'sessions': concurrency,
+        'actions': len(records),
+        'throughput': len(records) / wall,
+        'errors': sum(error is not None for *_, error in records),
+        'rss_peak_mb': round(peak_rss, 1),
+    }
+    for q in (50, 95, 99):
+        summary[f'p{q}_ms'] = float(np.percentile(latencies, q)) if len(latencies) else float('nan')
+    for page in ('dashboard', 'prediksi'):
+        page_latencies = [elapsed * 1000 for p, _, elapsed, _ in records if p == page]
+        summary[f'{page}_p95_ms'] = float(np.percentile(page_latencies, 95)) if page_latencies else None
+    return summary
+
+
+def saturation(results, slo_ms):
+    """(konkurensi saat throughput berhenti naik, konkurensi pertama dengan p95 > SLO)."""
+    flat = None
+    for previous, current in zip(results, results[1:]):
+        if current['throughput'] < previous['throughput'] * (1 + SATURATION_GAIN):
+            flat = previous['sessions']
+            break
+    over_slo = next((result['sessions'] for result in results if result['p95_ms'] > slo_ms), None)
+    return flat, over_slo
+
+
+# ----------------------------------------------------------------------------
+# Main
+# ----------------------------------------------------------------------------
+
+def _commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--concurrency', type=int, nargs='+', default=CONCURRENCY)
+    parser.add_argument('--duration', type=float, default=20, help="Detik per tingkat konkurensi")
+    parser.add_argument('--predict-share', type=float, default=0.3,
+                        help="Proporsi sesi yang berada di halaman prediksi (sisanya dashboard)")
+    parser.add_argument('--slo-ms', type=float, default=1000, help="Batas p95 yang masih dianggap responsif")
+    parser.add_argument('--output', default=RESULTS_PATH, help="File JSON Lines hasil (ditambahkan)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    warnings.filterwarnings('ignore')
+
+    corpus = Corpus()
+    base_rss = rss_mb()
+    print(f"{'sesi':>5}{'aksi':>7}{'aksi/dtk':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+          f"{'p95 dash':>10}{'p95 pred':>10}{'error':>7}{'RSS MB':>8}")
+
+    def fmt(value):
+        return f"{value:.0f}" if value is not None else '-'
+
+    users, results, errors = [], [], Counter()
+    with concurrent_apptest():
+        for concurrency in sorted(args.concurrency):
+            # Sesi baru dibuat (dan dijalankan sekali) sebelum pengukuran; sesi lama tetap dipakai
+            while len(users) < concurrency:
+                n_predict = sum(user.page == 'prediksi' for user in users)
+                page = 'prediksi' if n_predict < round((len(users) + 1) * args.predict_share) else 'dashboard'
+                users.append(SimulatedUser(page, corpus, seed=args.seed + len(users)))
+
+            records, wall, peak_rss = run_level(users[:concurrency], args.duration)
+            result = summarize(concurrency, records, wall, peak_rss)
+            results.append(result)
+            errors.update(error for *_, error in records if error is not None)
+            print(f"{concurrency:>5}{result['actions']:>7}{result['throughput']:>10.2f}{result['p50_ms']:>9.0f}"
+                  f"{result['p95_ms']:>9.0f}{result['p99_ms']:>9.0f}{fmt(result['dashboard_p95_ms']):>10}"
+                  f"{fmt(result['prediksi_p95_ms']):>10}{result['errors']:>7}{result['rss_peak_mb']:>8.0f}")
+
+    flat, over_slo = saturation(results, args.slo_ms)
+    print(f"\nRSS awal {base_rss:.0f} MB; {os.cpu_count()} CPU")
+    print(f"Throughput berhenti naik (< +{SATURATION_GAIN:.0%}) setelah: "
+          f"{f'{flat} sesi' if flat else 'tidak tercapai pada tingkat yang diuji'}")
+    print(f"p95 melewati {args.slo_ms:.0f} ms mulai: "
+          f"{f'{over_slo} sesi' if over_slo else 'tidak tercapai pada tingkat yang diuji'}")
+    for error, count in errors.most_common(5):
+        print(f"Error ({count:,}x): {error.splitlines()[0][:200]}")
+
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+        with open(args.output, 'a', encoding='utf-8') as f:
+            for result in results:
+                f.write(json.dumps({'commit': _commit(), 'cpu_count': os.cpu_count(),
+                                    'duration': args.duration, **result}) + '\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
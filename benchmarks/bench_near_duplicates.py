@@ -0,0 +1,99 @@
+"""
+Benchmark deduplikasi tweet hampir duplikat (MinHash + LSH): seberapa
+kecil dataset analisis setelah deduplikasi, waktu clustering, dan
+percepatan jalur analisis dashboard (n-gram, word cloud, hashtag,
+pencarian) pada dataset hasil deduplikasi vs dataset lengkap.
+
+Sebagai pembanding, penyusutan juga dihitung untuk gabungan seluruh file
+``ReLabeling - *.csv`` (file per tokoh + Gabungan), yang memuat baris yang
+sama berulang kali.
+
+Jalankan dari direktori utama proyek:
+    python benchmarks/bench_near_duplicates.py [--repeat 3]
+"""
+import argparse
+import glob
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'Dashboard'))
+
+import numpy as np
+import pandas as pd
+
+from dashboard_charts import visualize_ngram_frequency, visualize_wordcloud_by_sentiment_and_tokoh
+from hashtag_matrix import HashtagMatrix
+from loaders import read_data
+from near_duplicates import add_cluster_columns, deduplicate
+from ngram_index import NgramIndex
+from search_index import SearchIndex
+from text_preprocessing import clean_text_series
+
+SEARCH_QUERY = 'jatim'
+
+
+def best_of(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def analysis_cases(df, tmp_dir):
+    tokoh = df['tokoh'].value_counts().index[0]
+    return {
+        'ngram_index_build': lambda: NgramIndex.build(df, index_dir=os.path.join(tmp_dir, 'ngram')),
+        'visualize_ngram_frequency': lambda: visualize_ngram_frequency(df, tokoh, sentimen='All', ngram='bigram'),
+        'wordcloud (tanpa cache)': lambda: visualize_wordcloud_by_sentiment_and_tokoh(df, tokoh, 'Positif'),
+        'hashtag_matrix_build': lambda: HashtagMatrix(df),
+        'search_index_build+query': lambda: SearchIndex(df).search(SEARCH_QUERY),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    df = read_data()
+    start = time.perf_counter()
+    clustered = add_cluster_columns(df)
+    cluster_time = time.perf_counter() - start
+    deduplicated = deduplicate(clustered)
+
+    sizes = clustered.drop_duplicates('cluster_id')['cluster_size']
+    print(f"Clustering {len(df):,} tweet: {cluster_time * 1000:.0f} ms")
+    print(f"Dataset: {len(df):,} -> {len(deduplicated):,} tweet ({1 - len(deduplicated) / len(df):.1%} lebih kecil)")
+    print(f"Klaster berukuran > 1: {(sizes > 1).sum():,} (terbesar {sizes.max()}, "
+          f"{(clustered['cluster_size'] > 1).sum():,} tweet di dalamnya)")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        full_cases = analysis_cases(df, tmp_dir)
+        dedup_cases = analysis_cases(deduplicated, tmp_dir)
+        print(f"\n{'jalur analisis':<28}{'lengkap (ms)':>14}{'dedup (ms)':>12}{'speedup':>9}")
+        ratios = []
+        for name in full_cases:
+            full_time = best_of(full_cases[name], args.repeat)
+            dedup_time = best_of(dedup_cases[name], args.repeat)
+            ratios.append(full_time / dedup_time)
+            print(f"{name:<28}{full_time * 1000:>14.1f}{dedup_time * 1000:>12.1f}{ratios[-1]:>8.2f}x")
+    print(f"\nRata-rata geometrik speedup: {np.exp(np.mean(np.log(ratios))):.2f}x")
+
+    # Pembanding: seluruh file ReLabeling digabung (clean_text dari cleaning batch)
+    raw = pd.concat([pd.read_csv(path) for path in sorted(glob.glob('Data/ReLabeling - *.csv'))], ignore_index=True)
+    start = time.perf_counter()
+    raw_clusters = add_cluster_columns(raw.assign(clean_text=clean_text_series(raw['full_text'])))
+    raw_time = time.perf_counter() - start
+    n_raw_dedup = len(deduplicate(raw_clusters))
+    print(f"\nSeluruh file ReLabeling: {len(raw):,} -> {n_raw_dedup:,} tweet "
+          f"({1 - n_raw_dedup / len(raw):.1%} lebih kecil), cleaning + clustering {raw_time * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
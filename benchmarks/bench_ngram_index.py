@@ -0,0 +1,74 @@
+"""
+Parity check dan benchmark indeks n-gram vs penghitungan ulang per rerun.
+
+Jalankan dari direktori utama proyek:
+    python benchmarks/bench_ngram_index.py
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'Dashboard'))
+
+import pandas as pd
+
+from loaders import DATA_PATH, file_fingerprint, read_data
+from ngram_index import NGRAM_SIZES, SENTIMEN_LIST, NgramIndex, count_ngrams
+
+
+def top_ngrams_recount(df, tokoh, sentimen, ngram, top_n):
+    # Jalur lama visualize_ngram_frequency: tokenisasi ulang seluruh korpus tokoh
+    n = NGRAM_SIZES[ngram]
+    filtered_df = df[df['tokoh'] == tokoh]
+    sentimen_list = SENTIMEN_LIST if sentimen == 'All' else [sentimen]
+    all_data = []
+    for label in sentimen_list:
+        counts = count_ngrams(filtered_df[filtered_df['Sentimen'] == label]['joined_swremove'], n)
+        all_data += [{'n-gram': ng, 'Frekuensi': freq, 'Sentimen': label} for ng, freq in counts.items()]
+    ngram_df = pd.DataFrame(all_data)
+    top = ngram_df.groupby('n-gram')['Frekuensi'].sum().nlargest(top_n).index
+    return ngram_df[ngram_df['n-gram'].isin(top)]
+
+
+def canonical(ngram_df):
+    return ngram_df.sort_values(['Sentimen', 'n-gram']).reset_index(drop=True)
+
+
+def main():
+    df = read_data()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        start = time.perf_counter()
+        index = NgramIndex.build(df, index_dir=f"{tmp_dir}/ngram", fingerprint=file_fingerprint(DATA_PATH))
+        print(f"Build indeks: {time.perf_counter() - start:.2f} detik ({len(index.manifest['files'])} tabel)")
+
+        combos = [(tokoh, sentimen, ngram, top_n)
+                  for tokoh in df['tokoh'].dropna().unique()
+                  for sentimen in ['All'] + SENTIMEN_LIST
+                  for ngram in NGRAM_SIZES
+                  for top_n in (5, 20, 50)]
+
+        mismatches = 0
+        recount_time = index_time = 0.0
+        for tokoh, sentimen, ngram, top_n in combos:
+            start = time.perf_counter()
+            expected = top_ngrams_recount(df, tokoh, sentimen, ngram, top_n)
+            recount_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            actual = index.top_ngrams(tokoh, sentimen, ngram, top_n)
+            index_time += time.perf_counter() - start
+
+            if not canonical(expected).equals(canonical(actual)):
+                mismatches += 1
+                print(f"  beda: {tokoh} / {sentimen} / {ngram} / top {top_n}")
+
+    print(f"Parity: {len(combos) - mismatches}/{len(combos)} kombinasi identik")
+    print(f"Hitung ulang : {recount_time / len(combos) * 1000:.2f} ms per grafik")
+    print(f"Indeks       : {index_time / len(combos) * 1000:.2f} ms per grafik (termasuk load lazy)")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""
+Parity check dan benchmark normalisasi kata: regex alternation lama vs KamusNormalizer.
+
+Jalankan dari direktori utama proyek:
+    python benchmarks/bench_normalisasi.py
+"""
+import glob
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'Dashboard'))
+
+import pandas as pd
+
+from loaders import read_kamus
+from text_preprocessing import KamusNormalizer, clean_text
+
+
+def normalize_regex(text, norm_dict):
+    # Jalur lama di preprocess_tweet: compile ulang pola setiap pemanggilan
+    pattern = re.compile(r'\b(' + '|'.join(re.escape(k) for k in norm_dict.keys()) + r')\b')
+    return pattern.sub(lambda m: norm_dict[m.group(0)], text)
+
+
+def load_corpus():
+    frames = [pd.read_csv(path) for path in sorted(glob.glob('Data/ReLabeling - *.csv'))]
+    texts = pd.concat(frames)['full_text'].dropna().astype(str)
+    return [clean_text(text) for text in texts]
+
+
+def main():
+    norm_dict = read_kamus()
+
+    start = time.perf_counter()
+    normalizer = KamusNormalizer(norm_dict)
+    build_time = time.perf_counter() - start
+    print(f"Build KamusNormalizer: {build_time * 1000:.1f} ms ({len(normalizer):,} kunci aktif)")
+
+    corpus = load_corpus()
+    corpus += ['tgg jwb', 'tgg jwb tgg', 'p kopipah nu', 'ibuibu anake', '']
+
+    # Parity: pola dikompilasi sekali agar pengecekan seluruh korpus tidak terlalu lama
+    pattern = re.compile(r'\b(' + '|'.join(re.escape(k) for k in norm_dict.keys()) + r')\b')
+    mismatches = 0
+    for text in corpus:
+        expected = pattern.sub(lambda m: norm_dict[m.group(0)], text)
+        if normalizer.normalize(text) != expected:
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"  beda: {text!r}")
+    print(f"Parity: {len(corpus) - mismatches:,}/{len(corpus):,} teks identik")
+
+    # Latensi per pesan (jalur lama termasuk compile, sesuai perilaku sebelumnya)
+    sample = corpus[:50]
+    start = time.perf_counter()
+    for text in sample:
+        normalize_regex(text, norm_dict)
+    old_latency = (time.perf_counter() - start) / len(sample)
+
+    start = time.perf_counter()
+    for _ in range(20):
+        for text in corpus:
+            normalizer.normalize(text)
+    new_latency = (time.perf_counter() - start) / (20 * len(corpus))
+
+    print(f"Regex per pesan      : {old_latency * 1000:.3f} ms")
+    print(f"KamusNormalizer/pesan: {new_latency * 1000:.4f} ms")
+    print(f"Speedup              : {old_latency / new_latency:,.0f}x")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+Parity check dan benchmark cache prediksi bersama (``PredictionCache``):
+seluruh tweet korpus ``ReLabeling`` dikirim satu per satu seperti input
+halaman prediksi, lewat ``SharedStore.predict`` (dengan cache) vs
+``SentimentPredictor.predict`` (tanpa cache).
+
+Parity: label dan confidence identik untuk setiap tweet. Selain itu
+dicek bahwa mengubah isi ``Model/`` (di sini: direktori model salinan)
+mengosongkan cache dan memuat ulang model.
+
+Jalankan dari direktori utama proyek:
+    python benchmarks/bench_prediction_cache.py [--limit 5000]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'Dashboard'))
+
+import loaders
+from build_dataset import RELABELING_PATHS, read_relabeling
+from shared_store import SharedStore
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--limit', type=int, default=None, help="Jumlah tweet (default: seluruh korpus)")
+    args = parser.parse_args()
+
+    texts = read_relabeling(RELABELING_PATHS)['full_text'].dropna().astype(str).tolist()[:args.limit]
+    store = SharedStore()
+    predictor = store.predictor
+    predictor.predict(texts[0])  # pemanasan (import & stem cache)
+
+    # 1. Tanpa cache
+    start = time.perf_counter()
+    expected = [predictor.predict(text) for text in texts]
+    uncached = time.perf_counter() - start
+
+    # 2. Dengan cache bersama (dimulai kosong)
+    store.prediction_cache.clear()
+    start = time.perf_counter()
+    results = [store.predict(text) for text in texts]
+    cached = time.perf_counter() - start
+    stats = store.prediction_cache.stats()
+
+    # 3. Pengiriman ulang (seluruh teks sudah tersimpan: setiap permintaan adalah hit)
+    start = time.perf_counter()
+    for text in texts:
+        store.predict(text)
+    repeated = time.perf_counter() - start
+
+    mismatches = sum((a['label'], a['confidence']) != (b['label'], b['confidence']) for a, b in zip(expected, results))
+    print(f"Parity ({len(texts):,} tweet): {'identik' if not mismatches else f'{mismatches:,} BERBEDA'}")
+    print(f"Hit ratio satu kali lewat korpus {stats['hit_ratio']:.1%} ({stats['hits']:,} hit / {stats['misses']:,} miss, "
+          f"{stats['size']:,} hasil tersimpan)")
+    print(f"Prediksi saat miss rata-rata {stats['miss_ms']:.2f} ms")
+    print(f"\n{'jalur':<24}{'total detik':>12}{'ms/tweet':>10}")
+    print(f"{'tanpa cache':<24}{uncached:>12.2f}{uncached / len(texts) * 1000:>10.2f}")
+    print(f"{'cache (mulai kosong)':<24}{cached:>12.2f}{cached / len(texts) * 1000:>10.2f}")
+    print(f"{'cache (semua hit)':<24}{repeated:>12.2f}{repeated / len(texts) * 1000:>10.2f}")
+
+    # 4. Invalidasi: file baru di direktori model mengganti versi dan mengosongkan cache
+    with tempfile.TemporaryDirectory() as model_dir:
+        for name in os.listdir(loaders.MODEL_DIR):
+            shutil.copy2(os.path.join(loaders.MODEL_DIR, name), model_dir)
+        with mock.patch('shared_store.model_version', lambda: loaders.model_version(model_dir)):
+            store.predict(texts[0])
+            size_before = len(store.prediction_cache)
+            old_predictor = store.predictor
+            Path(model_dir, 'catatan.txt').write_text('model diperbarui')
+            store.predict(texts[0])
+            invalidated = len(store.prediction_cache) == 1 and store.predictor is not old_predictor
+    print(f"\nInvalidasi saat Model/ berubah: {'ya' if invalidated else 'TIDAK'} "
+          f"({size_before:,} -> {len(store.prediction_cache):,} hasil tersimpan)")
+    return 1 if mismatches or not invalidated else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
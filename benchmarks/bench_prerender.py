@@ -0,0 +1,100 @@
+"""
+Parity check dan benchmark penyajian panel dashboard dari artefak
+``prerender.py`` vs dihitung langsung.
+
+Satu "view" = seluruh panel halaman dashboard untuk satu kombinasi filter
+(distribusi, 3 word cloud, 3 grafik n-gram, hashtag, pasangan hashtag),
+diambil dengan cache panel yang masih kosong (seperti kombinasi filter yang
+belum pernah dibuka sejak proses berjalan).
+
+Artefak dibangun lebih dulu jika belum ada:
+    python Dashboard/prerender.py
+
+Jalankan dari direktori utama proyek:
+    python benchmarks/bench_prerender.py [--views 30] [--parity 300]
+"""
+import argparse
+import json
+import random
+import sys
+import time
+import warnings
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'Dashboard'))
+
+import numpy as np
+
+from dashboard_panels import CAGUB_LIST, NGRAMS, TOP_NUMBER_MAX, TOP_NUMBER_MIN, WORDCLOUD_SENTIMEN, compute_panel, panel_keys
+from prerender import PRERENDER_DIR, PrerenderedPanels, prerender
+from shared_store import PanelCache, SharedStore
+
+
+def view_keys(tokoh, sentimen, top_n):
+    # Panel yang dirender halaman dashboard untuk satu kombinasi filter
+    return ([('distribusi',)] + [('wordcloud', tokoh, s) for s in WORDCLOUD_SENTIMEN] +
+            [('ngram', tokoh, sentimen, ngram, top_n) for ngram in NGRAMS] +
+            [('hashtag', tokoh, sentimen), ('hashtag_pairs', tokoh, sentimen, top_n)])
+
+
+def same_value(a, b):
+    from plotly.basedatatypes import BaseFigure
+
+    if isinstance(a, tuple):
+        return isinstance(b, tuple) and len(a) == len(b) and all(same_value(x, y) for x, y in zip(a, b))
+    if isinstance(a, BaseFigure):
+        return isinstance(b, BaseFigure) and json.loads(a.to_json()) == json.loads(b.to_json())
+    if hasattr(a, 'equals'):
+        return a.equals(b)
+    return a == b
+
+
+def serve_view(store, keys, prerendered):
+    # Cache panel baru (kosong) per view; panel diambil lewat jalur yang sama dengan halaman
+    panels = PanelCache(prerendered=prerendered)
+    start = time.perf_counter()
+    for key in keys:
+        panels.get(key, lambda key=key: compute_panel(store, key))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--views', type=int, default=30, help="Jumlah kombinasi filter acak yang diukur")
+    parser.add_argument('--parity', type=int, default=300, help="Jumlah panel acak yang dibandingkan")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    warnings.filterwarnings('ignore')
+
+    store = SharedStore(stem_cache_path=None, prerender_dir=None)
+    prerendered = PrerenderedPanels(store.data_fingerprint, root=PRERENDER_DIR)
+    manifest = prerendered.manifest()
+    if manifest is None:
+        print("Artefak belum ada untuk versi data ini, membangun (dataset lengkap)...")
+        manifest = prerender(store)
+    print(f"Build: {manifest['panels']:,} panel, {manifest['bytes'] / 1e6:,.1f} MB, {manifest['seconds']:.1f} detik")
+
+    # 1. Parity: artefak vs hasil hitung langsung
+    rng = random.Random(args.seed)
+    sentimen_options = ["All"] + sorted(store.df_sentimen["Sentimen"].dropna().unique())
+    all_keys = list(panel_keys(sentimen_options))
+    sample = rng.sample(all_keys, min(args.parity, len(all_keys)))
+    mismatches = [key for key in sample if not same_value(prerendered.get(key), compute_panel(store, key))]
+    print(f"Parity ({len(sample):,} panel acak): "
+          f"{'identik' if not mismatches else 'BERBEDA: ' + ', '.join(map(str, mismatches[:5]))}")
+
+    # 2. Latensi penyajian satu view (kombinasi filter acak, cache panel kosong)
+    combos = [(rng.choice(CAGUB_LIST), rng.choice(sentimen_options), rng.randint(TOP_NUMBER_MIN, TOP_NUMBER_MAX))
+              for _ in range(args.views)]
+    live = [serve_view(store, view_keys(*combo), None) for combo in combos]
+    served = [serve_view(store, view_keys(*combo), prerendered) for combo in combos]
+
+    print(f"\n{'view (9 panel)':<24}{'p50 ms':>10}{'p95 ms':>10}{'maks ms':>10}")
+    for name, times in (('dihitung langsung', live), ('artefak prerender', served)):
+        ms = np.array(times) * 1000
+        print(f"{name:<24}{np.percentile(ms, 50):>10.1f}{np.percentile(ms, 95):>10.1f}{ms.max():>10.1f}")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+Waktu rerun halaman dashboard (AppTest) untuk interaksi sidebar dan
+pencarian: ganti calon gubernur, ganti jenis sentimen, ganti jumlah data
+teratas, dan mengetik kata kunci pencarian.
+
+Satu putaran pemanasan dijalankan lebih dulu (store, indeks, dan cache
+gambar terisi), lalu setiap interaksi diukur beberapa kali dan dilaporkan
+mediannya.
+
+Jalankan dari direktori utama proyek:
+    python benchmarks/bench_rerun.py [--rounds 3]
+"""
+import argparse
+import statistics
+import sys
+import time
+import warnings
+from pathlib import Path
+
+DASHBOARD_DIR = Path(__file__).resolve().parents[1] / 'Dashboard'
+sys.path.insert(0, str(DASHBOARD_DIR))
+
+from streamlit.testing.v1 import AppTest
+
+CAGUB = ["Khofifah Indar Parawansa", "Tri Rismaharini", "Luluk Nur Hamidah"]
+SENTIMEN = ["Positif", "Negatif", "All"]
+TOP_NUMBER = [15, 25, 20]
+SEARCH = ["jatim", "risma", ""]
+
+
+def interactions(at):
+    # (jenis interaksi, fungsi yang mengubah widget) untuk satu putaran
+    steps = []
+    steps += [('calon gubernur', lambda value=value: at.sidebar.selectbox[0].set_value(value)) for value in CAGUB]
+    steps += [('jenis sentimen', lambda value=value: at.sidebar.selectbox[1].set_value(value)) for value in SENTIMEN]
+    steps += [('jumlah teratas', lambda value=value: at.sidebar.number_input[0].set_value(value)) for value in TOP_NUMBER]
+    steps += [('pencarian', lambda value=value: at.text_input[0].set_value(value)) for value in SEARCH]
+    return steps
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+    warnings.filterwarnings('ignore')
+
+    at = AppTest.from_file(str(DASHBOARD_DIR / 'sentimen_cagub_app.py'), default_timeout=300)
+    start = time.perf_counter()
+    at.run()
+    print(f"Run pertama: {time.perf_counter() - start:.2f} detik")
+
+    timings = {}
+    for round_number in range(args.rounds + 1):
+        for kind, change in interactions(at):
+            change()
+            start = time.perf_counter()
+            at.run()
+            elapsed = time.perf_counter() - start
+            if at.exception:
+                raise RuntimeError(at.exception[0].value)
+            if round_number:  # putaran 0 = pemanasan
+                timings.setdefault(kind, []).append(elapsed)
+
+    print(f"\n{'interaksi':<18}{'median (ms)':>13}{'maks (ms)':>11}")
+    for kind, values in timings.items():
+        print(f"{kind:<18}{statistics.median(values) * 1000:>13.0f}{max(values) * 1000:>11.0f}")
+    everything = [value for values in timings.values() for value in values]
+    print(f"{'semua':<18}{statistics.median(everything) * 1000:>13.0f}{max(everything) * 1000:>11.0f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,290 @@
+"""
+Benchmark skala untuk fungsi-fungsi jalur panas dashboard pada korpus
+sintetis 10 ribu, 100 ribu, dan 1 juta tweet.
+
+Korpus dibangkitkan dari kosakata asli: token ``full_text`` diambil dari
+file ReLabeling, token ``joined_swremove`` dan hashtag dari dataset
+analisis, sedangkan panjang tweet, tokoh, sentimen, dan username mengikuti
+distribusi data asli (seed tetap, hasil selalu sama).
+
+Setiap fungsi dicatat waktunya (terbaik dari beberapa pengulangan) dan
+puncak memorinya (tracemalloc, pada eksekusi terpisah agar overhead
+tracemalloc tidak ikut terhitung sebagai waktu). Hasil ditambahkan ke file
+JSON Lines (satu baris per fungsi x ukuran, beserta commit git), dan
+dibandingkan dengan hasil terakhir dari commit lain agar regresi terlihat.
+
+Fungsi yang terlalu mahal untuk ukuran besar dibatasi jumlah barisnya
+(``ROW_LIMITS``; kolom "baris" di hasil); gunakan ``--no-limits`` untuk
+menjalankan penuh. ``preprocess_tweet`` memakai cache stemming yang
+di-pre-seed dari ``Data/.cache/stem_cache.json`` bila ada (seperti
+aplikasi); tanpa cache, stemming Sastrawi dingin ~1000x lebih lambat.
+
+Jalankan dari direktori utama proyek:
+    python benchmarks/bench_scaling.py [--sizes 10000 100000 1000000]
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'Dashboard'))
+
+import numpy as np
+import pandas as pd
+
+from build_dataset import RELABELING_PATHS, read_relabeling
+from dashboard_charts import (plot_hashtag_wordcloud_by_sentiment, visualize_ngram_frequency,
+                              visualize_sentiment_distribution_by_tokoh)
+from hashtag_matrix import HashtagMatrix
+from loaders import read_data, read_kamus, to_categorical
+from near_duplicates import add_cluster_columns
+from ngram_index import NgramIndex
+from search_index import SearchIndex
+from stem_cache import STEM_CACHE_PATH, create_stem_cache
+from text_preprocessing import KamusNormalizer, build_stop_words_remover, preprocess_tweet
+
+SIZES = [10_000, 100_000, 1_000_000]
+RESULTS_PATH = 'benchmarks/results/bench_scaling.jsonl'
+SEARCH_QUERY = 'jatim'
+
+# Jumlah baris maksimum per fungsi (None = seluruh korpus)
+ROW_LIMITS = {
+    'preprocess_tweet': 100_000,
+    'search_index_build': 100_000,
+    'search_index_query': 100_000,
+}
+
+
+# ----------------------------------------------------------------------------
+# Korpus Sintetis
+# ----------------------------------------------------------------------------
+
+def _distribution(values):
+    counts = pd.Series(values).value_counts()
+    return counts.index.to_numpy(), (counts / counts.sum()).to_numpy()
+
+
+def _join_rows(tokens, lengths):
+    # Menggabungkan token berurutan menjadi satu string per baris
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+    tokens = tokens.tolist()
+    return [' '.join(tokens[start:end]) for start, end in zip(starts.tolist(), ends.tolist())]
+
+
+class CorpusGenerator:
+    """Membangkitkan DataFrame berkolom sama dengan dataset analisis dari kosakata asli."""
+
+    def __init__(self, relabeling_paths=RELABELING_PATHS):
+        raw = read_relabeling(relabeling_paths)['full_text'].dropna().astype(str)
+        data = read_data()
+
+        raw_tokens = raw.str.split()
+        self.raw_vocab = _distribution(raw_tokens.explode().dropna())
+        self.raw_lengths = raw_tokens.str.len().to_numpy()
+
+        clean_tokens = data['joined_swremove'].astype(str).str.split()
+        self.clean_vocab = _distribution(clean_tokens.explode().dropna())
+        self.clean_lengths = clean_tokens.str.len().to_numpy()
+
+        hashtags = data['hashtag'].dropna().astype(str).str.split()
+        self.hashtag_vocab = _distribution(hashtags.explode().dropna())
+        self.hashtag_counts = data['hashtag'].astype(str).where(data['hashtag'].notna(), '').str.split().str.len().to_numpy()
+
+        self.rows = data[['tokoh', 'Sentimen', 'Label', 'username']].astype(object).reset_index(drop=True)
+
+    def generate(self, size, seed=0):
+        rng = np.random.default_rng(seed)
+
+        # Kerangka baris: tokoh/sentimen/username dan panjang diambil dari baris asli acak
+        template = rng.integers(0, len(self.rows), size)
+        df = self.rows.iloc[template].reset_index(drop=True)
+
+        def sample_text(vocab, lengths):
+            words, probs = vocab
+            n_tokens = lengths[template]
+            return _join_rows(words[rng.choice(len(words), int(n_tokens.sum()), p=probs)], n_tokens)
+
+        df['full_text'] = sample_text(self.raw_vocab, self.raw_lengths)
+        df['joined_swremove'] = sample_text(self.clean_vocab, self.clean_lengths)
+        hashtag = pd.Series(sample_text(self.hashtag_vocab, self.hashtag_counts))
+        df['hashtag'] = hashtag.where(hashtag != '')
+        # Hashtag juga muncul di teks mentah (seperti tweet asli)
+        df['full_text'] = df['full_text'].str.cat(('#' + hashtag.str.replace(' ', ' #')).where(hashtag != '', ''),
+                                                  sep=' ').str.strip()
+        return to_categorical(df)
+
+
+# ----------------------------------------------------------------------------
+# Kasus Benchmark
+# ----------------------------------------------------------------------------
+
+def build_cases(df, tmp_dir):
+    """
+    Fungsi yang diukur untuk satu korpus.
+
+    Returns:
+        dict: nama -> (fungsi tanpa argumen, jumlah baris yang diproses)
+    """
+    tokoh = df['tokoh'].value_counts().index[0]
+    normalizer = KamusNormalizer(read_kamus())
+    stop_words_remover = build_stop_words_remover()
+
+    def limited(name):
+        limit = ROW_LIMITS.get(name)
+        return df if limit is None or limit >= len(df) else df.iloc[:limit]
+
+    def preprocess(texts):
+        # Cache stemming baru setiap eksekusi, di-pre-seed seperti worker aplikasi (preprocess_pool.init_worker)
+        stemmer = create_stem_cache(path=None)
+        if os.path.exists(STEM_CACHE_PATH):
+            stemmer.load(STEM_CACHE_PATH)
+        return [preprocess_tweet(text, normalizer, stop_words_remover, stemmer) for text in texts]
+
+    preprocess_texts = limited('preprocess_tweet')['full_text'].tolist()
+    search_df = limited('search_index_build')
+    search_index = {}
+    hashtag_matrix = HashtagMatrix(df)
+
+    def search_query():
+        if 'index' not in search_index:
+            search_index['index'] = SearchIndex(limited('search_index_query'))
+        return search_index['index'].search(SEARCH_QUERY)
+
+    def search_contains():
+        # Jalur filter lama halaman dashboard (str.contains pada dua kolom)
+        return df[df['full_text'].str.contains(SEARCH_QUERY, case=False, na=False) |
+                  df['username'].astype(str).str.contains(SEARCH_QUERY, case=False, na=False)]
+
+    cases = {
+        'preprocess_tweet': (lambda: preprocess(preprocess_texts), len(preprocess_texts)),
+        'visualize_ngram_frequency': (
+            lambda: visualize_ngram_frequency(df, tokoh, sentimen='All', ngram='bigram', top_n=10), len(df)),
+        'ngram_index_build': (lambda: NgramIndex.build(df, index_dir=os.path.join(tmp_dir, 'ngram')), len(df)),
+        'plot_hashtag_wordcloud_by_sentiment': (
+            lambda: plot_hashtag_wordcloud_by_sentiment(df, sentiment_filter='All', tokoh_filter=tokoh), len(df)),
+        'hashtag_matrix_build': (lambda: HashtagMatrix(df), len(df)),
+        'hashtag_matrix_counts': (lambda: hashtag_matrix.counts('All', tokoh), len(df)),
+        # Korpus sintetis tidak punya 'clean_text'; teks acak nyaris tanpa duplikat (mengukur skala saja)
+        'cluster_near_duplicates': (lambda: add_cluster_columns(df, column='joined_swremove'), len(df)),
+        'visualize_sentiment_distribution_by_tokoh': (
+            lambda: visualize_sentiment_distribution_by_tokoh(df), len(df)),
+        'search_contains': (search_contains, len(df)),
+        'search_index_build': (lambda: SearchIndex(search_df), len(search_df)),
+        # Query pertama membangun indeks (tidak diukur); pengulangan berikutnya hanya query
+        'search_index_query': (search_query, len(limited('search_index_query'))),
+    }
+    search_query()
+    return cases
+
+
+def measure(func, repeat, memory=True):
+    """Waktu terbaik dari ``repeat`` eksekusi dan puncak memori (MB) satu eksekusi."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    peak_mb = None
+    if memory:
+        tracemalloc.start()
+        try:
+            func()
+            peak_mb = tracemalloc.get_traced_memory()[1] / 1e6
+        finally:
+            tracemalloc.stop()
+    return best, peak_mb
+
+
+# ----------------------------------------------------------------------------
+# Penyimpanan & Perbandingan Hasil
+# ----------------------------------------------------------------------------
+
+def git_commit():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                check=True).stdout.strip()
+        dirty = bool(subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                                    capture_output=True, text=True, check=True).stdout.strip())
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+
+
+def previous_results(path, commit):
+    """Hasil terakhir per (fungsi, ukuran) dari commit selain ``commit``."""
+    previous = {}
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                record = json.loads(line)
+                if record.get('commit') != commit:
+                    previous[(record['function'], record['size'])] = record
+    return previous
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--functions', nargs='+', help="Hanya fungsi tertentu (default semua)")
+    parser.add_argument('--output', default=RESULTS_PATH, help="File JSON Lines hasil (ditambahkan)")
+    parser.add_argument('--repeat', type=int, default=3, help="Pengulangan waktu untuk korpus <= 100 ribu")
+    parser.add_argument('--no-memory', action='store_true', help="Lewati pengukuran tracemalloc")
+    parser.add_argument('--no-limits', action='store_true', help="Abaikan ROW_LIMITS")
+    args = parser.parse_args()
+
+    if args.no_limits:
+        ROW_LIMITS.clear()
+
+    commit, dirty = git_commit()
+    previous = previous_results(args.output, commit)
+    meta = {
+        'commit': commit, 'dirty': dirty,
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(), 'pandas': pd.__version__, 'numpy': np.__version__,
+        'machine': platform.machine(), 'cpu_count': os.cpu_count(),
+        'stem_cache_seeded': os.path.exists(STEM_CACHE_PATH),
+    }
+
+    generator = CorpusGenerator()
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    print(f"{'fungsi':<44}{'ukuran':>11}{'baris':>11}{'detik':>10}{'puncak MB':>11}{'vs sebelumnya':>15}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir, open(args.output, 'a', encoding='utf-8') as out:
+        for size in args.sizes:
+            start = time.perf_counter()
+            df = generator.generate(size)
+            print(f"-- korpus {size:,} tweet dibangkitkan dalam {time.perf_counter() - start:.1f} detik", flush=True)
+
+            cases = build_cases(df, tmp_dir)
+            for name, (func, rows) in cases.items():
+                if args.functions and name not in args.functions:
+                    continue
+                repeat = args.repeat if size <= 100_000 else 1
+                seconds, peak_mb = measure(func, repeat, memory=not args.no_memory)
+
+                record = dict(meta, function=name, size=size, rows=rows, repeat=repeat,
+                              seconds=round(seconds, 6),
+                              peak_mb=None if peak_mb is None else round(peak_mb, 3))
+                out.write(json.dumps(record) + '\n')
+                out.flush()
+
+                before = previous.get((name, size))
+                change = f"{seconds / before['seconds']:.2f}x" if before and before['seconds'] else '-'
+                peak = '-' if peak_mb is None else f"{peak_mb:.1f}"
+                print(f"{name:<44}{size:>11,}{rows:>11,}{seconds:>10.3f}{peak:>11}{change:>15}", flush=True)
+
+    print(f"\nHasil ditambahkan ke {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
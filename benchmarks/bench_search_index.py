@@ -0,0 +1,67 @@
+"""
+Parity check dan benchmark SearchIndex vs str.contains pada panel "Pencarian Data".
+
+Jalankan dari direktori utama proyek:
+    python benchmarks/bench_search_index.py
+"""
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'Dashboard'))
+
+import numpy as np
+
+from loaders import read_data
+from search_index import SearchIndex
+
+QUERIES = ['khofifah', 'Risma', 'luluk', 'pilkada', 'gubernur jatim', 'emil', 'pks', 'ri', 'a',
+           'https', 'surabaya', 'tidak ada yang cocok', 'kompas', '@', 'DPP_PKB', 'wkwk',
+           'risma|khofifah', 'pilkada.*jatim', 'jatim.go.id', '(emil']
+
+
+def search_contains(df, query):
+    # Jalur lama: salin dataframe lalu dua kali str.contains (regex, tidak peka huruf besar/kecil);
+    # regex tidak valid dicari sebagai teks biasa seperti SearchIndex
+    filtered_df = df.copy()
+    try:
+        re.compile(query)
+        regex = True
+    except re.error:
+        regex = False
+    mask = (filtered_df['full_text'].str.contains(query, case=False, na=False, regex=regex) |
+            filtered_df['username'].str.contains(query, case=False, na=False, regex=regex))
+    return np.flatnonzero(mask.to_numpy())
+
+
+def main():
+    df = read_data()
+
+    start = time.perf_counter()
+    index = SearchIndex(df)
+    print(f"Build indeks: {time.perf_counter() - start:.2f} detik ({len(df):,} baris)")
+
+    mismatches = 0
+    old_time = new_time = 0.0
+    for query in QUERIES:
+        start = time.perf_counter()
+        expected = search_contains(df, query)
+        old_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = index.search(query)
+        new_time += time.perf_counter() - start
+
+        if not np.array_equal(expected, actual):
+            mismatches += 1
+            print(f"  beda: {query!r} ({len(expected)} vs {len(actual)})")
+
+    print(f"Parity: {len(QUERIES) - mismatches}/{len(QUERIES)} query identik")
+    print(f"str.contains: {old_time / len(QUERIES) * 1000:.2f} ms per query")
+    print(f"SearchIndex : {new_time / len(QUERIES) * 1000:.2f} ms per query")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
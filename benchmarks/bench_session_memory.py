@@ -0,0 +1,74 @@
+"""
+Pengukuran memori per sesi: membuka banyak sesi dashboard sekaligus (AppTest)
+dan mengukur pertambahan RSS proses serta memori yang dipegang session_state.
+
+Semua sesi tetap hidup sampai pengukuran selesai, seperti pengguna yang
+membuka dashboard secara bersamaan.
+
+Jalankan dari direktori utama proyek:
+    python benchmarks/bench_session_memory.py [--sessions 50]
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+import warnings
+from pathlib import Path
+
+DASHBOARD_DIR = Path(__file__).resolve().parents[1] / 'Dashboard'
+sys.path.insert(0, str(DASHBOARD_DIR))
+
+from streamlit.testing.v1 import AppTest
+
+
+def rss_mb():
+    # RSS proses saat ini dari /proc (Linux)
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1e6
+
+
+def open_session():
+    at = AppTest.from_file(str(DASHBOARD_DIR / 'sentimen_cagub_app.py'), default_timeout=300)
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return at
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sessions', type=int, default=50)
+    args = parser.parse_args()
+    warnings.filterwarnings('ignore')
+
+    # Sesi pertama memuat store bersama dan seluruh cache
+    start = time.perf_counter()
+    sessions = [open_session()]
+    gc.collect()
+    base = rss_mb()
+    print(f"Sesi pertama: {time.perf_counter() - start:.1f} detik, RSS {base:.0f} MB")
+
+    start = time.perf_counter()
+    for _ in range(args.sessions - 1):
+        sessions.append(open_session())
+    gc.collect()
+    growth = rss_mb() - base
+    print(f"{args.sessions - 1} sesi tambahan: {time.perf_counter() - start:.1f} detik, "
+          f"RSS +{growth:.1f} MB ({growth / (args.sessions - 1) * 1000:.0f} KB per sesi, "
+          f"termasuk overhead AppTest)")
+
+    try:
+        from shared_store import get_store, session_footprint
+    except ImportError:
+        return 0
+    store = get_store()
+    footprints = [session_footprint(at.session_state, store)['Byte'].sum()
+                  for at in sessions]
+    print(f"session_state: {sum(footprints) / 1024:.1f} KB total "
+          f"({sum(footprints) / len(footprints):.0f} byte per sesi) di luar store bersama")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
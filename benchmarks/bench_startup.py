@@ -0,0 +1,77 @@
+"""
+Benchmark cold start: latensi halaman pertama (Dashboard) dan prediksi
+pertama (halaman Prediksi Sentimen) pada proses Python yang baru.
+
+Setiap skenario dijalankan di subprocess baru sebanyak ``--repeat`` kali
+(cache disk seperti indeks n-gram dan cache stemming tetap dipakai, seperti
+server yang baru di-restart).
+
+Jalankan dari direktori utama proyek:
+    python benchmarks/bench_startup.py [--repeat 3]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+APP_PATH = Path(__file__).resolve().parents[1] / 'Dashboard' / 'sentimen_cagub_app.py'
+SCENARIOS = ['halaman-pertama', 'prediksi-pertama']
+
+
+def run_scenario(scenario):
+    # Dijalankan di subprocess: waktu dihitung sejak sebelum streamlit diimport
+    start = time.perf_counter()
+
+    import warnings
+    warnings.filterwarnings('ignore')
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(APP_PATH), default_timeout=600)
+    at.run()
+    first_page = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+
+    if scenario == 'halaman-pertama':
+        print(f"{first_page}")
+        return
+
+    at.switch_page("app-pages/page_prediksi.py").run()
+    page_ready = time.perf_counter() - start
+    at.chat_input[0].set_value("Bu Risma hebat, semoga menang!").run()
+    prediction_ready = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    print(f"{page_ready},{prediction_ready}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--scenario', choices=SCENARIOS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.scenario:
+        run_scenario(args.scenario)
+        return 0
+
+    results = {}
+    for scenario in SCENARIOS:
+        runs = []
+        for _ in range(args.repeat):
+            output = subprocess.run([sys.executable, __file__, '--scenario', scenario],
+                                    capture_output=True, text=True, check=True).stdout
+            runs.append([float(v) for v in output.strip().splitlines()[-1].split(',')])
+        results[scenario] = [statistics.median(values) for values in zip(*runs)]
+
+    print(f"Median dari {args.repeat} proses baru:")
+    print(f"  Halaman Dashboard pertama tampil        : {results['halaman-pertama'][0]:.2f} detik")
+    print(f"  Dashboard lalu buka halaman Prediksi     : {results['prediksi-pertama'][0]:.2f} detik")
+    print(f"  ... sampai hasil prediksi pertama tampil : {results['prediksi-pertama'][1]:.2f} detik")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,119 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'Dashboard'))
+
+# Path data & model di modul Dashboard relatif terhadap direktori utama proyek
+os.chdir(ROOT)
+
+# Sampel tetap korpus ReLabeling: setiap baris ke-SAMPLE_STEP
+SAMPLE_STEP = 12
+
+
+def pytest_addoption(parser):
+    parser.addoption('--run-slow', action='store_true', help="Jalankan juga tes bertanda slow (korpus penuh)")
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', "slow: tes korpus penuh (menit); dilewati tanpa --run-slow")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--run-slow'):
+        return
+    skip_slow = pytest.mark.skip(reason="tes korpus penuh, jalankan dengan --run-slow")
+    for item in items:
+        if 'slow' in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope='session')
+def relabeling_sample():
+    """Sampel tetap ``ReLabeling - Gabungan.csv`` (kolom asli, tokoh nama singkat)."""
+    from build_dataset import RELABELING_PATHS, read_relabeling
+
+    return read_relabeling(RELABELING_PATHS).iloc[::SAMPLE_STEP].reset_index(drop=True)
+
+
+@pytest.fixture(scope='session')
+def corpus_df(relabeling_sample):
+    """
+    Dataset analisis kecil dengan kolom yang sama seperti ``read_data``.
+
+    'joined_swremove' diisi hasil ``clean_text`` (tanpa stemming) agar
+    fixture cepat dibangun; kode yang diuji memperlakukannya sebagai teks apa pun.
+    """
+    from loaders import LABEL_MAPPING, NAME_MAPPING, to_categorical
+    from text_preprocessing import clean_text
+
+    df = relabeling_sample.copy()
+    df['tokoh'] = df['tokoh'].map(NAME_MAPPING)
+    df['Sentimen'] = df['Label'].map(LABEL_MAPPING)
+    df['clean_text'] = df['full_text'].map(clean_text)
+    df['joined_swremove'] = df['clean_text']
+    hashtags = df['full_text'].astype(str).str.findall(r'#(\w+)').str.join(' ')
+    df['hashtag'] = hashtags.where(hashtags != '')
+    df = df[df['joined_swremove'] != ''].reset_index(drop=True)
+    return to_categorical(df)
+
+
+@pytest.fixture(scope='session')
+def tfidf_pipeline():
+    """(vectorizer, fselector) dari pickle yang ikut di repositori."""
+    import pickle
+
+    from loaders import SELECTOR_PATH, VECTORIZER_PATH
+
+    with open(VECTORIZER_PATH, 'rb') as f_vec, open(SELECTOR_PATH, 'rb') as f_select:
+        return pickle.load(f_vec), pickle.load(f_select)
+
+
+@pytest.fixture(scope='session')
+def small_forest(corpus_df, tfidf_pipeline):
+    """Random Forest kecil di atas fitur terpilih (pickle model asli tidak ikut di repositori)."""
+    from sklearn.ensemble import RandomForestClassifier
+
+    vectorizer, fselector = tfidf_pipeline
+    X = fselector.transform(vectorizer.transform(corpus_df['joined_swremove']))
+    return RandomForestClassifier(n_estimators=15, max_depth=12, random_state=0).fit(X, corpus_df['Sentimen'])
+
+
+@pytest.fixture(scope='session')
+def kamus():
+    from loaders import read_kamus
+
+    return read_kamus()
+
+
+@pytest.fixture(scope='session')
+def preprocessing(kamus):
+    """(normalizer, stop_words_remover, stemmer) dengan cache stemming hanya di memori."""
+    from stem_cache import create_stem_cache
+    from text_preprocessing import KamusNormalizer, build_stop_words_remover
+
+    return KamusNormalizer(kamus), build_stop_words_remover(), create_stem_cache(path=None)
+
+
+@pytest.fixture(scope='session')
+def label_forest(corpus_df, tfidf_pipeline):
+    """Seperti ``small_forest`` tetapi kelasnya kode 'Label' (0/1/2) seperti model asli dari ``read_model``."""
+    from sklearn.ensemble import RandomForestClassifier
+
+    vectorizer, fselector = tfidf_pipeline
+    X = fselector.transform(vectorizer.transform(corpus_df['joined_swremove']))
+    return RandomForestClassifier(n_estimators=15, max_depth=12, random_state=0).fit(X, corpus_df['Label'])
+
+
+@pytest.fixture
+def data_csv(corpus_df, tmp_path):
+    """``corpus_df`` sebagai file dataset analisis (tokoh nama singkat, seperti keluaran ``build_dataset.py``)."""
+    from loaders import NAME_MAPPING
+
+    short_names = {full: short for short, full in NAME_MAPPING.items()}
+    path = tmp_path / 'data.csv'
+    corpus_df.assign(tokoh=corpus_df['tokoh'].map(short_names)).to_csv(path, index=False)
+    return str(path)
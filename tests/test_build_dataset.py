@@ -0,0 +1,61 @@
+import io
+
+import pytest
+
+import build_dataset
+from build_dataset import PreprocessCache, build_dataset as run_build, content_hash, pipeline_version
+
+
+@pytest.fixture(scope='module')
+def sample(relabeling_sample):
+    return relabeling_sample.head(4)
+
+
+def build(df, cache):
+    return run_build(df, cache, workers=1, stem_cache_path=None, log=io.StringIO())
+
+
+def test_cached_hash_is_not_processed_again(sample, tmp_path):
+    cache = PreprocessCache(str(tmp_path / 'cache.jsonl'), version='v1')
+    first, processed = build(sample, cache)
+    assert processed == sample['full_text'].nunique()
+
+    # Hasil tersimpan dipakai ulang: isi cache yang ditandai ikut muncul di dataset
+    key = content_hash(sample['full_text'].iloc[0])
+    cache.entries[key] = ('teks cache', 'kata cache')
+    second, processed = build(sample, cache)
+    assert processed == 0
+    assert second.loc[second['content_hash'] == key, 'joined_swremove'].tolist() == ['kata cache']
+    assert second.drop(index=second.index[second['content_hash'] == key]).equals(
+        first.drop(index=first.index[first['content_hash'] == key]))
+
+
+def test_cache_reloaded_from_file_for_same_version(sample, tmp_path):
+    path = str(tmp_path / 'cache.jsonl')
+    expected, _ = build(sample, PreprocessCache(path, version='v1'))
+
+    reopened = PreprocessCache(path, version='v1')
+    assert all(key in reopened for key in expected['content_hash'])
+    result, processed = build(sample, reopened)
+    assert processed == 0
+    assert result.equals(expected)
+
+
+def test_new_pipeline_version_invalidates_cache(sample, tmp_path):
+    path = str(tmp_path / 'cache.jsonl')
+    build(sample, PreprocessCache(path, version='v1'))
+
+    reopened = PreprocessCache(path, version='v2')
+    assert reopened.entries == {}
+    assert not any(content_hash(text) in reopened for text in sample['full_text'])
+
+    # File ditulis ulang untuk versi baru; versi lama tidak lagi terbaca
+    assert PreprocessCache(path, version='v1').entries == {}
+
+
+def test_pipeline_version_follows_preprocessing_config(monkeypatch):
+    version = pipeline_version()
+    assert pipeline_version() == version
+
+    monkeypatch.setattr(build_dataset, 'MORE_STOP_WORDS', build_dataset.MORE_STOP_WORDS + ['katabaru'])
+    assert pipeline_version() != version
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from compiled_forest import CompiledForest
+
+
+@pytest.fixture(scope='module')
+def X(corpus_df, tfidf_pipeline):
+    vectorizer, fselector = tfidf_pipeline
+    texts = corpus_df['joined_swremove'].tolist() + corpus_df['full_text'].astype(str).tolist() + ['', 'zzzz']
+    return fselector.transform(vectorizer.transform(texts)).tocsr()
+
+
+def sklearn_leaf_proba(estimator, X):
+    # Nilai node daun yang dicapai scikit-learn, dinormalisasi seperti CompiledForest.from_sklearn
+    value = estimator.tree_.value[estimator.apply(X), 0, :].astype(np.float64)
+    normalizer = value.sum(axis=1, keepdims=True)
+    normalizer[normalizer == 0.0] = 1.0
+    return value / normalizer
+
+
+@pytest.fixture(scope='module')
+def compiled(small_forest):
+    # batch_threshold=0: seluruh batch dievaluasi evaluator array
+    return CompiledForest.from_sklearn(small_forest, batch_threshold=0)
+
+
+def test_predict_proba_matches_sklearn(small_forest, compiled, X):
+    expected = small_forest.predict_proba(X)
+    actual = compiled.predict_proba(X)
+    np.testing.assert_allclose(actual, expected, rtol=0, atol=1e-12)
+    assert np.array_equal(compiled.predict(X), small_forest.predict(X))
+
+
+def test_reaches_same_leaves_as_sklearn(small_forest, compiled, X):
+    leaves = compiled.apply(X)
+    for tree, estimator in enumerate(small_forest.estimators_):
+        assert np.array_equal(compiled.leaf_proba[leaves[:, tree]], sklearn_leaf_proba(estimator, X)), tree
+
+
+def test_values_on_split_thresholds_follow_sklearn(small_forest, compiled):
+    # Nilai fitur tepat di threshold (setelah cast float32) menguji _float32_floor
+    rows = []
+    for estimator in small_forest.estimators_[:5]:
+        tree = estimator.tree_
+        for node in np.flatnonzero(tree.children_left >= 0)[:40]:
+            row = np.zeros(compiled.n_features_in_)
+            row[tree.feature[node]] = np.float32(tree.threshold[node])
+            rows.append(row)
+    dense = np.array(rows)
+    leaves = compiled.apply(dense)
+    for tree, estimator in enumerate(small_forest.estimators_):
+        assert np.array_equal(compiled.leaf_proba[leaves[:, tree]],
+                              sklearn_leaf_proba(estimator, dense.astype(np.float32))), tree
+
+
+def test_zero_threshold_never_falls_back(small_forest, compiled, X, monkeypatch):
+    def fail(X):
+        raise AssertionError("fallback dipanggil")
+
+    monkeypatch.setattr(small_forest, 'predict_proba', fail)
+    assert compiled.predict_proba(X).shape == (X.shape[0], len(small_forest.classes_))
+
+
+def test_large_batch_uses_sklearn(small_forest, X):
+    hybrid = CompiledForest.from_sklearn(small_forest, batch_threshold=16)
+    assert np.array_equal(hybrid.predict_proba(X), small_forest.predict_proba(X))
+    np.testing.assert_allclose(hybrid.predict_proba(X[:16]), small_forest.predict_proba(X[:16]), rtol=0, atol=1e-12)
@@ -0,0 +1,47 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from fused_model import PrunedTfidfVectorizer, compile_fused_model
+
+EDGE_TEXTS = ['', '   ', 'a', 'zzzzqqq', 'Jatim JATIM jatim', 'risma risma risma', 'khofifah luluk risma 2024',
+              'gubernur_jatim pilkada-jatim', 'x' * 500]
+
+
+@pytest.fixture(scope='module')
+def texts(corpus_df):
+    return corpus_df['joined_swremove'].tolist() + corpus_df['full_text'].astype(str).tolist() + EDGE_TEXTS
+
+
+@pytest.fixture(scope='module')
+def pruned(tfidf_pipeline):
+    return PrunedTfidfVectorizer.from_pipeline(*tfidf_pipeline)
+
+
+def assert_same_matrix(actual, expected):
+    assert actual.shape == expected.shape
+    assert np.array_equal(actual.toarray(), expected.toarray())
+
+
+def test_transform_matches_vectorizer_and_selector(tfidf_pipeline, pruned, texts):
+    vectorizer, fselector = tfidf_pipeline
+    assert_same_matrix(pruned.transform(texts), fselector.transform(vectorizer.transform(texts)))
+
+
+def test_transform_single_texts_match_batch(pruned, texts):
+    batch = pruned.transform(texts).toarray()
+    for row, text in enumerate(texts[::25]):
+        assert np.array_equal(pruned.transform([text]).toarray()[0], batch[row * 25])
+
+
+def test_pickle_round_trip(pruned, texts):
+    loaded = pickle.loads(pickle.dumps(pruned, protocol=pickle.HIGHEST_PROTOCOL))
+    assert_same_matrix(loaded.transform(texts), pruned.transform(texts))
+
+
+def test_fused_model_predicts_like_chain(tfidf_pipeline, small_forest, texts):
+    vectorizer, fselector = tfidf_pipeline
+    fused_vectorizer, fused_selector, model = compile_fused_model(vectorizer, fselector, small_forest).components()
+    expected = small_forest.predict_proba(fselector.transform(vectorizer.transform(texts)))
+    assert np.array_equal(model.predict_proba(fused_selector.transform(fused_vectorizer.transform(texts))), expected)
@@ -0,0 +1,90 @@
+from collections import Counter
+from itertools import combinations
+
+import pandas as pd
+import pytest
+
+from hashtag_matrix import PAIR_COLUMNS, HashtagMatrix
+from ngram_index import SENTIMEN_LIST
+
+
+def counts_baseline(df, sentiment_filter, tokoh_filter):
+    # Jalur lama plot_hashtag_wordcloud_by_sentiment
+    if sentiment_filter != 'All':
+        df = df[df['Sentimen'] == sentiment_filter]
+    if tokoh_filter is not None:
+        df = df[df['tokoh'] == tokoh_filter]
+    return Counter(tag for tags in df['hashtag'] if isinstance(tags, str) for tag in tags.split())
+
+
+def pairs_baseline(df, sentiment_filter, tokoh_filter):
+    # Hitung langsung per tweet: setiap pasangan dihitung sekali per tweet
+    if sentiment_filter != 'All':
+        df = df[df['Sentimen'] == sentiment_filter]
+    if tokoh_filter is not None:
+        df = df[df['tokoh'] == tokoh_filter]
+    pairs = Counter()
+    for tags in df['hashtag']:
+        if isinstance(tags, str):
+            pairs.update(combinations(sorted(set(tags.split())), 2))
+    return pairs
+
+
+def filters(df):
+    return [(sentimen, tokoh) for sentimen in ['All'] + SENTIMEN_LIST
+            for tokoh in [None] + df['tokoh'].dropna().unique().tolist()]
+
+
+@pytest.fixture(scope='module')
+def small_df():
+    return pd.DataFrame({
+        'tokoh': ['Risma', 'Risma', 'Luluk', None, 'Khofifah', 'Luluk'],
+        'Sentimen': ['Positif', 'Negatif', 'Positif', 'Netral', None, 'Positif'],
+        'hashtag': ['b a b', None, 'a c', 'c d', 'a b', 'c a a'],
+    })
+
+
+def test_counts_match_counter_in_order(corpus_df):
+    matrix = HashtagMatrix(corpus_df)
+    for sentimen, tokoh in filters(corpus_df):
+        expected = list(counts_baseline(corpus_df, sentimen, tokoh).items())
+        assert list(matrix.counts(sentimen, tokoh).items()) == expected, (sentimen, tokoh)
+
+
+def test_pairs_match_direct_count(corpus_df, small_df):
+    for df in (corpus_df, small_df):
+        matrix = HashtagMatrix(df)
+        for sentimen, tokoh in filters(df):
+            expected = pairs_baseline(df, sentimen, tokoh)
+            pairs = matrix.cooccurring_pairs(sentimen, tokoh, top_n=len(expected))
+            assert {(a, b): n for a, b, n in pairs.itertuples(index=False)} == dict(expected), (sentimen, tokoh)
+
+
+def test_top_pairs_sorted_by_frequency_then_name(small_df):
+    pairs = HashtagMatrix(small_df).cooccurring_pairs(top_n=3)
+    assert list(pairs.columns) == PAIR_COLUMNS
+    assert pairs.values.tolist() == [['a', 'b', 2], ['a', 'c', 2], ['c', 'd', 1]]
+
+
+def test_update_matches_single_build(corpus_df):
+    matrix = HashtagMatrix()
+    for start in range(0, len(corpus_df), 97):
+        matrix.update(corpus_df.iloc[start:start + 97])
+    built = HashtagMatrix(corpus_df)
+    assert matrix.n_rows == built.n_rows == len(corpus_df)
+    for sentimen, tokoh in filters(corpus_df):
+        assert list(matrix.counts(sentimen, tokoh).items()) == list(built.counts(sentimen, tokoh).items())
+
+
+def test_unknown_filter_values_are_empty(small_df):
+    matrix = HashtagMatrix(small_df)
+    assert matrix.counts('Positif', 'Tidak Ada') == Counter()
+    assert matrix.cooccurring_pairs('Tidak Ada').empty
+
+
+def test_hashtag_wordcloud_without_hashtags_returns_none(small_df):
+    from dashboard_charts import plot_hashtag_wordcloud_by_sentiment
+
+    # Halaman dashboard menampilkan st.info untuk panel kosong
+    assert plot_hashtag_wordcloud_by_sentiment(small_df.assign(hashtag=None)) is None
+    assert plot_hashtag_wordcloud_by_sentiment(small_df, hashtag_counts=Counter()) is None
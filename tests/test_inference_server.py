@@ -0,0 +1,114 @@
+import json
+import threading
+import time
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from inference_server import InferenceHTTPServer, MicroBatcher, make_handler, request_prediction
+
+
+class FailingService:
+    def predict(self, texts):
+        raise RuntimeError("model rusak")
+
+
+class EchoService:
+    def predict(self, texts):
+        return [{'label': 'Netral', 'confidence': {'Netral': 100.0}, 'clean_text': text} for text in texts]
+
+
+class RecordingPredict:
+    """predict_fn yang mencatat ukuran setiap batch."""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def __call__(self, items):
+        self.batch_sizes.append(len(items))
+        return [item * 2 for item in items]
+
+
+@pytest.fixture
+def serve():
+    servers = []
+
+    def start(service):
+        server = InferenceHTTPServer(('127.0.0.1', 0), make_handler(service))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_predict_returns_results(serve):
+    url = serve(EchoService())
+    assert request_prediction('halo', url=url)['clean_text'] == 'halo'
+
+
+def test_predict_failure_returns_500_json(serve):
+    url = serve(FailingService())
+    with pytest.raises(urllib.error.HTTPError) as info:
+        request_prediction('halo', url=url)
+    assert info.value.code == 500
+    assert 'model rusak' in json.loads(info.value.read())['error']
+
+
+def test_unreachable_server_raises_urlerror():
+    # Halaman prediksi menangkap URLError/TimeoutError/OSError lalu memprediksi langsung
+    with pytest.raises(urllib.error.URLError):
+        request_prediction('halo', url='http://127.0.0.1:9', timeout=2)
+
+
+# ----------------------------------------------------------------------------
+# MicroBatcher
+# ----------------------------------------------------------------------------
+
+def test_concurrent_requests_grouped_up_to_max_batch_size():
+    predict = RecordingPredict()
+    batcher = MicroBatcher(predict, max_batch_size=4, max_wait_ms=500)
+    start = threading.Barrier(10)
+
+    def request(i):
+        start.wait()
+        return batcher.submit(i).result(timeout=5)
+
+    with ThreadPoolExecutor(max_workers=10) as pool:
+        results = list(pool.map(request, range(10)))
+
+    assert results == [i * 2 for i in range(10)]
+    assert sum(predict.batch_sizes) == 10
+    assert max(predict.batch_sizes) == 4
+    # Sepuluh item dengan batas 4: minimal tiga batch, bukan satu batch per item
+    assert len(predict.batch_sizes) <= 4
+    assert batcher.stats()['items'] == 10
+
+
+def test_partial_batch_flushed_after_max_wait():
+    predict = RecordingPredict()
+    batcher = MicroBatcher(predict, max_batch_size=32, max_wait_ms=50)
+
+    started = time.monotonic()
+    futures = [batcher.submit(i) for i in range(3)]
+    assert [future.result(timeout=5) for future in futures] == [0, 2, 4]
+
+    assert predict.batch_sizes == [3]
+    assert time.monotonic() - started >= 0.04
+
+
+def test_predict_exception_reaches_every_waiter():
+    def failing_predict(items):
+        raise RuntimeError("model rusak")
+
+    batcher = MicroBatcher(failing_predict, max_batch_size=3, max_wait_ms=500)
+    futures = [batcher.submit(i) for i in range(3)]
+
+    for future in futures:
+        with pytest.raises(RuntimeError, match="model rusak"):
+            future.result(timeout=5)
+    assert batcher.stats()['batches'] == 0
@@ -0,0 +1,97 @@
+import pandas as pd
+import pytest
+
+import ingest
+from build_dataset import OUTPUT_COLUMNS, content_hash
+from ingest import append_rows, compact, existing_hashes, hash_set_path, pending_logs
+from loaders import NAME_MAPPING, append_log_path
+from shared_store import SharedStore
+
+
+@pytest.fixture(scope='module')
+def rows(corpus_df):
+    """``corpus_df`` dalam format file dataset (``OUTPUT_COLUMNS``, tokoh nama singkat)."""
+    short_names = {full: short for short, full in NAME_MAPPING.items()}
+    df = corpus_df.assign(tokoh=corpus_df['tokoh'].map(short_names).astype(str),
+                          Sentimen=corpus_df['Sentimen'].astype(str),
+                          content_hash=corpus_df['full_text'].map(content_hash))
+    return df.drop_duplicates('content_hash')[OUTPUT_COLUMNS].reset_index(drop=True)
+
+
+@pytest.fixture
+def data_path(rows, tmp_path):
+    path = str(tmp_path / 'data.csv')
+    rows.iloc[:400].to_csv(path, index=False)
+    return path
+
+
+def make_store(data_path, tmp_path):
+    return SharedStore(data_path=data_path, stem_cache_path=None, ngram_index_dir=str(tmp_path / 'ngram'),
+                       prerender_dir=None)
+
+
+def test_refresh_during_compact_does_not_double_count(rows, data_path, tmp_path, monkeypatch):
+    append_rows(rows.iloc[400:450], append_log_path(data_path))
+    store = make_store(data_path, tmp_path)
+    assert len(store.df_sentimen) == 450
+
+    seen = []
+    write_columnar = ingest.write_columnar
+
+    def refresh_after_csv_swap(df, path):
+        # CSV sudah diganti, log lama belum dihapus: dashboard memuat ulang di sini,
+        # sementara ingest lain menambah baris
+        store.refresh()
+        seen.append(len(store.df_sentimen))
+        append_rows(rows.iloc[450:460], append_log_path(data_path))
+        write_columnar(df, path)
+
+    monkeypatch.setattr(ingest, 'write_columnar', refresh_after_csv_swap)
+    assert compact(data_path) == 50
+
+    assert seen == [450]
+    assert len(pd.read_csv(data_path)) == 450
+    assert pending_logs(data_path) == []
+    # Baris yang masuk selama penggabungan tetap ada di log baru
+    store.refresh()
+    assert len(store.df_sentimen) == 460
+
+
+def test_compact_skips_rows_already_merged(rows, data_path):
+    log_path = append_log_path(data_path)
+    append_rows(rows.iloc[400:450], log_path)
+    assert compact(data_path) == 50
+
+    # Penggabungan terhenti setelah CSV diganti: log yang sama tertinggal
+    append_rows(rows.iloc[400:460], f"{log_path}.1.compacting")
+    assert compact(data_path) == 10
+    merged = pd.read_csv(data_path)
+    assert len(merged) == 460 and merged['content_hash'].is_unique
+
+
+def test_existing_hashes_reads_csv_only_when_it_changes(rows, data_path, monkeypatch):
+    append_rows(rows.iloc[400:410], append_log_path(data_path))
+    expected = set(rows['content_hash'].iloc[:410])
+    assert existing_hashes(data_path) == expected
+
+    def fail(*args, **kwargs):
+        raise AssertionError("CSV dataset dibaca ulang")
+
+    # Himpunan hash tersimpan dipakai selama CSV tidak berubah
+    with monkeypatch.context() as patch:
+        patch.setattr(ingest.pd, 'read_csv', fail)
+        assert existing_hashes(data_path) == expected
+
+    # CSV ditulis ulang (mis. build_dataset.py): himpunan hash dibangun ulang
+    rows.iloc[:300].to_csv(data_path, index=False)
+    assert existing_hashes(data_path) == set(rows['content_hash'].iloc[:300]) | set(rows['content_hash'].iloc[400:410])
+
+
+def test_compact_writes_hash_set_for_new_csv(rows, data_path, monkeypatch):
+    append_rows(rows.iloc[400:420], append_log_path(data_path))
+    compact(data_path)
+    with open(hash_set_path(data_path), encoding='utf-8') as f:
+        assert len(f.readlines()) == 1 + 420
+
+    monkeypatch.setattr(ingest.pd, 'read_csv', lambda *args, **kwargs: pytest.fail("CSV dataset dibaca ulang"))
+    assert existing_hashes(data_path) == set(rows['content_hash'].iloc[:420])
@@ -0,0 +1,85 @@
+import pytest
+
+import instrumentation
+from instrumentation import Registry, to_prometheus
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Registry baru sebagai registry global (statistik tes tidak bercampur)."""
+    registry = Registry()
+    monkeypatch.setattr(instrumentation, '_registry', registry)
+    return registry
+
+
+def test_stage_disabled_returns_shared_null_context(monkeypatch):
+    monkeypatch.setattr(instrumentation, 'ENABLED', False)
+    assert instrumentation.stage('a') is instrumentation._NULL_STAGE
+    assert instrumentation.stage('b') is instrumentation._NULL_STAGE
+
+
+def test_instrumented_disabled_returns_function_unchanged(monkeypatch):
+    monkeypatch.setattr(instrumentation, 'ENABLED', False)
+
+    def func():
+        return 1
+
+    assert instrumentation.instrumented('func')(func) is func
+
+
+def test_stage_enabled_records_into_registry(monkeypatch, registry):
+    monkeypatch.setattr(instrumentation, 'ENABLED', True)
+    with instrumentation.stage('luar'):
+        with instrumentation.stage('dalam'):
+            pass
+    stages = {row['stage']: row for row in registry.snapshot()['stages']}
+    assert stages['luar']['calls'] == 1 and stages['dalam']['calls'] == 1
+    assert stages['luar']['total_ms'] >= stages['dalam']['total_ms']
+
+
+def test_record_and_snapshot_aggregate(registry):
+    registry.record('vectorize', 0.002)
+    registry.record('vectorize', 0.004, peak_bytes=2048)
+    registry.record('model', 0.010)
+    registry.register_cache('stem', lambda: {'hits': 3, 'misses': 1, 'size': 4})
+    registry.register_cache('kosong', lambda: {'hits': 0, 'misses': 0})
+
+    snap = registry.snapshot()
+    assert [row['stage'] for row in snap['stages']] == ['model', 'vectorize']
+    vectorize = snap['stages'][1]
+    assert vectorize['calls'] == 2
+    assert vectorize['total_ms'] == pytest.approx(6.0)
+    assert vectorize['mean_ms'] == pytest.approx(3.0)
+    assert vectorize['max_ms'] == pytest.approx(4.0)
+    assert vectorize['peak_kb'] == 2.0
+    assert snap['stages'][0]['peak_kb'] is None
+    assert snap['caches'] == [{'cache': 'stem', 'hits': 3, 'misses': 1, 'hit_ratio': 0.75, 'size': 4},
+                              {'cache': 'kosong', 'hits': 0, 'misses': 0, 'hit_ratio': 0.0, 'size': None}]
+
+    registry.reset()
+    assert registry.snapshot()['stages'] == []
+
+
+def test_to_prometheus_format(registry):
+    registry.record('predict.model', 0.5, peak_bytes=1024)
+    registry.record('predict.model', 1.5, peak_bytes=4096)
+    registry.record('load_kamus', 0.25)
+    registry.register_cache('stem', lambda: {'hits': 1, 'misses': 3})
+
+    lines = to_prometheus(registry.snapshot()).splitlines()
+    assert '# TYPE sentimen_stage_calls_total counter' in lines
+    assert 'sentimen_stage_calls_total{stage="predict.model"} 2' in lines
+    assert 'sentimen_stage_seconds_total{stage="predict.model"} 2' in lines
+    assert 'sentimen_stage_seconds_max{stage="predict.model"} 1.5' in lines
+    assert '# TYPE sentimen_stage_peak_bytes gauge' in lines
+    assert 'sentimen_stage_peak_bytes{stage="predict.model"} 4096' in lines
+    # Tahap tanpa puncak alokasi dan cache tanpa ukuran tidak ditulis
+    assert not any(line.startswith('sentimen_stage_peak_bytes{stage="load_kamus"}') for line in lines)
+    assert not any(line.startswith('sentimen_cache_size{') for line in lines)
+    assert 'sentimen_cache_hit_ratio{cache="stem"} 0.25' in lines
+    # Setiap baris sampel: nama{label="nilai"} angka
+    for line in lines:
+        if not line.startswith('#'):
+            name, value = line.rsplit(' ', 1)
+            assert name.startswith('sentimen_') and name.endswith('"}')
+            float(value)
@@ -0,0 +1,71 @@
+from collections import Counter
+
+import pytest
+
+from dashboard_charts import hitung_jumlah
+from live_aggregates import LiveAggregates
+from ngram_index import NGRAM_SIZES, SENTIMEN_LIST, NgramIndex
+
+
+def hashtag_counts(df, sentiment_filter, tokoh_filter):
+    # Jalur lama plot_hashtag_wordcloud_by_sentiment
+    if sentiment_filter != 'All':
+        df = df[df['Sentimen'] == sentiment_filter]
+    if tokoh_filter is not None:
+        df = df[df['tokoh'] == tokoh_filter]
+    return Counter(tag for tags in df['hashtag'] if isinstance(tags, str) for tag in tags.split())
+
+
+def split_batches(df):
+    # Bagian awal lalu batch 1 baris, 7 baris, dan sisanya (seperti ingest.py)
+    n_base = len(df) * 3 // 5
+    bounds = [0, n_base, n_base + 1, n_base + 8, len(df)]
+    return [df.iloc[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+@pytest.fixture(scope='module')
+def live(corpus_df):
+    base, *batches = split_batches(corpus_df)
+    aggregates = LiveAggregates(base)
+    for batch in batches:
+        aggregates.update(batch)
+    return aggregates
+
+
+def test_sentimen_counts_match_value_counts(corpus_df, live):
+    assert live.n_rows == len(corpus_df)
+    assert hitung_jumlah(corpus_df, sentimen_counts=live.sentimen_counts()) == hitung_jumlah(corpus_df)
+
+
+def test_distribution_matches_groupby(corpus_df, live):
+    expected = corpus_df.groupby(['tokoh', 'Sentimen'], observed=True).size().reset_index(name='count')
+    expected = expected.astype({'tokoh': str, 'Sentimen': str}).sort_values(['tokoh', 'Sentimen'])
+    assert expected.reset_index(drop=True).equals(live.distribution())
+
+
+@pytest.mark.parametrize('sentimen', ['All'] + SENTIMEN_LIST)
+def test_hashtag_counts_match_recount_in_order(corpus_df, live, sentimen):
+    for tokoh in [None] + corpus_df['tokoh'].dropna().unique().tolist():
+        # Urutan item ikut dibandingkan (menentukan urutan hashtag berfrekuensi sama)
+        expected = list(hashtag_counts(corpus_df, sentimen, tokoh).items())
+        assert list(live.hashtag_counts(sentimen, tokoh).items()) == expected, tokoh
+
+
+def test_ngram_update_matches_rebuild(corpus_df, tmp_path):
+    base, *batches = split_batches(corpus_df)
+    index = NgramIndex.build(base, index_dir=str(tmp_path / 'base'))
+    index.follow(base)
+    for batch in batches:
+        index.update(batch)
+
+    rebuilt = NgramIndex.build(corpus_df, index_dir=str(tmp_path / 'full'))
+    for tokoh in corpus_df['tokoh'].dropna().unique():
+        for sentimen in ['All'] + SENTIMEN_LIST:
+            for n in NGRAM_SIZES.values():
+                assert index.table(tokoh, sentimen, n).equals(rebuilt.table(tokoh, sentimen, n)), (tokoh, sentimen, n)
+
+
+def test_ngram_update_requires_follow(corpus_df, tmp_path):
+    index = NgramIndex.build(corpus_df.head(20), index_dir=str(tmp_path / 'index'))
+    with pytest.raises(RuntimeError):
+        index.update(corpus_df.iloc[20:30])
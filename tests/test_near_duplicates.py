@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from near_duplicates import add_cluster_columns, cluster_near_duplicates, deduplicate
+
+TWEET = ("survey sebulan jelang coblosan elektabilitas khofifah emil masih unggul jauh tinggalkan "
+         "lawannya di seluruh daerah jawa timur menurut lembaga survei terbaru")
+
+
+def shingles(text):
+    words = text.split()
+    return set(zip(words, words[1:])) if len(words) > 1 else set(words)
+
+
+def jaccard(a, b):
+    a, b = shingles(a), shingles(b)
+    return len(a & b) / len(a | b)
+
+
+@pytest.fixture(scope='module')
+def retweets():
+    # Retweet/kutipan hampir identik: salinan persis, satu kata tambahan di akhir, satu kata diganti di akhir
+    return [TWEET, TWEET, TWEET + " mantap", TWEET.replace("terbaru", "terkini")]
+
+
+def test_near_identical_retweets_grouped(retweets, corpus_df):
+    distinct = corpus_df['clean_text'].iloc[:50].tolist()
+    cluster_id, cluster_size = cluster_near_duplicates(retweets + distinct)
+
+    assert cluster_id[:4].tolist() == [0, 0, 0, 0]
+    assert cluster_size[:4].tolist() == [4, 4, 4, 4]
+    assert not np.isin(cluster_id[4:], 0).any()
+
+
+def test_distinct_texts_not_grouped():
+    texts = ["khofifah emil unggul di survei terbaru jawa timur",
+             "risma gus hans kampanye di surabaya hari ini",
+             "luluk lukman debat pertama pilgub jatim malam ini",
+             ""]
+    cluster_id, cluster_size = cluster_near_duplicates(texts)
+    assert cluster_id.tolist() == [0, 1, 2, 3]
+    assert cluster_size.tolist() == [1, 1, 1, 1]
+
+
+def test_corpus_clusters_are_similar(corpus_df):
+    texts = corpus_df['clean_text'].tolist()
+    cluster_id, _ = cluster_near_duplicates(texts)
+    # Setiap anggota klaster mirip dengan wakilnya (baris pertama klaster)
+    members = np.flatnonzero(cluster_id != np.arange(len(texts)))
+    assert len(members)
+    for row in members:
+        assert jaccard(texts[row], texts[cluster_id[row]]) >= 0.5, texts[row]
+
+
+def test_deduplicate_keeps_first_row_per_tokoh(retweets):
+    df = pd.DataFrame({'clean_text': retweets + ["teks lain sama sekali berbeda"],
+                       'tokoh': ['A', 'B', 'A', 'A', 'A']})
+    result = deduplicate(add_cluster_columns(df))
+    assert result['clean_text'].tolist() == [TWEET, TWEET, "teks lain sama sekali berbeda"]
+    assert result['tokoh'].tolist() == ['A', 'B', 'A']
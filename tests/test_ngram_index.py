@@ -0,0 +1,44 @@
+import pandas as pd
+import pytest
+
+from ngram_index import NGRAM_SIZES, SENTIMEN_LIST, NgramIndex, count_ngrams
+
+
+def top_ngrams_recount(df, tokoh, sentimen, ngram, top_n):
+    # Jalur lama visualize_ngram_frequency: tokenisasi ulang seluruh korpus tokoh
+    n = NGRAM_SIZES[ngram]
+    filtered_df = df[df['tokoh'] == tokoh]
+    sentimen_list = SENTIMEN_LIST if sentimen == 'All' else [sentimen]
+    all_data = []
+    for label in sentimen_list:
+        counts = count_ngrams(filtered_df[filtered_df['Sentimen'] == label]['joined_swremove'], n)
+        all_data += [{'n-gram': ng, 'Frekuensi': freq, 'Sentimen': label} for ng, freq in counts.items()]
+    ngram_df = pd.DataFrame(all_data)
+    top = ngram_df.groupby('n-gram')['Frekuensi'].sum().nlargest(top_n).index
+    return ngram_df[ngram_df['n-gram'].isin(top)]
+
+
+def canonical(ngram_df):
+    return ngram_df.sort_values(['Sentimen', 'n-gram']).reset_index(drop=True)
+
+
+@pytest.fixture(scope='module')
+def index(corpus_df, tmp_path_factory):
+    return NgramIndex.build(corpus_df, index_dir=str(tmp_path_factory.mktemp('ngram') / 'index'), fingerprint='uji')
+
+
+@pytest.mark.parametrize('ngram', list(NGRAM_SIZES))
+@pytest.mark.parametrize('sentimen', ['All'] + SENTIMEN_LIST)
+def test_top_ngrams_match_recount(corpus_df, index, sentimen, ngram):
+    for tokoh in corpus_df['tokoh'].dropna().unique():
+        for top_n in (5, 20, 50):
+            expected = canonical(top_ngrams_recount(corpus_df, tokoh, sentimen, ngram, top_n))
+            assert canonical(index.top_ngrams(tokoh, sentimen, ngram, top_n)).equals(expected), (tokoh, top_n)
+
+
+def test_load_returns_same_tables(index):
+    loaded = NgramIndex.load(index.index_dir)
+    assert loaded.fingerprint == 'uji'
+    for key in index.manifest['files']:
+        tokoh, sentimen, n = key.split('|')
+        assert loaded.table(tokoh, sentimen, int(n)).equals(index.table(tokoh, sentimen, int(n)))
@@ -0,0 +1,75 @@
+import pytest
+
+from prediction_cache import PredictionCache
+
+
+class CountingPredictor:
+    # Predictor murah: preprocessing = lowercase + strip (kosong -> None), label dari panjang teks
+    def __init__(self):
+        self.calls = []
+
+    def preprocess(self, text):
+        return text.strip().lower() or None
+
+    def predict_clean(self, clean_texts):
+        self.calls.extend(clean_texts)
+        return [{'label': None, 'confidence': {}, 'clean_text': None} if text is None else
+                {'label': 'Positif' if len(text) % 2 else 'Negatif',
+                 'confidence': {'Positif': 60.0, 'Negatif': 40.0}, 'clean_text': text}
+                for text in clean_texts]
+
+
+@pytest.fixture
+def predictor():
+    return CountingPredictor()
+
+
+def test_same_clean_text_predicted_once(predictor):
+    cache = PredictionCache()
+    first = cache.predict(predictor, "Halo Jatim", 'v1')
+    assert cache.predict(predictor, "  halo jatim ", 'v1') == first
+    assert predictor.calls == ['halo jatim']
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+
+
+def test_hit_returns_copy(predictor):
+    cache = PredictionCache()
+    cache.predict(predictor, "halo", 'v1')
+    hit = cache.predict(predictor, "halo", 'v1')
+    hit['label'] = 'diubah'
+    hit['confidence']['Positif'] = 0.0
+
+    again = cache.predict(predictor, "halo", 'v1')
+    assert again['label'] != 'diubah'
+    assert again['confidence'] == {'Positif': 60.0, 'Negatif': 40.0}
+
+
+def test_new_version_misses(predictor):
+    cache = PredictionCache()
+    cache.predict(predictor, "halo", 'v1')
+    cache.predict(predictor, "halo", 'v2')
+    assert predictor.calls == ['halo', 'halo']
+    assert cache.stats()['misses'] == 2
+
+
+def test_lru_eviction_at_maxsize(predictor):
+    cache = PredictionCache(maxsize=2)
+    cache.predict(predictor, "satu", 'v1')
+    cache.predict(predictor, "dua", 'v1')
+    cache.predict(predictor, "satu", 'v1')  # 'satu' jadi yang terbaru dipakai
+    cache.predict(predictor, "tiga", 'v1')  # 'dua' dibuang
+    assert len(cache) == 2
+
+    predictor.calls.clear()
+    cache.predict(predictor, "satu", 'v1')
+    cache.predict(predictor, "tiga", 'v1')
+    cache.predict(predictor, "dua", 'v1')
+    assert predictor.calls == ['dua']
+
+
+def test_empty_clean_text_skips_cache(predictor):
+    cache = PredictionCache()
+    result = cache.predict(predictor, "   ", 'v1')
+    assert result['label'] is None
+    assert len(cache) == 0
+    assert cache.stats()['hits'] == 0 and cache.stats()['misses'] == 0
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from predictor import SentimentPredictor
+
+
+@pytest.fixture(scope='module')
+def predictor(tfidf_pipeline, label_forest, preprocessing):
+    normalizer, stop_words_remover, stemmer = preprocessing
+    return SentimentPredictor(*tfidf_pipeline, label_forest, normalizer=normalizer,
+                              stop_words_remover=stop_words_remover, stemmer=stemmer)
+
+
+def test_argmax_labels_match_model_predict(predictor, tfidf_pipeline, label_forest, corpus_df):
+    vectorizer, fselector = tfidf_pipeline
+    texts = corpus_df['joined_swremove'].tolist()
+
+    expected = [predictor.labels[list(label_forest.classes_).index(code)]
+                for code in label_forest.predict(fselector.transform(vectorizer.transform(texts)))]
+    assert [result['label'] for result in predictor.predict_clean(texts)] == expected
+
+
+def test_confidence_in_percent_sorted_descending(predictor, corpus_df):
+    result = predictor.predict_clean([corpus_df['joined_swremove'].iloc[0]])[0]
+    scores = list(result['confidence'].values())
+    assert scores == sorted(scores, reverse=True)
+    assert sum(scores) == pytest.approx(100, abs=0.05)
+    assert result['label'] == next(iter(result['confidence']))
+
+
+@pytest.mark.parametrize('text', [None, '', '   ', 'https://t.co/abc @user'])
+def test_empty_input_gives_none_label(predictor, text):
+    # Halaman prediksi menghentikan render (st.stop) jika label None
+    result = predictor.predict(text) if isinstance(text, str) else predictor.predict([text])[0]
+    assert result == {'label': None, 'confidence': {}, 'clean_text': None}
+
+
+def test_list_input_keeps_positions(predictor, corpus_df):
+    text = corpus_df['full_text'].iloc[0]
+    results = predictor.predict([None, text, ''])
+    assert results[0]['label'] is None and results[2]['label'] is None
+    assert results[1] == predictor.predict(text)
+    assert results[1]['label'] in predictor.labels
+    assert np.isfinite(list(results[1]['confidence'].values())).all()
@@ -0,0 +1,52 @@
+import os
+
+import pandas as pd
+import plotly.graph_objects as go
+
+from prerender import MANIFEST_NAME, PrerenderedPanels, remove_stale
+
+
+def test_save_get_roundtrip_decodes_figure(tmp_path):
+    panels = PrerenderedPanels('fp', root=str(tmp_path))
+    df = pd.DataFrame({'Hashtag': ['jatim', 'pilkada'], 'Frekuensi': [3, 1]})
+    fig = go.Figure(go.Bar(x=['Positif', 'Negatif'], y=[10, 4]))
+
+    key = ('ngram', 'Tri Rismaharini', 'All', 'unigram', 20)
+    assert panels.save(key, (df, fig)) > 0
+    loaded_df, loaded_fig = panels.get(key)
+
+    assert loaded_df.equals(df)
+    assert isinstance(loaded_fig, go.Figure)
+    assert loaded_fig.to_dict() == fig.to_dict()
+    # Panel lain (bytes, DataFrame) disimpan apa adanya
+    panels.save(('wordcloud', 'Tri Rismaharini', 'Positif'), b'\x89PNG')
+    assert panels.get(('wordcloud', 'Tri Rismaharini', 'Positif')) == b'\x89PNG'
+
+
+def test_get_missing_key_returns_none(tmp_path):
+    panels = PrerenderedPanels('fp', root=str(tmp_path))
+    assert panels.get(('distribusi',)) is None
+    panels.save(('distribusi',), pd.DataFrame())
+    assert panels.get(('hashtag', 'Tri Rismaharini', 'All')) is None
+    # Versi data lain tidak memakai artefak versi ini
+    assert PrerenderedPanels('fp2', root=str(tmp_path)).get(('distribusi',)) is None
+
+
+def test_manifest_roundtrip(tmp_path):
+    panels = PrerenderedPanels('fp', root=str(tmp_path))
+    assert panels.manifest() is None
+    panels.save(('distribusi',), pd.DataFrame())
+    panels.write_manifest({'fingerprint': 'fp', 'panels': 1})
+    assert os.path.exists(os.path.join(panels.directory, MANIFEST_NAME))
+    assert panels.manifest() == {'fingerprint': 'fp', 'panels': 1}
+
+
+def test_remove_stale_keeps_current_and_derived_views(tmp_path):
+    for name in ['12-34+0', '12-34+0+minhash-64x16-0.8', '12-34+120', '99-1+0', '12-34+0x']:
+        (tmp_path / name).mkdir()
+    remove_stale('12-34+0', root=str(tmp_path))
+    assert sorted(os.listdir(tmp_path)) == ['12-34+0', '12-34+0+minhash-64x16-0.8']
+
+
+def test_remove_stale_missing_root(tmp_path):
+    remove_stale('fp', root=str(tmp_path / 'tidak-ada'))
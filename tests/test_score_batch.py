@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from score_batch import BatchScorer
+
+
+@pytest.fixture(scope='module')
+def scorer(tfidf_pipeline, label_forest):
+    with BatchScorer(*tfidf_pipeline, label_forest, workers=1, stem_cache_path=None) as scorer:
+        yield scorer
+
+
+@pytest.fixture(scope='module')
+def clean_texts(corpus_df):
+    texts = corpus_df['joined_swremove'].iloc[::10].tolist()
+    return texts[:5] + [None] + texts[5:]
+
+
+def test_batch_matches_per_row_predict(scorer, clean_texts):
+    result = scorer.predict(clean_texts)
+    for row, text in zip(result.itertuples(index=False), clean_texts):
+        expected = scorer.predictor.predict_clean([text])[0]
+        if text is None:
+            # Kolom string pandas menyimpan label None sebagai nilai kosong
+            assert expected['label'] is None
+            assert pd.isna(row.Prediksi) and np.isnan(row.Confidence)
+        else:
+            assert row.Prediksi == expected['label']
+            assert row.Confidence == max(expected['confidence'].values())
+
+
+def test_batch_scores_match_per_row_predict_proba(scorer, tfidf_pipeline, label_forest, clean_texts):
+    vectorizer, fselector = tfidf_pipeline
+    result = scorer.predict(clean_texts)
+    score_columns = [f'Skor_{label}' for label in scorer.labels]
+
+    for i, text in enumerate(clean_texts):
+        scores = result.loc[i, score_columns].to_numpy(dtype=float)
+        if text is None:
+            assert np.isnan(scores).all()
+            continue
+        proba = label_forest.predict_proba(fselector.transform(vectorizer.transform([text])))[0]
+        np.testing.assert_array_equal(scores, (proba * 100).round(2))
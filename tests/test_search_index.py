@@ -0,0 +1,38 @@
+import re
+
+import numpy as np
+import pytest
+
+from search_index import SearchIndex
+
+QUERIES = ['khofifah', 'Risma', 'luluk', 'pilkada', 'gubernur jatim', 'emil', 'pks', 'ri', 'a',
+           'https', 'surabaya', 'tidak ada yang cocok', '@', 'DPP_PKB', 'wkwk', '',
+           'risma|khofifah', 'pilkada.*jatim', 'jatim.go.id', '^rt', 'https?://', '#\\w+', '(emil', 'a[']
+
+
+def search_contains(df, query):
+    # Jalur lama panel "Pencarian Data": str.contains (regex, tidak peka huruf besar/kecil) di dua kolom
+    try:
+        re.compile(query)
+        regex = True
+    except re.error:
+        regex = False
+    mask = (df['full_text'].str.contains(query, case=False, na=False, regex=regex) |
+            df['username'].str.contains(query, case=False, na=False, regex=regex))
+    return np.flatnonzero(mask.to_numpy())
+
+
+@pytest.fixture(scope='module')
+def index(corpus_df):
+    return SearchIndex(corpus_df)
+
+
+@pytest.mark.parametrize('query', QUERIES)
+def test_search_matches_str_contains(corpus_df, index, query):
+    assert np.array_equal(index.search(query), search_contains(corpus_df, query))
+
+
+def test_search_handles_missing_values(corpus_df):
+    df = corpus_df.head(50).copy()
+    df.loc[df.index[:5], 'username'] = None
+    assert np.array_equal(SearchIndex(df).search('none|nan'), search_contains(df, 'none|nan'))
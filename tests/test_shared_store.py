@@ -0,0 +1,58 @@
+import pytest
+
+import loaders
+import ngram_index
+import shared_store
+from shared_store import SharedStore
+
+
+@pytest.fixture
+def read_counter(monkeypatch):
+    """Menghitung pembacaan file dataset lewat ``read_data`` (di modul mana pun ia dipanggil)."""
+    calls = []
+
+    def counting_read_data(path=loaders.DATA_PATH):
+        calls.append(path)
+        return loaders.read_data(path)
+
+    monkeypatch.setattr(shared_store, 'read_data', counting_read_data)
+    monkeypatch.setattr(ngram_index, 'read_data', counting_read_data)
+    return calls
+
+
+def make_store(data_csv, tmp_path):
+    return SharedStore(data_path=data_csv, stem_cache_path=None, ngram_index_dir=str(tmp_path / 'ngram'),
+                       prerender_dir=None)
+
+
+def test_refresh_reads_data_once_when_building_ngram_index(data_csv, tmp_path, read_counter):
+    store = make_store(data_csv, tmp_path)
+    assert read_counter == [data_csv]
+    assert store.ngram_index.fingerprint == loaders.file_fingerprint(data_csv)
+
+
+def test_ngram_index_built_from_loaded_frame_matches_rebuild(data_csv, tmp_path, corpus_df):
+    store = make_store(data_csv, tmp_path)
+    rebuilt = ngram_index.NgramIndex.build(loaders.read_data(data_csv), index_dir=str(tmp_path / 'rebuilt'))
+    for tokoh in corpus_df['tokoh'].dropna().unique():
+        for n in ngram_index.NGRAM_SIZES.values():
+            assert store.ngram_index.table(tokoh, 'All', n).equals(rebuilt.table(tokoh, 'All', n))
+
+
+def test_session_footprints_recorded_per_session_and_expire(data_csv, tmp_path, monkeypatch):
+    store = make_store(data_csv, tmp_path)
+    now = [1000.0]
+    monkeypatch.setattr(shared_store.time, 'monotonic', lambda: now[0])
+
+    store.record_session_footprint('a', 300)
+    store.record_session_footprint('b', 500)
+    store.record_session_footprint('a', 400)
+    assert store.session_footprints() == {'a': 400, 'b': 500}
+
+    # Sesi yang tidak mencatat lagi dalam TTL dianggap sudah ditutup
+    now[0] += shared_store.SESSION_FOOTPRINT_TTL / 2
+    store.record_session_footprint('b', 200)
+    now[0] += shared_store.SESSION_FOOTPRINT_TTL / 2 + 1
+    assert store.session_footprints() == {'b': 200}
+    store.record_session_footprint('c', 100)
+    assert set(store._session_footprints) == {'b', 'c'}
@@ -0,0 +1,74 @@
+import json
+
+import pytest
+
+from stem_cache import StemCache
+
+
+class CountingStemmer:
+    # Stemmer palsu yang mencatat kata apa saja yang benar-benar di-stem
+    def __init__(self):
+        self.calls = []
+
+    def stem(self, word):
+        self.calls.append(word)
+        return word.removeprefix('me')
+
+
+@pytest.fixture
+def stemmer():
+    return CountingStemmer()
+
+
+def test_stem_memoizes_and_counts(stemmer):
+    cache = StemCache(stemmer)
+    assert [cache.stem(word) for word in ['memilih', 'memilih', 'milih']] == ['milih', 'milih', 'milih']
+    assert stemmer.calls == ['memilih', 'milih']
+    assert cache.stats() == {'hits': 1, 'misses': 2, 'hit_ratio': 1 / 3, 'size': 2, 'maxsize': 200_000}
+
+
+def test_lru_evicts_least_recently_used(stemmer):
+    cache = StemCache(stemmer, maxsize=2)
+    cache.stem('a1')
+    cache.stem('b2')
+    cache.stem('a1')  # a1 menjadi yang terbaru
+    cache.stem('c3')  # b2 dikeluarkan
+    assert len(cache) == 2
+    stemmer.calls.clear()
+    cache.stem('a1')
+    cache.stem('b2')
+    assert stemmer.calls == ['b2']
+
+
+def test_save_and_load_round_trip(stemmer, tmp_path):
+    path = str(tmp_path / 'cache' / 'stem.json')
+    cache = StemCache(stemmer)
+    for word in ['memilih', 'menang', 'jatim']:
+        cache.stem(word)
+    cache.save(path)
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f) == {'memilih': 'milih', 'menang': 'nang', 'jatim': 'jatim'}
+
+    loaded = StemCache(CountingStemmer())
+    loaded.load(path)
+    assert [loaded.stem(word) for word in ['memilih', 'menang', 'jatim']] == ['milih', 'nang', 'jatim']
+    assert loaded.stemmer.calls == []
+
+
+def test_autosave_after_new_misses(stemmer, tmp_path):
+    path = tmp_path / 'stem.json'
+    cache = StemCache(stemmer, path=str(path), autosave_every=2)
+    cache.stem('memilih')
+    assert not path.exists()
+    cache.stem('menang')
+    assert json.loads(path.read_text(encoding='utf-8')) == {'memilih': 'milih', 'menang': 'nang'}
+
+
+def test_seed_skips_known_and_empty_words(stemmer):
+    cache = StemCache(stemmer)
+    cache.stem('memilih')
+    stemmer.calls.clear()
+    assert cache.seed(['memilih', '', 'menang', 'menang', 'jatim']) == 2
+    assert stemmer.calls == ['menang', 'jatim']
+    assert cache.stats()['misses'] == 1
+    assert cache.stem('menang') == 'nang'
@@ -0,0 +1,107 @@
+import os
+import re
+
+import pandas as pd
+import pytest
+
+from text_preprocessing import (EDGE_CASES, KamusNormalizer, clean_text, clean_text_series, preprocess_series,
+                                preprocess_tweet)
+
+# Jumlah tweet sampel yang distem Sastrawi sungguhan (stemming dingin ±25 ms per kata unik)
+SASTRAWI_SAMPLE = 40
+
+
+class SuffixStemmer:
+    # Stemmer murah dan deterministik: memotong huruf terakhir, sehingga kata dua huruf
+    # menjadi satu huruf dan ikut diuji pembuangannya
+    def stem(self, word):
+        return word[:-1]
+
+
+@pytest.fixture(scope='module')
+def regex_normalize(kamus):
+    # Jalur lama preprocess_tweet: substitusi regex \b(k1|k2|...)\b atas seluruh kunci kamus
+    pattern = re.compile(r'\b(' + '|'.join(re.escape(k) for k in kamus.keys()) + r')\b')
+    return lambda text: pattern.sub(lambda m: kamus[m.group(0)], text)
+
+
+@pytest.fixture(scope='module')
+def normalizer(kamus):
+    return KamusNormalizer(kamus)
+
+
+# ---- KamusNormalizer ---------------------------------------------------------
+
+@pytest.mark.parametrize('text', [
+    '', 'p', 'p p', 'pp', 'ibuibu anake', 'p kopipah nu', 'kopipa kopipah khopipah hopipah',
+    'tgg jwb', 'tgg jwb tgg', 'tgg', 'jwb tgg jwb', 'iniiii bauuuuu lagiiiii', 'dahal pragib',
+    'kata yang tidak ada di kamus', 'nu nu nu',
+])
+def test_normalize_edge_cases_match_regex(normalizer, regex_normalize, text):
+    assert normalizer.normalize(text) == regex_normalize(text)
+
+
+def test_normalize_every_kamus_key_matches_regex(kamus, normalizer, regex_normalize):
+    # Setiap kunci sendirian, diapit kata lain, dan berdampingan dengan kunci berikutnya
+    keys = [key for key in kamus if isinstance(key, str) and clean_text(key) == key]
+    texts = list(keys)
+    texts += [f"awal {key} akhir" for key in keys[::7]]
+    texts += [' '.join(keys[i:i + 5]) for i in range(0, len(keys), 5)]
+    mismatches = [text for text in texts if normalizer.normalize(text) != regex_normalize(text)]
+    assert not mismatches
+
+
+def test_normalize_corpus_sample_matches_regex(relabeling_sample, normalizer, regex_normalize):
+    texts = [clean_text(text) for text in relabeling_sample['full_text'].dropna().astype(str)]
+    mismatches = [text for text in texts if normalizer.normalize(text) != regex_normalize(text)]
+    assert not mismatches
+
+
+# ---- Preprocessing batch ------------------------------------------------------
+
+@pytest.fixture(scope='module')
+def batch_texts(relabeling_sample):
+    return pd.concat([relabeling_sample['full_text'], pd.Series(EDGE_CASES)], ignore_index=True)
+
+
+def test_clean_text_series_matches_clean_text(batch_texts):
+    cleaned = clean_text_series(batch_texts)
+    assert cleaned.index.equals(batch_texts.index)
+    mismatches = [text for text, actual in zip(batch_texts, cleaned) if actual != clean_text(text)]
+    assert not mismatches
+
+
+def assert_preprocess_parity(texts, normalizer, stop_words_remover, stemmer):
+    final = preprocess_series(texts, normalizer, stop_words_remover, stemmer)
+    assert final.index.equals(texts.index)
+    mismatches = [text for text, actual in zip(texts, final)
+                  if actual != preprocess_tweet(text, normalizer, stop_words_remover, stemmer)]
+    assert not mismatches
+
+
+def test_preprocess_series_matches_preprocess_tweet(batch_texts, preprocessing):
+    normalizer, stop_words_remover, _ = preprocessing
+    assert_preprocess_parity(batch_texts, normalizer, stop_words_remover, SuffixStemmer())
+
+
+def test_preprocess_series_matches_preprocess_tweet_sastrawi(relabeling_sample, preprocessing):
+    texts = pd.concat([relabeling_sample['full_text'].head(SASTRAWI_SAMPLE), pd.Series(EDGE_CASES)],
+                      ignore_index=True)
+    assert_preprocess_parity(texts, *preprocessing)
+
+
+@pytest.mark.slow
+def test_preprocess_series_matches_preprocess_tweet_full_corpus(preprocessing):
+    # Seluruh korpus Gabungan dengan Sastrawi; cache stemming di-pre-seed bila ada (seperti benchmark)
+    from build_dataset import RELABELING_PATHS, read_relabeling
+    from stem_cache import STEM_CACHE_PATH, create_stem_cache
+
+    normalizer, stop_words_remover, _ = preprocessing
+    stemmer = create_stem_cache(path=None)
+    if os.path.exists(STEM_CACHE_PATH):
+        stemmer.load(STEM_CACHE_PATH)
+    texts = pd.concat([read_relabeling(RELABELING_PATHS)['full_text'], pd.Series(EDGE_CASES)], ignore_index=True)
+
+    cleaned = clean_text_series(texts)
+    assert not [text for text, actual in zip(texts, cleaned) if actual != clean_text(text)]
+    assert_preprocess_parity(texts, normalizer, stop_words_remover, stemmer)